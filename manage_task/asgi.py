@@ -2,6 +2,10 @@
 ASGI config for manage_task project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+By default it loads manage_task.settings_asgi, which routes the list and
+detail pages to the async views, e.g.::
+
+    uvicorn manage_task.asgi:application --workers 4
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
@@ -11,6 +15,6 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'manage_task.settings')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'manage_task.settings_asgi')
 
 application = get_asgi_application()
@@ -43,11 +43,13 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'task_system.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'task_system.auth.CachedAuthenticationMiddleware',
+    'task_system.profiling.ProfilingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -85,6 +87,40 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Cached template fragments are keyed by per-model version counters
+# (task_system.fragment_cache), so stale entries are simply never read
+# again and are culled once MAX_ENTRIES is reached. LocMemCache is per
+# process, so it only fits a single process such as runserver; with more
+# workers use a shared backend (manage.py check --deploy reports it, see
+# settings_production).
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'default',
+    },
+    'template_fragments': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'template-fragments',
+        'OPTIONS': {
+            'MAX_ENTRIES': 20000,
+            'CULL_FREQUENCY': 4,
+        },
+    },
+}
+
+
+# Sessions are read from the cache and written through to the database,
+# and task_system.auth caches the logged-in Worker, so an ordinary page
+# view makes no session or user queries. Both live in the default cache;
+# point it at a shared backend when running several processes, or use
+# 'db' sessions and AUTH_USER_SNAPSHOTS = False (see settings_production).
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+AUTH_USER_SNAPSHOTS = True
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -138,3 +174,52 @@ LOGOUT_REDIRECT_URL = '/accounts/login/'
 CRISPY_ALLOWED_TEMPLATE_PACKS = "bootstrap5"
 
 CRISPY_TEMPLATE_PACK = "bootstrap5"
+
+# "offset" (page numbers) or "cursor" (keyset next/previous links)
+LIST_PAGINATION_MODE = "offset"
+
+# Offset-paginated lists (task_system.pagination.ApproximateCountPaginator)
+# show "about N results" from the table size estimate once an unfiltered
+# table has this many rows. Other counts are cached until the next write.
+APPROXIMATE_COUNT_THRESHOLD = 10000
+LIST_COUNT_CACHE_TIMEOUT = 300
+
+# Request instrumentation (task_system.middleware.RequestMetricsMiddleware).
+# Requests slower than this, or running more queries, log their SQL.
+METRICS_SLOW_REQUEST_MS = 500
+METRICS_SLOW_QUERY_COUNT = 50
+# Clients allowed to scrape /metrics without logging in as staff, matched
+# against REMOTE_ADDR. Behind a reverse proxy on the same host every
+# request comes from the proxy's address, so only list an address here
+# that the proxy itself never connects from (e.g. a scraper on another
+# interface) or the endpoint becomes public.
+METRICS_ALLOWED_IPS = []
+
+# Per-request cProfile runs (task_system.profiling), listed for staff at
+# /task_system/profiles/. Staff can add ?profile to any URL; the sample
+# rate profiles that fraction of all requests.
+PROFILING_ENABLED = False
+PROFILING_SAMPLE_RATE = 0.0
+PROFILING_DIR = BASE_DIR / "profiles"
+PROFILING_KEEP = 200
+
+# Responsive image variants, built by `manage.py build_image_variants`
+# (task_system.images) and used by the {% image_set %} tag.
+IMAGE_VARIANT_DIRS = [
+    (BASE_DIR / "static/assets/img", BASE_DIR / "static/assets/img/variants"),
+    (BASE_DIR / "images", BASE_DIR / "images/variants"),
+]
+IMAGE_VARIANT_WIDTHS = [320, 640, 1024, 1600]
+
+# Deadline scheduler (`manage.py run_deadline_scheduler`, task_system.deadlines).
+# Overdue tasks are always flagged; "escalate" and "notify" add to that.
+DEADLINE_ACTIONS = []
+DEADLINE_HORIZON_SECONDS = 6 * 60 * 60
+DEADLINE_REFRESH_SECONDS = 60
+
+# Seconds the per-team task statistics (task_system.team_stats) may be
+# cached; they are also dropped as soon as a task or team changes.
+TEAM_STATS_TIMEOUT = 300
+
+# Admin bulk actions update the selected rows this many ids at a time.
+ADMIN_ACTION_CHUNK_SIZE = 1000
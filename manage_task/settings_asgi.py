@@ -0,0 +1,9 @@
+"""
+Settings for serving the project under ASGI (uvicorn/daphne).
+
+Identical to settings.py except that the read-heavy task_system views
+are routed to their async versions in task_system.async_views.
+"""
+from .settings import *  # noqa: F401,F403
+
+ROOT_URLCONF = "manage_task.urls_async"
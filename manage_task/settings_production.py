@@ -0,0 +1,117 @@
+"""
+Production profile: DEBUG off, tuned SQLite and a static file pipeline.
+
+- WAL journaling, so readers no longer block the writer (and vice versa).
+- Pragmas applied on every new connection by task_system.db.
+- Persistent connections with health checks instead of one connection
+  per request.
+- A "replica" alias that list and detail views read from; writes and
+  every other read stay on the primary. Keep the replica fresh with
+  ``manage.py sync_replica`` (e.g. from cron) or point it at a real
+  replicated copy such as one maintained by Litestream.
+- Static files hashed, minified and pre-compressed by collectstatic and
+  served by task_system.staticfiles with far-future cache headers.
+- Caches in Redis (DJANGO_REDIS_URL, needs the redis package) so every
+  worker process sees the same sessions, user snapshots and fragment
+  versions. Without it sessions and the logged-in user are read from
+  the database on every request, and fragments, counts and their
+  versions live in a file cache shared by the processes on this host.
+"""
+import os
+
+from .settings import *  # noqa: F401,F403
+
+# hashed static names are only used with DEBUG off
+DEBUG = os.environ.get('DJANGO_DEBUG') == '1'
+ALLOWED_HOSTS = os.environ.get('DJANGO_ALLOWED_HOSTS', 'localhost,127.0.0.1').split(',')
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            # seconds to wait for the write lock instead of failing
+            'timeout': 20,
+        },
+    },
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db.replica.sqlite3',
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'TEST': {'MIRROR': 'default'},
+    },
+}
+
+DATABASE_ROUTERS = ['task_system.db.ReplicaRouter']
+
+REDIS_URL = os.environ.get('DJANGO_REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'default',
+        },
+        'template_fragments': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'fragments',
+        },
+    }
+else:
+    # a logout or password change would only reach the cache of the
+    # process that handled it; nothing deciding who is logged in may
+    # live in a process-local cache
+    SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+    AUTH_USER_SNAPSHOTS = False
+    # fragment versions must be shared too, or a write only expires the
+    # rows cached by its own process (checked by manage.py check --deploy)
+    CACHES = {
+        **CACHES,
+        'template_fragments': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': BASE_DIR / 'fragment_cache',
+            'OPTIONS': {
+                'MAX_ENTRIES': 20000,
+                'CULL_FREQUENCY': 4,
+            },
+        },
+    }
+
+MIDDLEWARE = [*MIDDLEWARE, 'task_system.db.ReplicaMiddleware']
+# after a write, the client reads from the primary for this long; keep it
+# above the replica's sync interval
+REPLICA_PIN_SECONDS = 60
+
+SQLITE_PRAGMAS = {
+    'journal_mode': 'wal',
+    # with WAL, NORMAL only risks the last commits on power loss, not corruption
+    'synchronous': 'normal',
+    'mmap_size': 256 * 1024 * 1024,
+    # negative means KiB: 64 MB of page cache per connection
+    'cache_size': -64000,
+    'temp_store': 'memory',
+}
+
+# Static files: hashed, minified and pre-compressed by collectstatic and
+# served from STATIC_ROOT with far-future cache headers
+# (task_system.staticfiles).
+INSTALLED_APPS = [
+    'task_system.staticfiles.StaticFilesConfig'
+    if app == 'django.contrib.staticfiles' else app
+    for app in INSTALLED_APPS
+]
+
+MIDDLEWARE = ['task_system.staticfiles.StaticFilesMiddleware', *MIDDLEWARE]
+
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'task_system.staticfiles.CompressedManifestStaticFilesStorage',
+    },
+}
@@ -17,8 +17,11 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 
+from task_system.metrics import metrics_view
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('task_system/', include('task_system.urls')),
     path("accounts/", include("django.contrib.auth.urls")),
+    path("metrics", metrics_view, name="metrics"),
 ]
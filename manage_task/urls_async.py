@@ -0,0 +1,12 @@
+"""URL configuration used by the ASGI entry point (see settings_asgi)."""
+from django.contrib import admin
+from django.urls import path, include
+
+from task_system.metrics import metrics_view
+
+urlpatterns = [
+    path('admin/', admin.site.urls),
+    path('task_system/', include('task_system.async_urls')),
+    path("accounts/", include("django.contrib.auth.urls")),
+    path("metrics", metrics_view, name="metrics"),
+]
@@ -0,0 +1,82 @@
+// Typeahead for WorkerPickerWidget: queries the worker lookup endpoint
+// and adds picked workers as selected options of the hidden-choice select.
+(function () {
+  function debounce(fn, wait) {
+    let timer;
+    return function () {
+      const args = arguments;
+      clearTimeout(timer);
+      timer = setTimeout(function () { fn.apply(null, args); }, wait);
+    };
+  }
+
+  function addOption(select, id, text) {
+    if (select.querySelector('option[value="' + id + '"]')) return;
+    const option = new Option(text, id, true, true);
+    select.add(option);
+  }
+
+  function init(picker) {
+    const url = picker.dataset.lookupUrl;
+    const search = picker.querySelector(".worker-picker-search");
+    const results = picker.querySelector(".worker-picker-results");
+    const select = picker.querySelector("select");
+
+    // every option in the list is a picked worker: a plain click on a
+    // <select multiple> would first deselect all the others, so clicks
+    // only remove, and all remaining options are selected again on submit
+    select.addEventListener("mousedown", function (event) {
+      if (event.target.tagName !== "OPTION") return;
+      event.preventDefault();
+      event.target.remove();
+    });
+    if (select.form) {
+      select.form.addEventListener("submit", function () {
+        Array.prototype.forEach.call(select.options, function (option) {
+          option.selected = true;
+        });
+      });
+    }
+
+    function render(data, append) {
+      if (!append) results.innerHTML = "";
+      data.results.forEach(function (worker) {
+        const item = document.createElement("button");
+        item.type = "button";
+        item.className = "list-group-item list-group-item-action";
+        item.textContent = worker.text;
+        item.addEventListener("click", function () {
+          addOption(select, worker.id, worker.text);
+        });
+        results.appendChild(item);
+      });
+      if (data.next) {
+        const more = document.createElement("button");
+        more.type = "button";
+        more.className = "list-group-item list-group-item-action text-primary";
+        more.textContent = "More...";
+        more.addEventListener("click", function () {
+          more.remove();
+          fetch(data.next).then(function (r) { return r.json(); })
+            .then(function (next) { render(next, true); });
+        });
+        results.appendChild(more);
+      }
+    }
+
+    search.addEventListener("input", debounce(function () {
+      const q = search.value.trim();
+      if (!q) {
+        results.innerHTML = "";
+        return;
+      }
+      fetch(url + "?q=" + encodeURIComponent(q))
+        .then(function (r) { return r.json(); })
+        .then(function (data) { render(data, false); });
+    }, 200));
+  }
+
+  document.addEventListener("DOMContentLoaded", function () {
+    document.querySelectorAll(".worker-picker").forEach(init);
+  });
+})();
@@ -1,11 +1,110 @@
-from django.contrib import admin
+"""
+Admin registrations that stay usable with large tables.
+
+- Changelists use EstimatedCountPaginator and skip the second "of N
+  total" COUNT(*).
+- Foreign keys and many-to-manys are autocomplete fields. The related
+  admins search with index range scans (prefix_search) or the task FTS
+  index instead of LIKE '%q%'.
+- Every listed relation is in list_select_related, and Worker.__str__
+  always finds its position joined.
+- Bulk actions go through task_system.bulk_actions in chunks of
+  ADMIN_ACTION_CHUNK_SIZE ids, so "select all" on millions of rows
+  never loads them or holds one long write transaction.
+"""
+from django import forms
+from django.conf import settings
+from django.contrib import admin, messages
+from django.contrib.admin.helpers import ActionForm
+from django.contrib.admin.widgets import AutocompleteSelect
 from django.contrib.auth.admin import UserAdmin
 
-from task_system.models import Worker
+from task_system.bulk_actions import complete_tasks, reassign_tasks
+from task_system.models import (
+    DashboardStats,
+    Notification,
+    Position,
+    Task,
+    TaskType,
+    Team,
+    Worker,
+    WorkerLoad,
+)
+from task_system.pagination import EstimatedCountPaginator
+from task_system.search import prefix_search, search_tasks
+
+
+def chunked_ids(queryset):
+    """Primary keys of the queryset in chunks, one keyset query each."""
+    size = getattr(settings, "ADMIN_ACTION_CHUNK_SIZE", 1000)
+    ids = queryset.order_by("pk").values_list("pk", flat=True)
+    last = None
+    while True:
+        chunk = ids if last is None else ids.filter(pk__gt=last)
+        chunk = list(chunk[:size])
+        if not chunk:
+            return
+        yield chunk
+        last = chunk[-1]
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    # fields searched with prefix_search instead of search_fields' LIKE
+    prefix_search_fields = ()
+    prefix_search_lower = False
+
+    def get_search_results(self, request, queryset, search_term):
+        if not self.prefix_search_fields:
+            return super().get_search_results(request, queryset, search_term)
+        queryset = prefix_search(
+            queryset, self.prefix_search_fields, search_term,
+            lower=self.prefix_search_lower,
+        )
+        return queryset, False
+
+
+@admin.register(Position)
+class PositionAdmin(LargeTableAdmin):
+    list_display = ("name",)
+    search_fields = ("name",)
+    prefix_search_fields = ("name",)
+    prefix_search_lower = True
+    ordering = ("name",)
+
+
+@admin.register(TaskType)
+class TaskTypeAdmin(LargeTableAdmin):
+    list_display = ("name",)
+    search_fields = ("name",)
+    prefix_search_fields = ("name",)
+    prefix_search_lower = True
+
+
+@admin.register(Team)
+class TeamAdmin(LargeTableAdmin):
+    list_display = ("name", "description")
+    search_fields = ("name",)
+    prefix_search_fields = ("name",)
+    prefix_search_lower = True
+    ordering = ("name",)
+    autocomplete_fields = ("workers",)
 
 
 @admin.register(Worker)
-class WorkerAdmin(UserAdmin):
+class WorkerAdmin(LargeTableAdmin, UserAdmin):
+    list_display = ("username", "first_name", "last_name", "email", "position", "is_staff")
+    list_select_related = ("position",)
+    # lower(username/first_name/last_name) have functional indexes
+    prefix_search_fields = ("username", "first_name", "last_name")
+    prefix_search_lower = True
+    # UserAdmin's group filter lists every group, keep the cheap ones
+    list_filter = ("is_staff", "is_superuser", "is_active")
+    autocomplete_fields = ("position",)
+    fieldsets = UserAdmin.fieldsets + (
+        ("Work", {"fields": ("position",)}),
+    )
     add_fieldsets = UserAdmin.add_fieldsets + (
         (
             (
@@ -14,8 +113,94 @@ class WorkerAdmin(UserAdmin):
                     "fields": (
                         "first_name",
                         "last_name",
+                        "email",
+                        "position",
                     )
                 },
             ),
         )
-    )
\ No newline at end of file
+    )
+
+    def get_queryset(self, request):
+        # autocomplete results print str(worker), which shows the position
+        return super().get_queryset(request).select_related("position")
+
+
+class TaskActionForm(ActionForm):
+    team = forms.ModelChoiceField(
+        queryset=Team.objects.all(),
+        required=False,
+        widget=AutocompleteSelect(Task._meta.get_field("team"), admin.site),
+        help_text="Target team for “Move to team”; empty removes the team.",
+    )
+
+
+@admin.register(Task)
+class TaskAdmin(LargeTableAdmin):
+    list_display = (
+        "name", "task_type", "team", "priority", "deadline", "is_complete", "is_overdue",
+    )
+    list_select_related = ("task_type", "team")
+    # choices and booleans only: a relation filter would list every row
+    list_filter = ("is_complete", "is_overdue", "priority")
+    search_fields = ("name",)
+    autocomplete_fields = ("task_type", "team", "assignees")
+    action_form = TaskActionForm
+    actions = ("complete_selected", "move_to_team")
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip():
+            return queryset, False
+        return search_tasks(queryset, search_term), False
+
+    @admin.action(description="Mark selected tasks as done")
+    def complete_selected(self, request, queryset):
+        updated = sum(complete_tasks(ids) for ids in chunked_ids(queryset))
+        self.message_user(request, f"{updated} task(s) marked as done.", messages.SUCCESS)
+
+    @admin.action(description="Move selected tasks to team")
+    def move_to_team(self, request, queryset):
+        form = self.action_form(request.POST)
+        form.fields["action"].choices = self.get_action_choices(request)
+        if not form.is_valid():
+            self.message_user(request, "Choose a valid team.", messages.ERROR)
+            return
+        team = form.cleaned_data["team"]
+        updated = sum(reassign_tasks(ids, team) for ids in chunked_ids(queryset))
+        self.message_user(
+            request,
+            f"{updated} task(s) moved to {team or 'no team'}.",
+            messages.SUCCESS,
+        )
+
+
+@admin.register(Notification)
+class NotificationAdmin(LargeTableAdmin):
+    list_display = ("task", "worker", "kind", "created_at", "is_read")
+    list_select_related = ("task", "worker__position")
+    list_filter = ("kind", "is_read")
+    autocomplete_fields = ("task", "worker")
+
+
+@admin.register(WorkerLoad)
+class WorkerLoadAdmin(LargeTableAdmin):
+    list_display = ("worker", "open_tasks", "weighted_load")
+    list_select_related = ("worker__position",)
+    readonly_fields = ("worker", "open_tasks", "weighted_load")
+
+    def has_add_permission(self, request):
+        # maintained by task_system.workload, see reconcile_workloads
+        return False
+
+
+@admin.register(DashboardStats)
+class DashboardStatsAdmin(admin.ModelAdmin):
+    list_display = (
+        "num_workers", "num_tasks", "num_completed_tasks", "num_type_tasks", "num_position",
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
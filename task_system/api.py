@@ -0,0 +1,187 @@
+"""
+Read-only streaming JSON/CSV endpoints for reporting jobs.
+
+Rows are read with queryset.iterator() and related names are prefetched
+once per chunk, so memory stays flat and the first bytes go out before
+the whole table has been read. Under ASGI the rows are handed to the
+handler through an async iterator: Django reads a sync one to the end
+before sending anything.
+"""
+import csv
+import json
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Prefetch, Q
+from django.http import Http404, StreamingHttpResponse
+from django.views import generic
+
+from task_system.models import Task, Team, Worker
+from task_system.search import search_tasks
+
+CONTENT_TYPES = {
+    "json": "application/json",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+class Echo:
+    """File-like object that hands back what csv.writer writes."""
+
+    def write(self, value):
+        return value
+
+
+async def aiter_chunks(stream):
+    """
+    Async iterator over a sync generator. Every step runs in the request's
+    sync thread, the one that holds the iterator()'s database cursor.
+    """
+    step = sync_to_async(next, thread_sensitive=True)
+    try:
+        while (chunk := await step(stream, None)) is not None:
+            yield chunk
+    finally:
+        await sync_to_async(stream.close, thread_sensitive=True)()
+
+
+class StreamingExportView(LoginRequiredMixin, generic.View):
+    fields = []
+    filename = "export"
+    chunk_size = 2000
+    # rows are sent in groups to avoid one tiny write per row
+    rows_per_write = 100
+
+    def get_queryset(self):
+        raise NotImplementedError
+
+    def get_row(self, obj):
+        raise NotImplementedError
+
+    def iter_rows(self):
+        for obj in self.get_queryset().iterator(chunk_size=self.chunk_size):
+            yield self.get_row(obj)
+
+    def stream_json(self):
+        yield "["
+        buffer = []
+        first = True
+        for row in self.iter_rows():
+            buffer.append(json.dumps(row, ensure_ascii=False))
+            if len(buffer) >= self.rows_per_write:
+                yield ("" if first else ",") + ",".join(buffer)
+                buffer, first = [], False
+        if buffer:
+            yield ("" if first else ",") + ",".join(buffer)
+        yield "]"
+
+    def stream_csv(self):
+        writer = csv.writer(Echo())
+        yield writer.writerow(self.fields)
+        buffer = []
+        for row in self.iter_rows():
+            values = [
+                ";".join(map(str, value)) if isinstance(value, list) else value
+                for value in (row[field] for field in self.fields)
+            ]
+            buffer.append(writer.writerow(values))
+            if len(buffer) >= self.rows_per_write:
+                yield "".join(buffer)
+                buffer = []
+        if buffer:
+            yield "".join(buffer)
+
+    def get(self, request, fmt):
+        if fmt not in CONTENT_TYPES:
+            raise Http404("Unknown format")
+        stream = self.stream_json() if fmt == "json" else self.stream_csv()
+        if isinstance(request, ASGIRequest):
+            stream = aiter_chunks(stream)
+        response = StreamingHttpResponse(stream, content_type=CONTENT_TYPES[fmt])
+        if fmt == "csv":
+            response["Content-Disposition"] = (
+                f'attachment; filename="{self.filename}.csv"'
+            )
+        return response
+
+
+class TaskExportView(StreamingExportView):
+    fields = [
+        "id", "name", "description", "deadline", "is_complete", "priority",
+        "task_type", "team", "assignees",
+    ]
+    filename = "tasks"
+
+    def get_queryset(self):
+        queryset = Task.objects.select_related("task_type", "team").prefetch_related(
+            Prefetch("assignees", queryset=Worker.objects.only("id", "username"))
+        ).order_by("id")
+        search = self.request.GET.get("search", "")
+        if search:
+            queryset = search_tasks(queryset, search)
+        return queryset
+
+    def get_row(self, task):
+        return {
+            "id": task.id,
+            "name": task.name,
+            "description": task.description,
+            "deadline": task.deadline.isoformat(),
+            "is_complete": task.is_complete,
+            "priority": task.get_priority_display(),
+            "task_type": task.task_type.name,
+            "team": task.team.name if task.team else None,
+            "assignees": [worker.username for worker in task.assignees.all()],
+        }
+
+
+class TeamExportView(StreamingExportView):
+    fields = ["id", "name", "description", "workers"]
+    filename = "teams"
+
+    def get_queryset(self):
+        queryset = Team.objects.prefetch_related(
+            Prefetch("workers", queryset=Worker.objects.only("id", "username"))
+        ).order_by("id")
+        search = self.request.GET.get("search", "")
+        if search:
+            queryset = queryset.filter(name__icontains=search)
+        return queryset
+
+    def get_row(self, team):
+        return {
+            "id": team.id,
+            "name": team.name,
+            "description": team.description,
+            "workers": [worker.username for worker in team.workers.all()],
+        }
+
+
+class WorkerExportView(StreamingExportView):
+    fields = ["id", "username", "email", "first_name", "last_name", "position", "teams"]
+    filename = "workers"
+
+    def get_queryset(self):
+        queryset = Worker.objects.select_related("position").prefetch_related(
+            Prefetch("teams", queryset=Team.objects.only("id", "name"))
+        ).order_by("id")
+        search = self.request.GET.get("search", "")
+        if search:
+            queryset = queryset.filter(
+                Q(username__icontains=search)
+                | Q(first_name__icontains=search)
+                | Q(last_name__icontains=search)
+            )
+        return queryset
+
+    def get_row(self, worker):
+        return {
+            "id": worker.id,
+            "username": worker.username,
+            "email": worker.email,
+            "first_name": worker.first_name,
+            "last_name": worker.last_name,
+            "position": worker.position.name,
+            "teams": [team.name for team in worker.teams.all()],
+        }
@@ -4,3 +4,17 @@ from django.apps import AppConfig
 class TasksystemConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'task_system'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from django.db.models.signals import post_migrate
+
+        from task_system import signals  # noqa: F401
+        from task_system.db import apply_sqlite_pragmas
+        from task_system.middleware import install_query_recorder
+        from task_system.search import ensure_index_triggers, register_fold_function
+
+        post_migrate.connect(ensure_index_triggers, sender=self)
+        connection_created.connect(apply_sqlite_pragmas)
+        connection_created.connect(install_query_recorder)
+        connection_created.connect(register_fold_function)
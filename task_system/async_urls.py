@@ -0,0 +1,20 @@
+"""task_system.urls with the read-heavy views swapped for their async versions."""
+from django.urls import path
+
+from task_system import async_views
+from task_system.urls import urlpatterns as sync_urlpatterns
+
+ASYNC_VIEWS = {
+    "index": async_views.index,
+    "task-list": async_views.TaskListView.as_view(),
+    "task-detail": async_views.TaskDetailView.as_view(),
+    "team-list": async_views.TeamListView.as_view(),
+    "team-detail": async_views.TeamDetailView.as_view(),
+    "worker-list": async_views.WorkerList.as_view(),
+}
+
+urlpatterns = [
+    path(str(pattern.pattern), ASYNC_VIEWS[pattern.name], name=pattern.name)
+    if pattern.name in ASYNC_VIEWS else pattern
+    for pattern in sync_urlpatterns
+]
@@ -0,0 +1,176 @@
+"""
+Async versions of the read-heavy views, served by manage_task.asgi.
+
+Queries go through the async ORM (acount/aget/async for) and are all
+awaited before the response is built; the TemplateResponse is then
+rendered off the event loop by Django's async handler. The sync views
+in task_system.views stay the ones used under WSGI.
+"""
+from asgiref.sync import sync_to_async
+from django.contrib.auth.mixins import AccessMixin
+from django.contrib.auth.views import redirect_to_login
+from django.core.paginator import InvalidPage
+from django.http import Http404
+from django.shortcuts import render
+
+from task_system import views
+from task_system.models import Task
+from task_system.pagination import (
+    ApproximateCountPaginator,
+    CursorPaginationMixin,
+    CursorPaginator,
+    InvalidCursor,
+)
+from task_system.search import fts_available
+from task_system.stats import aget_dashboard_stats
+from task_system.team_stats import aget_team_stats
+
+
+class AsyncLoginRequiredMixin(AccessMixin):
+    async def dispatch(self, request, *args, **kwargs):
+        # request.user is lazy and loads the session from the database
+        is_authenticated = await sync_to_async(
+            lambda: request.user.is_authenticated
+        )()
+        if not is_authenticated:
+            return self.handle_no_permission()
+        return await super().dispatch(request, *args, **kwargs)
+
+
+class AsyncConditionalGetMixin:
+    """Answers ConditionalGetMixin's 304s before the async get runs."""
+
+    async def get(self, request, *args, **kwargs):
+        validators = await sync_to_async(self.get_validators)()
+        response = self.not_modified(validators)
+        if response is None:
+            response = self.add_validators(
+                await super().get(request, *args, **kwargs), validators
+            )
+        return response
+
+
+class AsyncListMixin(AsyncLoginRequiredMixin):
+    """
+    Evaluates the list (or the current page of it) with the async ORM
+    before get_context_data runs, which then only sees finished results.
+    """
+
+    async def apaginate_queryset(self, queryset, page_size):
+        if isinstance(self, CursorPaginationMixin) and self.use_cursor_pagination():
+            paginator = CursorPaginator(
+                queryset, self.get_cursor_ordering(), page_size
+            )
+            try:
+                page = await paginator.apage(self.request.GET.get("cursor"))
+            except InvalidCursor:
+                raise Http404("Invalid cursor")
+            self.cursor_page = page
+            return None, page, page.object_list, False
+
+        paginator = self.get_paginator(
+            queryset,
+            page_size,
+            orphans=self.get_paginate_orphans(),
+            allow_empty_first_page=self.get_allow_empty(),
+        )
+        # Paginator.count is a cached_property, seed it so page() doesn't
+        # run a blocking COUNT(*)
+        if isinstance(paginator, ApproximateCountPaginator):
+            await paginator.acount()
+        else:
+            paginator.__dict__["count"] = await queryset.acount()
+        page = self.kwargs.get(self.page_kwarg) or self.request.GET.get(
+            self.page_kwarg
+        ) or 1
+        try:
+            page_number = int(page)
+        except ValueError:
+            if page != "last":
+                raise Http404("Page is not “last”, nor can it be converted to an int.")
+            page_number = paginator.num_pages
+        try:
+            page = paginator.page(page_number)
+        except InvalidPage as e:
+            raise Http404(f"Invalid page ({page_number}): {e}")
+        page.object_list = [obj async for obj in page.object_list]
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def paginate_queryset(self, queryset, page_size):
+        return self.paginated
+
+    async def get(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+        page_size = self.get_paginate_by(queryset)
+        if page_size:
+            self.paginated = await self.apaginate_queryset(queryset, page_size)
+        else:
+            # async iteration fills the queryset's result cache
+            [obj async for obj in queryset]
+        self.object_list = queryset
+        context = self.get_context_data()
+        return self.render_to_response(context)
+
+
+class AsyncDetailMixin(AsyncLoginRequiredMixin):
+    async def get(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+        try:
+            self.object = await queryset.aget(pk=self.kwargs[self.pk_url_kwarg])
+        except queryset.model.DoesNotExist:
+            raise Http404(
+                f"No {queryset.model._meta.verbose_name} found matching the query"
+            )
+        context = self.get_context_data(object=self.object)
+        return self.render_to_response(context)
+
+
+async def index(request):
+    is_authenticated = await sync_to_async(lambda: request.user.is_authenticated)()
+    if not is_authenticated:
+        return redirect_to_login(request.get_full_path())
+    stats = await aget_dashboard_stats()
+    context = {
+        "num_workers": stats.num_workers,
+        "num_tasks": stats.num_tasks,
+        "num_completed_tasks": stats.num_completed_tasks,
+        "num_type_tasks": stats.num_type_tasks,
+        "num_position": stats.num_position,
+    }
+    return await sync_to_async(render)(request, "task_system/index.html", context)
+
+
+class TaskListView(AsyncConditionalGetMixin, AsyncListMixin, views.TaskListView):
+    async def get(self, request, *args, **kwargs):
+        # fts_available() may introspect the schema on first use
+        await sync_to_async(fts_available)(Task.objects.db)
+        return await super().get(request, *args, **kwargs)
+
+
+class TaskDetailView(AsyncConditionalGetMixin, AsyncDetailMixin, views.TaskDetailView):
+    pass
+
+
+class AsyncTeamStatsMixin:
+    async def get(self, request, *args, **kwargs):
+        self.team_stats = await aget_team_stats()
+        return await super().get(request, *args, **kwargs)
+
+    def get_team_stats(self):
+        return self.team_stats
+
+
+class TeamListView(
+    AsyncConditionalGetMixin, AsyncTeamStatsMixin, AsyncListMixin, views.TeamListView
+):
+    pass
+
+
+class TeamDetailView(
+    AsyncConditionalGetMixin, AsyncTeamStatsMixin, AsyncDetailMixin, views.TeamDetailView
+):
+    pass
+
+
+class WorkerList(AsyncConditionalGetMixin, AsyncListMixin, views.WorkerList):
+    pass
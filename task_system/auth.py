@@ -0,0 +1,77 @@
+"""
+Cached user lookups for AuthenticationMiddleware.
+
+With cached_db sessions the session comes from the cache, which leaves
+the Worker row as the one query every authenticated request made.
+CachedAuthenticationMiddleware keeps a snapshot of the logged-in Worker,
+with its position already loaded, in the default cache. The key
+includes the "worker" and "position" fragment versions, so any Worker
+or Position change (profile edits, password changes, last_login,
+bulk imports) makes every snapshot unreachable, and the session's auth
+hash, so a password change never reads an old snapshot even before that.
+
+The snapshots are only as shared as the default cache. With a
+process-local cache, set AUTH_USER_SNAPSHOTS = False: a logout or
+password change handled by one process can't retire the others' copies.
+"""
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.contrib import auth
+from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.core.cache import cache
+from django.db.models import prefetch_related_objects
+from django.utils.functional import SimpleLazyObject
+
+from task_system.fragment_cache import get_versions
+
+SNAPSHOT_KEY = "auth-user:{}:{}:{}"
+SNAPSHOT_TIMEOUT = 60 * 60
+
+
+def snapshot_key(session):
+    user_id = session.get(auth.SESSION_KEY)
+    session_hash = session.get(auth.HASH_SESSION_KEY)
+    if user_id is None or session_hash is None:
+        return None
+    return SNAPSHOT_KEY.format(user_id, get_versions("worker", "position"), session_hash)
+
+
+def get_user(request):
+    if not hasattr(request, "_cached_user"):
+        request._cached_user = load_user(request)
+    return request._cached_user
+
+
+def load_user(request):
+    """Like django.contrib.auth.get_user, served from the snapshot when possible."""
+    if not getattr(settings, "AUTH_USER_SNAPSHOTS", True):
+        return auth.get_user(request)
+    key = snapshot_key(request.session)
+    user = cache.get(key) if key else None
+    if user is not None:
+        return user
+    # the normal lookup also checks the session hash and the backend
+    user = auth.get_user(request)
+    if key and user.is_authenticated:
+        # every template shows the position; load it into the snapshot
+        prefetch_related_objects([user], "position")
+        cache.set(key, user, SNAPSHOT_TIMEOUT)
+    return user
+
+
+def forget_user(request):
+    if key := snapshot_key(request.session):
+        cache.delete(key)
+
+
+async def aget_user(request):
+    return await sync_to_async(get_user)(request)
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    def process_request(self, request):
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: get_user(request))
+        request.auser = partial(aget_user, request)
@@ -0,0 +1,94 @@
+"""
+Task state transitions applied as one conditional UPDATE.
+
+Only rows that actually change match the WHERE clause, so the returned
+count is the number of tasks that changed state. The UPDATEs set
+updated_at themselves, since auto_now only applies on save(). Worker
+loads are adjusted from the assignments read just before the UPDATE.
+"""
+from collections import defaultdict
+
+from django.db import transaction
+from django.utils import timezone
+
+from task_system.fragment_cache import bump_version
+from task_system.models import Task
+from task_system.stats import adjust_dashboard_stats
+from task_system.workload import (
+    Assignment,
+    adjust_workloads,
+    assignment_deltas,
+    assignments,
+)
+
+ACTIONS = {
+    "complete": "Mark as done",
+    "reopen": "Reopen",
+    "reprioritise": "Change priority",
+    "reassign": "Move to team",
+}
+
+
+def tasks_changed(updated):
+    # UPDATE skips save signals, so cached task rows are expired here
+    if updated:
+        bump_version("task")
+    return updated
+
+
+@transaction.atomic
+def complete_tasks(ids):
+    released = list(assignments(ids))
+    updated = Task.objects.filter(
+        id__in=ids, is_complete=False
+    ).update(is_complete=True, updated_at=timezone.now())
+    adjust_dashboard_stats(num_completed_tasks=updated)
+    adjust_workloads(assignment_deltas(released, -1))
+    return tasks_changed(updated)
+
+
+@transaction.atomic
+def reopen_tasks(ids):
+    reopened = list(assignments(ids, is_complete=True))
+    updated = Task.objects.filter(
+        id__in=ids, is_complete=True
+    ).update(is_complete=False, updated_at=timezone.now())
+    adjust_dashboard_stats(num_completed_tasks=-updated)
+    adjust_workloads(assignment_deltas(reopened))
+    return tasks_changed(updated)
+
+
+@transaction.atomic
+def reprioritise_tasks(ids, priority):
+    changed = Assignment.objects.filter(
+        task_id__in=ids, task__is_complete=False
+    ).exclude(task__priority=priority).values_list("worker_id", "task__priority")
+    deltas = defaultdict(lambda: (0, 0))
+    for worker_id, old_priority in changed:
+        deltas[worker_id] = (0, deltas[worker_id][1] + priority - old_priority)
+    updated = Task.objects.filter(
+        id__in=ids, is_complete=False
+    ).exclude(priority=priority).update(priority=priority, updated_at=timezone.now())
+    adjust_workloads(deltas)
+    return tasks_changed(updated)
+
+
+def reassign_tasks(ids, team):
+    queryset = Task.objects.filter(id__in=ids, is_complete=False)
+    if team is None:
+        queryset = queryset.filter(team__isnull=False)
+    else:
+        queryset = queryset.exclude(team=team)
+    return tasks_changed(queryset.update(team=team, updated_at=timezone.now()))
+
+
+def apply_bulk_action(action, ids, priority=None, team=None):
+    if action == "complete":
+        return complete_tasks(ids)
+    if action == "reopen":
+        return reopen_tasks(ids)
+    if action == "reprioritise":
+        return reprioritise_tasks(ids, priority)
+    if action == "reassign":
+        return reassign_tasks(ids, team)
+    raise ValueError(f"Unknown bulk action '{action}'")
@@ -0,0 +1,315 @@
+"""
+Streaming JSONL/CSV import and export for tasks, teams and workers.
+
+Records are read and written one at a time and written to the database
+in batches with bulk_create, so memory use does not depend on the size
+of the file. Related objects are referenced by name (task types,
+positions, teams) or username (workers).
+"""
+import csv
+import json
+from itertools import islice
+
+from django.db import transaction
+from django.db.models import Prefetch
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from task_system.fragment_cache import bump_version
+from task_system.models import Position, Task, TaskType, Team, Worker
+from task_system.stats import adjust_dashboard_stats
+from task_system.workload import LeastLoadedBalancer, adjust_workloads, assignment_deltas
+
+FORMATS = ("jsonl", "csv")
+
+FIELDS = {
+    "task": [
+        "name", "description", "deadline", "is_complete", "priority",
+        "task_type", "team", "assignees",
+    ],
+    "team": ["name", "description", "workers"],
+    "worker": [
+        "username", "email", "first_name", "last_name", "position",
+        "password", "is_staff", "is_active",
+    ],
+}
+
+# many-to-many columns, joined with LIST_SEPARATOR in CSV files
+LIST_FIELDS = {"task": {"assignees"}, "team": {"workers"}, "worker": set()}
+LIST_SEPARATOR = ";"
+
+
+class BulkImportError(ValueError):
+    pass
+
+
+def detect_format(path, fmt=None):
+    if fmt:
+        return fmt
+    return "csv" if str(path).lower().endswith(".csv") else "jsonl"
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def parse_bool(value, default=False):
+    # an empty CSV cell means "not given", like a missing key
+    if value in (None, ""):
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "yes")
+
+
+def parse_priority(value):
+    if value in (None, ""):
+        return Task.Priority.LOW
+    if isinstance(value, str) and not value.isdigit():
+        try:
+            return Task.Priority[value.upper()]
+        except KeyError:
+            raise BulkImportError(f"Unknown priority '{value}'")
+    try:
+        return Task.Priority(int(value))
+    except ValueError:
+        raise BulkImportError(f"Unknown priority '{value}'")
+
+
+def parse_deadline(value):
+    deadline = parse_datetime(value) if isinstance(value, str) else value
+    if deadline is None:
+        raise BulkImportError(f"Invalid deadline '{value}'")
+    if timezone.is_naive(deadline):
+        deadline = timezone.make_aware(deadline)
+    return deadline
+
+
+def read_records(stream, fmt, model):
+    if fmt == "csv":
+        for row in csv.DictReader(stream):
+            for field in LIST_FIELDS[model]:
+                value = row.get(field) or ""
+                row[field] = [v for v in value.split(LIST_SEPARATOR) if v]
+            yield row
+        return
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def write_records(stream, fmt, model, records):
+    if fmt == "csv":
+        writer = csv.DictWriter(stream, fieldnames=FIELDS[model])
+        writer.writeheader()
+        for record in records:
+            for field in LIST_FIELDS[model]:
+                record[field] = LIST_SEPARATOR.join(record[field])
+            writer.writerow(record)
+        return
+    for record in records:
+        stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+class Importer:
+    """
+    Bulk loader shared by the import command, one batch at a time.
+
+    With auto_assign, open tasks that have a team but no assignees go to
+    the least-loaded active member of that team.
+    """
+
+    def __init__(self, batch_size=1000, auto_assign=False):
+        self.batch_size = batch_size
+        self.auto_assign = auto_assign
+        # team id -> LeastLoadedBalancer, kept for the whole import
+        self.balancers = {}
+        self.created = {
+            "task": 0, "completed_task": 0, "team": 0, "worker": 0,
+            "task_type": 0, "position": 0,
+        }
+
+    def resolve_names(self, model, names, counter=None):
+        """Map names to ids with one query, creating missing rows if counter is set."""
+        names = {name for name in names if name}
+        ids = dict(model.objects.filter(name__in=names).values_list("name", "id"))
+        missing = names - ids.keys()
+        if missing and counter is None:
+            raise BulkImportError(
+                f"Unknown {model._meta.verbose_name}: {', '.join(sorted(missing))}"
+            )
+        if missing:
+            model.objects.bulk_create(
+                [model(name=name) for name in missing], ignore_conflicts=True
+            )
+            self.created[counter] += len(missing)
+            ids.update(
+                model.objects.filter(name__in=missing).values_list("name", "id")
+            )
+        return ids
+
+    def resolve_workers(self, usernames):
+        usernames = set(usernames)
+        ids = dict(
+            Worker.objects.filter(username__in=usernames).values_list("username", "id")
+        )
+        missing = usernames - ids.keys()
+        if missing:
+            raise BulkImportError(f"Unknown workers: {', '.join(sorted(missing))}")
+        return ids
+
+    def import_workers(self, records):
+        positions = self.resolve_names(
+            Position, (r["position"] for r in records), "position"
+        )
+        workers = []
+        for record in records:
+            worker = Worker(
+                username=record["username"],
+                email=record["email"],
+                first_name=record.get("first_name") or "",
+                last_name=record.get("last_name") or "",
+                position_id=positions[record["position"]],
+                is_staff=parse_bool(record.get("is_staff")),
+                is_active=parse_bool(record.get("is_active"), default=True),
+            )
+            if record.get("password"):
+                # exported hashes are kept as-is so logins survive a migration
+                worker.password = record["password"]
+            else:
+                worker.set_unusable_password()
+            workers.append(worker)
+        Worker.objects.bulk_create(workers, batch_size=self.batch_size)
+        self.created["worker"] += len(workers)
+
+    def import_teams(self, records):
+        worker_ids = self.resolve_workers(
+            username for r in records for username in r.get("workers", [])
+        )
+        teams = Team.objects.bulk_create(
+            [Team(name=r["name"], description=r.get("description") or "") for r in records],
+            batch_size=self.batch_size,
+        )
+        Through = Team.workers.through
+        Through.objects.bulk_create(
+            [
+                Through(team_id=team.id, worker_id=worker_ids[username])
+                for team, record in zip(teams, records)
+                for username in set(record.get("workers", []))
+            ]
+        )
+        self.created["team"] += len(teams)
+
+    def build_tasks(self, records):
+        task_types = self.resolve_names(
+            TaskType, (r["task_type"] for r in records), "task_type"
+        )
+        teams = self.resolve_names(Team, (r.get("team") for r in records))
+        return [
+            Task(
+                name=record["name"],
+                description=record.get("description") or "",
+                deadline=parse_deadline(record["deadline"]),
+                is_complete=parse_bool(record.get("is_complete")),
+                priority=parse_priority(record.get("priority")),
+                task_type_id=task_types[record["task_type"]],
+                team_id=teams.get(record.get("team")),
+            )
+            for record in records
+        ]
+
+    def import_tasks(self, records):
+        worker_ids = self.resolve_workers(
+            username for r in records for username in r.get("assignees", [])
+        )
+        tasks = Task.objects.bulk_create(
+            self.build_tasks(records), batch_size=self.batch_size
+        )
+        Through = Task.assignees.through
+        rows = []
+        for task, record in zip(tasks, records):
+            assignees = {worker_ids[username] for username in record.get("assignees", [])}
+            if not assignees and self.auto_assign and task.team_id and not task.is_complete:
+                worker_id = self.balancer(task.team_id).assign(task.priority)
+                if worker_id is not None:
+                    assignees.add(worker_id)
+            rows.extend(Through(task=task, worker_id=worker_id) for worker_id in assignees)
+        Through.objects.bulk_create(rows)
+        # bulk_create skips the m2m signals that keep worker loads current
+        adjust_workloads(assignment_deltas(
+            (row.worker_id, row.task.priority) for row in rows if not row.task.is_complete
+        ))
+        self.created["task"] += len(tasks)
+        self.created["completed_task"] += sum(task.is_complete for task in tasks)
+
+    def balancer(self, team_id):
+        if team_id not in self.balancers:
+            self.balancers[team_id] = LeastLoadedBalancer.for_team(team_id)
+        return self.balancers[team_id]
+
+    def run(self, model, records):
+        """Import an iterable of records in one transaction, return the count."""
+        load_batch = {
+            "task": self.import_tasks,
+            "team": self.import_teams,
+            "worker": self.import_workers,
+        }[model]
+        with transaction.atomic():
+            for batch in batched(records, self.batch_size):
+                load_batch(batch)
+            # bulk_create skips signals, so the dashboard counters are
+            # adjusted once for the whole import
+            adjust_dashboard_stats(
+                num_tasks=self.created["task"],
+                num_completed_tasks=self.created["completed_task"],
+                num_workers=self.created["worker"],
+                num_type_tasks=self.created["task_type"],
+                num_position=self.created["position"],
+            )
+        bump_version(model)
+        return self.created[model]
+
+
+def export_records(model, chunk_size=2000):
+    """Yield records for every row, prefetching related names per chunk."""
+    if model == "task":
+        tasks = Task.objects.select_related("task_type", "team").prefetch_related(
+            Prefetch("assignees", queryset=Worker.objects.only("id", "username"))
+        ).order_by("id")
+        for task in tasks.iterator(chunk_size=chunk_size):
+            yield {
+                "name": task.name,
+                "description": task.description,
+                "deadline": task.deadline.isoformat(),
+                "is_complete": task.is_complete,
+                "priority": task.Priority(task.priority).name.lower(),
+                "task_type": task.task_type.name,
+                "team": task.team.name if task.team else None,
+                "assignees": [worker.username for worker in task.assignees.all()],
+            }
+    elif model == "team":
+        teams = Team.objects.prefetch_related(
+            Prefetch("workers", queryset=Worker.objects.only("id", "username"))
+        ).order_by("id")
+        for team in teams.iterator(chunk_size=chunk_size):
+            yield {
+                "name": team.name,
+                "description": team.description,
+                "workers": [worker.username for worker in team.workers.all()],
+            }
+    else:
+        workers = Worker.objects.select_related("position").order_by("id")
+        for worker in workers.iterator(chunk_size=chunk_size):
+            yield {
+                "username": worker.username,
+                "email": worker.email,
+                "first_name": worker.first_name,
+                "last_name": worker.last_name,
+                "position": worker.position.name,
+                "password": worker.password,
+                "is_staff": worker.is_staff,
+                "is_active": worker.is_active,
+            }
@@ -0,0 +1,121 @@
+"""
+Conditional GET for the task, team and worker pages.
+
+A page's validator is computed without rendering it:
+
+- list pages: MAX(updated_at) of the listed rows, read from the
+  updated_at index, and their count, cached until the next write
+  (pagination.cached_count). The count catches deletes, which leave the
+  maximum alone.
+- detail pages: the object's updated_at, a single-row lookup.
+
+Both are combined with the fragment versions of the related models the
+page shows (validator_models), the user, session and CSRF secret the
+page is rendered for (every page carries a {% csrf_token %}) and the
+query string. A matching If-None-Match is answered with 304 Not
+Modified before the view's own queries run. Detail pages also send
+Last-Modified; list pages don't, since a delete doesn't move it, and
+neither do pages with a get_validator_timeout() (team statistics).
+If-Modified-Since alone never gives a 304: a date can't tell that the
+cached copy was rendered for an earlier login.
+
+updated_at is auto_now on save(); the bulk UPDATE paths and m2m changes
+(task_system.signals) set it themselves.
+"""
+import hashlib
+import time
+
+from django.contrib import messages
+from django.db.models import Max
+from django.middleware.csrf import get_token
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from django.views.generic.detail import SingleObjectMixin
+
+from task_system.fragment_cache import get_versions
+from task_system.pagination import cached_count
+
+
+class ConditionalGetMixin:
+    # fragment versions of related models rendered on the page
+    validator_models = ()
+
+    def get_validator_queryset(self):
+        return self.model._default_manager.all()
+
+    def get_validator_timeout(self):
+        """Seconds after which a page that also depends on the clock expires."""
+        return None
+
+    def is_detail(self):
+        return isinstance(self, SingleObjectMixin)
+
+    def get_validator_state(self):
+        """(updated_at, row count) of the page's rows; None to skip."""
+        queryset = self.get_validator_queryset()
+        if self.is_detail():
+            updated_at = queryset.filter(
+                pk=self.kwargs[self.pk_url_kwarg]
+            ).values_list("updated_at", flat=True).first()
+            # a missing object is left to the view's 404
+            return None if updated_at is None else (updated_at, 1)
+        updated_at = queryset.order_by().aggregate(Max("updated_at"))["updated_at__max"]
+        return updated_at, cached_count(queryset.order_by())
+
+    def get_validators(self):
+        """(etag, last_modified timestamp or None), or None."""
+        request = self.request
+        # pending messages must be rendered, not answered with a 304
+        if request.method != "GET" or len(messages.get_messages(request)):
+            return None
+        state = self.get_validator_state()
+        if state is None:
+            return None
+        updated_at, count = state
+        # get_token() creates the secret the page's {% csrf_token %} will use
+        get_token(request)
+        raw = "|".join((
+            str(request.user.pk),
+            request.session.session_key or "",
+            request.META["CSRF_COOKIE"],
+            request.get_full_path(),
+            updated_at.isoformat() if updated_at else "",
+            str(count),
+            get_versions(*self.validator_models) if self.validator_models else "",
+        ))
+        timeout = self.get_validator_timeout()
+        if timeout:
+            raw += f"|{int(time.time() // timeout)}"
+        etag = quote_etag(hashlib.md5(raw.encode()).hexdigest())
+        last_modified = None
+        if self.is_detail() and not timeout:
+            last_modified = int(updated_at.timestamp())
+        return etag, last_modified
+
+    def not_modified(self, validators):
+        if validators is None:
+            return None
+        etag, _ = validators
+        response = get_conditional_response(self.request, etag=etag)
+        if response is not None:
+            response.headers["ETag"] = etag
+        return response
+
+    def add_validators(self, response, validators):
+        if validators is not None and response.status_code == 200:
+            etag, last_modified = validators
+            response.headers.setdefault("ETag", etag)
+            if last_modified is not None:
+                response.headers.setdefault("Last-Modified", http_date(last_modified))
+            # per-user pages: browsers may keep them but must revalidate
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def get(self, request, *args, **kwargs):
+        validators = self.get_validators()
+        response = self.not_modified(validators)
+        if response is None:
+            response = self.add_validators(
+                super().get(request, *args, **kwargs), validators
+            )
+        return response
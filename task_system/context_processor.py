@@ -1,6 +1,12 @@
 from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
 
 
 def cfg_assets_root(request):
-
-    return { 'ASSETS_ROOT' : settings.ASSETS_ROOT }
+    # STATIC_VERSION changes with every collectstatic: {% cache %} keys of
+    # fragments with hashed {% static %} URLs include it, or a shared cache
+    # would keep pointing at the previous deploy's files
+    return {
+        'ASSETS_ROOT': settings.ASSETS_ROOT,
+        'STATIC_VERSION': getattr(staticfiles_storage, 'manifest_hash', ''),
+    }
@@ -0,0 +1,158 @@
+"""
+Synthetic data for load testing.
+
+Everything is inserted with bulk_create in batches, so generating a few
+hundred thousand tasks takes seconds rather than hours. The same seed on
+the same database produces the same rows.
+"""
+import random
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from task_system.bulk_io import batched
+from task_system.fragment_cache import bump_version
+from task_system.models import Position, Task, TaskType, Team, Worker
+from task_system.stats import adjust_dashboard_stats
+from task_system.workload import adjust_workloads, assignment_deltas
+
+FIRST_NAMES = [
+    "Olena", "Taras", "Iryna", "Andrii", "Maria", "Dmytro", "Sofia",
+    "Oleh", "Anna", "Yurii", "Kateryna", "Bohdan", "Nina", "Maksym",
+]
+LAST_NAMES = [
+    "Shevchenko", "Kovalenko", "Bondarenko", "Tkachenko", "Kravchenko",
+    "Oliinyk", "Melnyk", "Lysenko", "Savchenko", "Rudenko", "Moroz",
+]
+WORDS = [
+    "api", "billing", "cache", "checkout", "dashboard", "deploy", "email",
+    "export", "login", "migration", "report", "search", "signup", "sync",
+]
+VERBS = ["Fix", "Refactor", "Review", "Document", "Test", "Optimise", "Ship"]
+
+
+class DataGenerator:
+    def __init__(self, seed=None, batch_size=1000):
+        self.random = random.Random(seed)
+        self.batch_size = batch_size
+        # unique per run so a second run doesn't collide on unique names
+        self.tag = f"{self.random.getrandbits(32):08x}"
+
+    def sentence(self, words):
+        return " ".join(self.random.choice(WORDS) for _ in range(words))
+
+    def generate_positions(self, count):
+        return Position.objects.bulk_create(
+            [Position(name=f"Position {self.tag}-{i}") for i in range(count)],
+            batch_size=self.batch_size,
+        )
+
+    def generate_task_types(self, count):
+        return TaskType.objects.bulk_create(
+            [TaskType(name=f"Type {self.tag}-{i}") for i in range(count)],
+            batch_size=self.batch_size,
+        )
+
+    def generate_workers(self, count, positions, password):
+        # hashing is the slow part of creating users, so it's done once
+        password = make_password(password)
+        workers = []
+        for i in range(count):
+            first = self.random.choice(FIRST_NAMES)
+            last = self.random.choice(LAST_NAMES)
+            username = f"{first}.{last}.{self.tag}{i}".lower()
+            workers.append(Worker(
+                username=username,
+                email=f"{username}@example.com",
+                first_name=first,
+                last_name=last,
+                position_id=self.random.choice(positions).id,
+                password=password,
+            ))
+        return Worker.objects.bulk_create(workers, batch_size=self.batch_size)
+
+    def generate_teams(self, count, workers, team_size):
+        teams = Team.objects.bulk_create(
+            [
+                Team(name=f"Team {self.tag}-{i}", description=self.sentence(12))
+                for i in range(count)
+            ],
+            batch_size=self.batch_size,
+        )
+        Through = Team.workers.through
+        Through.objects.bulk_create(
+            (
+                Through(team_id=team.id, worker_id=worker.id)
+                for team in teams
+                for worker in self.random.sample(workers, min(team_size, len(workers)))
+            ),
+            batch_size=self.batch_size,
+        )
+        return teams
+
+    def generate_tasks(self, count, task_types, teams, workers, max_assignees):
+        now = timezone.now()
+        priorities = list(Task.Priority)
+        # ~80% of tasks belong to a team
+        team_ids = [team.id for team in teams] + [None] * (len(teams) // 4)
+        Through = Task.assignees.through
+        created = completed = 0
+        for batch in batched(range(count), self.batch_size):
+            tasks = Task.objects.bulk_create([
+                Task(
+                    name=f"{self.random.choice(VERBS)} {self.sentence(3)}",
+                    description=self.sentence(30),
+                    deadline=now + timedelta(hours=self.random.randint(-24 * 30, 24 * 90)),
+                    is_complete=self.random.random() < 0.3,
+                    priority=self.random.choice(priorities),
+                    task_type_id=self.random.choice(task_types).id,
+                    team_id=self.random.choice(team_ids) if team_ids else None,
+                )
+                for _ in batch
+            ])
+            rows = [
+                Through(task=task, worker_id=worker.id)
+                for task in tasks
+                for worker in self.random.sample(
+                    workers, self.random.randint(0, min(max_assignees, len(workers)))
+                )
+            ]
+            Through.objects.bulk_create(rows, batch_size=self.batch_size)
+            adjust_workloads(assignment_deltas(
+                (row.worker_id, row.task.priority) for row in rows if not row.task.is_complete
+            ))
+            created += len(tasks)
+            completed += sum(task.is_complete for task in tasks)
+        return created, completed
+
+    def run(self, positions, task_types, workers, teams, tasks,
+            team_size=8, max_assignees=3, password="password123"):
+        """Create the requested number of rows and return the counts."""
+        with transaction.atomic():
+            position_rows = self.generate_positions(positions)
+            task_type_rows = self.generate_task_types(task_types)
+            worker_rows = self.generate_workers(workers, position_rows, password)
+            team_rows = self.generate_teams(teams, worker_rows, team_size)
+            num_tasks = num_completed = 0
+            if tasks:
+                num_tasks, num_completed = self.generate_tasks(
+                    tasks, task_type_rows, team_rows, worker_rows, max_assignees
+                )
+            # bulk_create skips signals, see Importer.run
+            adjust_dashboard_stats(
+                num_tasks=num_tasks,
+                num_completed_tasks=num_completed,
+                num_workers=len(worker_rows),
+                num_type_tasks=len(task_type_rows),
+                num_position=len(position_rows),
+            )
+        bump_version("task", "team", "worker", "tasktype", "position")
+        return {
+            "position": len(position_rows),
+            "task_type": len(task_type_rows),
+            "worker": len(worker_rows),
+            "team": len(team_rows),
+            "task": num_tasks,
+        }
@@ -0,0 +1,226 @@
+"""
+Database tuning, read-replica routing and cheap table size estimates.
+
+Both are driven by settings (see manage_task/settings_production.py):
+SQLITE_PRAGMAS are applied to every new SQLite connection, and
+ReplicaRouter sends the reads of views marked ``read_from_replica`` to
+the "replica" alias while everything else stays on the primary.
+"""
+import logging
+import sqlite3
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+
+REPLICA = "replica"
+PIN_COOKIE = "primary_pin"
+
+logger = logging.getLogger("task_system.db")
+
+# replica_generation() of the replica the current request reads from
+_use_replica = ContextVar("use_replica", default=None)
+
+
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """connection_created receiver."""
+    pragmas = getattr(settings, "SQLITE_PRAGMAS", None)
+    if connection.vendor != "sqlite" or not pragmas:
+        return
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+
+
+def estimated_row_count(model, using="default"):
+    """
+    Table size without a COUNT(*), or None where no estimate is available.
+
+    SQLite: the largest rowid, a single b-tree descent. It is exact for
+    tables that are only appended to and overcounts deleted rows.
+    PostgreSQL: the planner's reltuples, as of the last ANALYZE.
+    """
+    connection = connections[using]
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            cursor.execute(f"SELECT MAX(rowid) FROM {connection.ops.quote_name(table)}")
+            return cursor.fetchone()[0] or 0
+        if connection.vendor == "postgresql":
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [table]
+            )
+            row = cursor.fetchone()
+            # -1 until the table has been analyzed
+            return row[0] if row and row[0] >= 0 else None
+    return None
+
+
+def replica_generation():
+    """
+    A value that changes whenever the replica is written to, or None
+    while it can't be read from: never synced, or not an SQLite file.
+
+    Fragment versions are bumped on the primary, so caches filled from a
+    lagging replica would hold pre-write rows under post-write versions;
+    get_versions() adds this to the keys of replica reads instead.
+    """
+    database = settings.DATABASES.get(REPLICA, {})
+    if database.get("ENGINE") != "django.db.backends.sqlite3":
+        return None
+    name = str(database["NAME"])
+    try:
+        stat = Path(name).stat()
+    except FileNotFoundError:
+        return None
+    # an empty file is what connecting to a missing database leaves behind
+    if not stat.st_size:
+        return None
+    stats = [f"{stat.st_mtime_ns}.{stat.st_size}"]
+    try:
+        stat = Path(f"{name}-wal").stat()
+        stats.append(f"{stat.st_mtime_ns}.{stat.st_size}")
+    except FileNotFoundError:
+        pass
+    return "-".join(stats)
+
+
+def current_replica_generation():
+    """replica_generation() when the current reads go to the replica."""
+    return _use_replica.get()
+
+
+def start_replica_reads():
+    """Send this context's reads to the replica; a token for reset, or None."""
+    generation = replica_generation()
+    if generation is None:
+        # never synced, so its tables are missing
+        logger.warning("Replica %r is not synced, reading from the primary", REPLICA)
+        return None
+    return _use_replica.set(generation)
+
+
+@contextmanager
+def reads_from_replica():
+    token = start_replica_reads()
+    try:
+        yield
+    finally:
+        if token is not None:
+            _use_replica.reset(token)
+
+
+def read_from_replica(view):
+    """Mark a function view as safe to serve from the replica."""
+    view.read_from_replica = True
+    return view
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if _use_replica.get() is not None and REPLICA in settings.DATABASES:
+            return REPLICA
+        return "default"
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # the replica is a copy of the primary, so rows from either relate
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db != REPLICA
+
+
+class ReplicaMiddleware:
+    """
+    Serves GET/HEAD requests for views with ``read_from_replica = True``
+    from the replica, template rendering included. Other requests, and
+    every write, use the primary. Goes last in MIDDLEWARE so sessions and
+    auth are always read from the primary.
+
+    The replica lags behind the primary until the next sync, so a client
+    that just wrote (any non-GET/HEAD request) gets a cookie pinning its
+    reads to the primary for REPLICA_PIN_SECONDS; otherwise the redirect
+    after creating a task would 404 on the replica.
+
+    Until the replica has been synced once, every read uses the primary.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+            # set in the request's own context, where the view runs
+            self.process_view = self.aprocess_view
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            self.reset(request)
+        return self.pin(request, response)
+
+    async def __acall__(self, request):
+        try:
+            response = await self.get_response(request)
+        finally:
+            self.reset(request)
+        return self.pin(request, response)
+
+    def reset(self, request):
+        token = getattr(request, "_replica_token", None)
+        if token is not None:
+            _use_replica.reset(token)
+
+    def pin(self, request, response):
+        if request.method not in ("GET", "HEAD"):
+            seconds = getattr(settings, "REPLICA_PIN_SECONDS", 60)
+            response.set_cookie(
+                PIN_COOKIE, "1", max_age=seconds, httponly=True, samesite="Lax",
+                secure=request.is_secure(),
+            )
+        return response
+
+    def use_replica(self, request, view_func):
+        view = getattr(view_func, "view_class", view_func)
+        return (
+            request.method in ("GET", "HEAD")
+            and PIN_COOKIE not in request.COOKIES
+            and getattr(view, "read_from_replica", False)
+        )
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if self.use_replica(request, view_func):
+            # load the session and user from the primary first
+            if hasattr(request, "user"):
+                request.user.is_authenticated
+            request._replica_token = start_replica_reads()
+        return None
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        if self.use_replica(request, view_func):
+            if hasattr(request, "auser"):
+                await request.auser()
+            request._replica_token = start_replica_reads()
+        return None
+
+
+def sync_replica(path=None):
+    """Copy the primary SQLite file over the replica with the backup API."""
+    path = path or settings.DATABASES[REPLICA]["NAME"]
+    primary = connections["default"]
+    primary.ensure_connection()
+    target = sqlite3.connect(path)
+    try:
+        primary.connection.backup(target)
+    finally:
+        target.close()
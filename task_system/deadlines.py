@@ -0,0 +1,208 @@
+"""
+Acts on task deadlines as they pass (``manage.py run_deadline_scheduler``).
+
+The scheduler keeps a min-heap of (deadline, task id) for the incomplete
+tasks due within DEADLINE_HORIZON_SECONDS, loaded with one range query
+on the partial task_due_idx index, so only the tasks it still has to
+act on are ever read. Task saves and deletes in this process reach the
+heap through a queue fed by signal receivers; changes made by other
+processes are picked up when the window is reloaded every
+DEADLINE_REFRESH_SECONDS. A changed task leaves its old heap entry
+behind, and that entry is skipped when popped.
+
+When a deadline passes, the task is re-checked against the database and
+then flagged as overdue. Flagging is also how the scheduler knows a task
+has been handled. The extra DEADLINE_ACTIONS run before the flag is set:
+"escalate", "notify" or the dotted path of any callable that takes a
+list of task ids.
+"""
+import heapq
+from collections import Counter
+import math
+import queue
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from task_system.fragment_cache import bump_version
+from task_system.models import Notification, Task
+from task_system.workload import Assignment, adjust_workloads
+
+
+def escalate_tasks(ids):
+    escalated = Task.objects.filter(id__in=ids, priority__lt=Task.Priority.URGENT)
+    # every assignment of an escalated task weighs one more
+    assigned = Counter(
+        Assignment.objects.filter(task__in=escalated).values_list("worker_id", flat=True)
+    )
+    adjust_workloads({worker_id: (0, count) for worker_id, count in assigned.items()})
+    escalated.update(priority=F("priority") + 1, updated_at=timezone.now())
+
+
+def notify_assignees(ids):
+    assignments = Task.assignees.through.objects.filter(
+        task_id__in=ids
+    ).values_list("task_id", "worker_id")
+    Notification.objects.bulk_create(
+        Notification(task_id=task_id, worker_id=worker_id, kind=Notification.Kind.OVERDUE)
+        for task_id, worker_id in assignments
+    )
+
+
+ACTIONS = {
+    "escalate": escalate_tasks,
+    "notify": notify_assignees,
+}
+
+
+def resolve_action(name):
+    if name in ACTIONS:
+        return ACTIONS[name]
+    try:
+        return import_string(name)
+    except ImportError as e:
+        raise ImproperlyConfigured(f"Unknown deadline action {name!r}") from e
+
+
+def flag_overdue(ids):
+    updated = Task.objects.filter(id__in=ids).update(
+        is_overdue=True, updated_at=timezone.now()
+    )
+    # UPDATE skips save signals, so cached task rows are expired here
+    if updated:
+        bump_version("task")
+    return updated
+
+
+def from_timestamp(timestamp):
+    return datetime.fromtimestamp(timestamp, tz=dt_timezone.utc)
+
+
+class DeadlineScheduler:
+    def __init__(self, actions=None, horizon=None, refresh=None, batch_size=500):
+        if actions is None:
+            actions = getattr(settings, "DEADLINE_ACTIONS", [])
+        self.actions = [resolve_action(name) for name in actions]
+        self.horizon = horizon or getattr(settings, "DEADLINE_HORIZON_SECONDS", 6 * 60 * 60)
+        self.refresh = refresh or getattr(settings, "DEADLINE_REFRESH_SECONDS", 60)
+        self.batch_size = batch_size
+        self.heap = []
+        # task id -> deadline of its live heap entry
+        self.scheduled = {}
+        self.changes = queue.SimpleQueue()
+        self.window_end = self.next_load = 0
+        self.fired = 0
+        self.stopped = False
+
+    def schedule(self, task_id, deadline):
+        if self.scheduled.get(task_id) != deadline:
+            self.scheduled[task_id] = deadline
+            heapq.heappush(self.heap, (deadline, task_id))
+
+    def load(self, now):
+        self.window_end = now + self.horizon
+        self.next_load = now + self.refresh
+        rows = Task.objects.filter(
+            is_complete=False, is_overdue=False,
+            deadline__lte=from_timestamp(self.window_end),
+        ).values_list("id", "deadline")
+        for task_id, deadline in rows.iterator(chunk_size=2000):
+            self.schedule(task_id, deadline.timestamp())
+
+    def task_saved(self, sender, instance, **kwargs):
+        deadline = instance.__dict__.get("deadline")
+        pending = not (instance.is_complete or instance.is_overdue)
+        # a deferred deadline is left to the next reload
+        if deadline is not None:
+            self.changes.put((instance.pk, deadline.timestamp() if pending else None))
+
+    def task_deleted(self, sender, instance, **kwargs):
+        self.changes.put((instance.pk, None))
+
+    def apply_change(self, change):
+        task_id, deadline = change
+        if deadline is None or deadline > self.window_end:
+            # dropped here, loaded again once it falls inside the window
+            self.scheduled.pop(task_id, None)
+        else:
+            self.schedule(task_id, deadline)
+
+    def apply_changes(self):
+        while True:
+            try:
+                change = self.changes.get_nowait()
+            except queue.Empty:
+                return
+            if change is not None:
+                self.apply_change(change)
+
+    def pop_due(self, now):
+        due = []
+        while self.heap and self.heap[0][0] <= now:
+            deadline, task_id = heapq.heappop(self.heap)
+            if self.scheduled.get(task_id) == deadline:
+                del self.scheduled[task_id]
+                due.append(task_id)
+        return due
+
+    def fire(self, ids, now):
+        with transaction.atomic():
+            # another process may have finished or moved the task meanwhile
+            ids = list(Task.objects.filter(
+                id__in=ids, is_complete=False, is_overdue=False,
+                deadline__lte=from_timestamp(now),
+            ).values_list("id", flat=True))
+            if not ids:
+                return 0
+            for action in self.actions:
+                action(ids)
+            flag_overdue(ids)
+        self.fired += len(ids)
+        return len(ids)
+
+    def run_once(self, now):
+        if now >= self.next_load:
+            self.load(now)
+        self.apply_changes()
+        due = self.pop_due(now)
+        for start in range(0, len(due), self.batch_size):
+            self.fire(due[start:start + self.batch_size], now)
+
+    def wait(self, now):
+        wake = min(self.next_load, self.heap[0][0] if self.heap else math.inf)
+        try:
+            change = self.changes.get(timeout=max(0, wake - now))
+        except queue.Empty:
+            return
+        if change is not None:
+            self.apply_change(change)
+
+    def connect(self):
+        post_save.connect(self.task_saved, sender=Task)
+        post_delete.connect(self.task_deleted, sender=Task)
+
+    def disconnect(self):
+        post_save.disconnect(self.task_saved, sender=Task)
+        post_delete.disconnect(self.task_deleted, sender=Task)
+
+    def run(self):
+        """Blocks until stop() is called; sleeps until the next deadline or reload."""
+        self.connect()
+        try:
+            while not self.stopped:
+                close_old_connections()
+                self.run_once(timezone.now().timestamp())
+                self.wait(timezone.now().timestamp())
+        finally:
+            self.disconnect()
+
+    def stop(self):
+        self.stopped = True
+        # wakes up wait()
+        self.changes.put(None)
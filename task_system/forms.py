@@ -5,16 +5,27 @@ from crispy_bootstrap5.bootstrap5 import BS5Accordion
 from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import UserCreationForm
 
+from .bulk_actions import ACTIONS
+from .m2m import M2MSyncFormMixin
 from .models import Task, Team, Worker
+from .widgets import WorkerPickerWidget
+from .workload import LeastLoadedBalancer
 
 
-class TaskForm(forms.ModelForm):
+class TaskForm(M2MSyncFormMixin, forms.ModelForm):
+    # only submitted ids are validated and only selected workers rendered,
+    # position is joined because Worker.__str__ shows it
     assignees = forms.ModelMultipleChoiceField(
-        queryset=get_user_model().objects.all(),
-        widget=forms.CheckboxSelectMultiple,
+        queryset=get_user_model().objects.select_related("position"),
+        widget=WorkerPickerWidget,
         required=False,
         label="Workers"
     )
+    auto_assign = forms.BooleanField(
+        required=False,
+        label="Assign to the least-loaded team member",
+    )
+    sync_m2m_fields = ("assignees",)
 
     class Meta:
         model = Task
@@ -56,19 +67,38 @@ class TaskForm(forms.ModelForm):
                     Field('priority', template="bootstrap5/field.html"),
                     Field('task_type', template="bootstrap5/field.html"),
                     Field('assignees', template="bootstrap5/field.html"),
-                    Field('team', template="bootstrap5/field.html")
+                    Field('team', template="bootstrap5/field.html"),
+                    Field('auto_assign', template="bootstrap5/field.html")
                 )
             )
         )
 
+    def clean(self):
+        cleaned_data = super().clean()
+        if not cleaned_data.get("auto_assign"):
+            return cleaned_data
+        team = cleaned_data.get("team")
+        if team is None:
+            self.add_error("team", "Choose a team to assign from.")
+            return cleaned_data
+        worker_id = LeastLoadedBalancer.for_team(team.pk).assign(
+            cleaned_data.get("priority") or Task.Priority.LOW
+        )
+        if worker_id is None:
+            self.add_error("team", "This team has no active workers.")
+        else:
+            cleaned_data["assignees"] = [worker_id]
+        return cleaned_data
 
-class TeamForm(forms.ModelForm):
+
+class TeamForm(M2MSyncFormMixin, forms.ModelForm):
     workers = forms.ModelMultipleChoiceField(
-        queryset=get_user_model().objects.all(),
-        widget=forms.CheckboxSelectMultiple,
+        queryset=get_user_model().objects.select_related("position"),
+        widget=WorkerPickerWidget,
         required=False,
         label="Workers"
     )
+    sync_m2m_fields = ("workers",)
 
     class Meta:
         model = Team
@@ -101,12 +131,14 @@ class TeamForm(forms.ModelForm):
         )
 
 
-class WorkerUpdateForm(forms.ModelForm):
+class WorkerUpdateForm(M2MSyncFormMixin, forms.ModelForm):
     teams = forms.ModelMultipleChoiceField(
         queryset=Team.objects.all(),
         widget=forms.CheckboxSelectMultiple,
         required=False
     )
+    # reverse side of Team.workers, ModelForm doesn't save it by itself
+    sync_m2m_fields = ("teams",)
 
     class Meta:
         model = Worker
@@ -118,14 +150,6 @@ class WorkerUpdateForm(forms.ModelForm):
         if self.instance.pk:
             self.fields["teams"].initial = self.instance.teams.all()
 
-    def save(self, commit=True):
-        worker = super().save(commit=False)
-        if commit:
-            worker.save()
-            self.save_m2m()
-        # зберегти many-to-many вручну
-        worker.teams.set(self.cleaned_data["teams"])
-        return worker
 
 
 class WorkerRegisterForm(UserCreationForm):
@@ -149,3 +173,32 @@ class WorkerRegisterForm(UserCreationForm):
             "password1": "Password",
             "password2": "Confirm password",
         }
+
+
+class TaskIdsField(forms.Field):
+    # plain ids: the UPDATE filters on them, so the tasks are not loaded
+    # just to validate the selection
+    widget = forms.MultipleHiddenInput
+
+    def to_python(self, value):
+        if not value:
+            return []
+        try:
+            return [int(v) for v in value]
+        except (TypeError, ValueError):
+            raise forms.ValidationError("Enter a list of task ids.")
+
+
+class TaskBulkActionForm(forms.Form):
+    action = forms.ChoiceField(choices=ACTIONS.items())
+    task_ids = TaskIdsField()
+    priority = forms.TypedChoiceField(
+        choices=Task.Priority.choices, coerce=int, required=False
+    )
+    team = forms.ModelChoiceField(queryset=Team.objects.all(), required=False)
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if cleaned_data.get("action") == "reprioritise" and not cleaned_data.get("priority"):
+            self.add_error("priority", "Choose a priority.")
+        return cleaned_data
@@ -0,0 +1,77 @@
+"""
+Version counters for cached template fragments.
+
+Each model has a counter in the fragment cache that is bumped whenever a
+row of that model changes. Fragments include the counters they depend
+on in their cache key, so a bump makes the old entries unreachable and
+they are evicted by the backend's normal culling. The counters have to
+be shared by every process serving requests: with a per-process cache a
+write only expires the entries of the process that made it.
+
+Requests reading from the replica also key on its generation
+(task_system.db.replica_generation): the counters move on the primary's
+writes, before the replica has the rows.
+"""
+import secrets
+
+from django.core import checks
+from django.core.cache import caches
+from django.core.cache.backends.base import InvalidCacheBackendError
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+from task_system.db import current_replica_generation
+
+VERSION_KEY = "fragment-version:{}"
+
+
+def new_version():
+    # random rather than incr(), which is a get and a set on most
+    # backends: two processes bumping at once would both write v+1. An
+    # evicted counter must not come back with an older value either.
+    return secrets.token_hex(8)
+
+
+def get_fragment_cache():
+    try:
+        return caches["template_fragments"]
+    except InvalidCacheBackendError:
+        return caches["default"]
+
+
+def get_versions(*models):
+    cache = get_fragment_cache()
+    keys = {model: VERSION_KEY.format(model) for model in models}
+    found = cache.get_many(keys.values())
+    versions = []
+    for model, key in keys.items():
+        version = found.get(key)
+        if version is None:
+            cache.add(key, new_version(), timeout=None)
+            version = cache.get(key)
+        versions.append(f"{model}{version}")
+    generation = current_replica_generation()
+    if generation is not None:
+        versions.append(f"replica{generation}")
+    return "-".join(versions)
+
+
+def bump_version(*models):
+    get_fragment_cache().set_many(
+        {VERSION_KEY.format(model): new_version() for model in models}, timeout=None
+    )
+
+
+@checks.register(checks.Tags.caches, deploy=True)
+def check_fragment_cache(app_configs, **kwargs):
+    cache = get_fragment_cache()
+    if isinstance(cache, (LocMemCache, DummyCache)):
+        return [checks.Error(
+            f"Fragment versions are kept in a process-local "
+            f"{type(cache).__name__}.",
+            hint="With more than one process, writes don't expire the cached "
+                 "rows of the others. Configure a shared backend (Redis, "
+                 "memcached, file-based) for the 'template_fragments' cache.",
+            id="task_system.E001",
+        )]
+    return []
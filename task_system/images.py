@@ -0,0 +1,177 @@
+"""
+WebP/AVIF variants of raster images at several widths.
+
+``manage.py build_image_variants`` writes the variants of every image in
+each IMAGE_VARIANT_DIRS source into its output directory together with a
+manifest.json. The manifest records a hash of each source, so a rebuild
+only touches images that changed. The ``image_set`` template tag reads
+the manifest of the static images.
+"""
+import hashlib
+import json
+from pathlib import Path
+
+from django.conf import settings
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = features = None
+
+SOURCE_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+MANIFEST_NAME = "manifest.json"
+# (format, mime type, Pillow save options), best first
+FORMATS = [
+    ("avif", "image/avif", {"quality": 55}),
+    ("webp", "image/webp", {"quality": 80, "method": 6}),
+]
+DEFAULT_WIDTHS = [320, 640, 1024, 1600]
+
+
+class ImageVariantError(Exception):
+    pass
+
+
+def variant_dirs():
+    """(source, output) directory pairs from IMAGE_VARIANT_DIRS."""
+    return [
+        (Path(source), Path(output))
+        for source, output in getattr(settings, "IMAGE_VARIANT_DIRS", [])
+    ]
+
+
+def variant_widths():
+    return getattr(settings, "IMAGE_VARIANT_WIDTHS", DEFAULT_WIDTHS)
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def read_manifest(output_dir):
+    try:
+        with open(Path(output_dir) / MANIFEST_NAME, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def available_formats():
+    if Image is None:
+        raise ImageVariantError("Pillow is required to build image variants")
+    return [fmt for fmt in FORMATS if features.check(fmt[0])]
+
+
+class VariantBuilder:
+    def __init__(self, source_dir, output_dir, widths=None, force=False):
+        self.source_dir = Path(source_dir)
+        self.output_dir = Path(output_dir)
+        self.widths = sorted(widths or variant_widths())
+        self.force = force
+        self.formats = available_formats()
+        self.built = self.skipped = 0
+
+    def sources(self):
+        for path in sorted(self.source_dir.rglob("*")):
+            # never treat earlier output as input
+            if self.output_dir in path.parents:
+                continue
+            if path.suffix.lower() in SOURCE_EXTENSIONS and path.is_file():
+                yield path
+
+    def is_current(self, entry, digest):
+        return entry and entry["hash"] == digest and all(
+            (self.output_dir / variant["path"]).exists()
+            for variants in entry["variants"].values()
+            for variant in variants
+        )
+
+    def build_image(self, path, name, digest):
+        with Image.open(path) as image:
+            image.load()
+            if image.mode not in ("RGB", "RGBA"):
+                has_alpha = image.mode in ("LA", "P") or "transparency" in image.info
+                image = image.convert("RGBA" if has_alpha else "RGB")
+            width, height = image.size
+            widths = [w for w in self.widths if w < width] + [width]
+            stem = Path(name).with_suffix("")
+            variants = {}
+            for fmt, _, options in self.formats:
+                variants[fmt] = []
+                for target in widths:
+                    resized = image if target == width else image.resize(
+                        (target, round(height * target / width)), Image.LANCZOS
+                    )
+                    relative = f"{stem}-{digest[:8]}-{target}.{fmt}"
+                    destination = self.output_dir / relative
+                    destination.parent.mkdir(parents=True, exist_ok=True)
+                    resized.save(destination, fmt.upper(), **options)
+                    variants[fmt].append({"width": target, "path": relative})
+        return {"hash": digest, "width": width, "height": height, "variants": variants}
+
+    def remove_variants(self, entry):
+        for variants in entry["variants"].values():
+            for variant in variants:
+                (self.output_dir / variant["path"]).unlink(missing_ok=True)
+
+    def run(self):
+        manifest = read_manifest(self.output_dir)
+        updated = {}
+        for path in self.sources():
+            name = path.relative_to(self.source_dir).as_posix()
+            digest = file_hash(path)
+            entry = manifest.pop(name, None)
+            if not self.force and self.is_current(entry, digest):
+                updated[name] = entry
+                self.skipped += 1
+                continue
+            if entry:
+                self.remove_variants(entry)
+            updated[name] = self.build_image(path, name, digest)
+            self.built += 1
+        # whatever is left belongs to deleted sources
+        for entry in manifest.values():
+            self.remove_variants(entry)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.output_dir / MANIFEST_NAME, "w", encoding="utf-8") as f:
+            json.dump(updated, f, indent=1, sort_keys=True)
+        return updated
+
+
+def static_variant_dirs():
+    """(static prefix of sources, static prefix of variants, output dir)."""
+    pairs = []
+    for source, output in variant_dirs():
+        for static_dir in map(Path, settings.STATICFILES_DIRS):
+            if static_dir in source.parents and static_dir in output.parents:
+                pairs.append((
+                    source.relative_to(static_dir).as_posix(),
+                    output.relative_to(static_dir).as_posix(),
+                    output,
+                ))
+    return pairs
+
+
+_manifests = {}
+
+
+def find_variants(static_path):
+    """Manifest entry of a static image and the static prefix of its variants."""
+    for source_prefix, output_prefix, output_dir in static_variant_dirs():
+        if not static_path.startswith(source_prefix + "/"):
+            continue
+        manifest_path = output_dir / MANIFEST_NAME
+        try:
+            mtime = manifest_path.stat().st_mtime
+        except FileNotFoundError:
+            return None, None
+        cached = _manifests.get(manifest_path)
+        if cached is None or cached[0] != mtime:
+            cached = _manifests[manifest_path] = (mtime, read_manifest(output_dir))
+        entry = cached[1].get(static_path[len(source_prefix) + 1:])
+        return entry, output_prefix
+    return None, None
@@ -0,0 +1,108 @@
+"""
+In-process load test over the named routes of task_system.urls.
+
+Requests go through the full middleware stack with django.test.Client
+(one client per worker thread, all sharing one logged-in session), so
+the numbers include templates, sessions and every SQL query but no
+network or web server overhead.
+"""
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from importlib import import_module
+
+from django.db import connections
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+# routes that change data or only accept POST
+SKIP_ROUTES = {"task-done", "task-bulk-action"}
+DEFAULT_KWARGS = {"fmt": "json"}
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def route_targets(urlconf="task_system.urls"):
+    """Return (name, url) for every named GET route, filling in sample kwargs."""
+    targets = []
+    for pattern in import_module(urlconf).urlpatterns:
+        if not pattern.name or pattern.name in SKIP_ROUTES:
+            continue
+        kwargs = {}
+        for key in pattern.pattern.converters:
+            if key in DEFAULT_KWARGS:
+                kwargs[key] = DEFAULT_KWARGS[key]
+            elif key == "pk":
+                model = pattern.callback.view_class.model
+                kwargs[key] = model.objects.order_by("pk").values_list(
+                    "pk", flat=True
+                ).first()
+            else:
+                kwargs[key] = None
+        if None in kwargs.values():
+            # no sample value, or no rows to point a detail page at
+            continue
+        targets.append((pattern.name, reverse(pattern.name, kwargs=kwargs)))
+    return targets
+
+
+class LoadTest:
+    def __init__(self, user, requests=100, concurrency=4, warmup=2):
+        self.requests = requests
+        self.concurrency = concurrency
+        self.warmup = warmup
+        login = Client()
+        login.force_login(user)
+        self.cookies = login.cookies
+        self.local = threading.local()
+
+    def fetch(self, url):
+        # Client isn't thread-safe, so each worker thread gets its own
+        if not hasattr(self.local, "client"):
+            self.local.client = Client()
+            self.local.client.cookies = self.cookies
+        with ExitStack() as stack:
+            # every alias, so reads sent to a replica are counted too
+            captured = [
+                stack.enter_context(CaptureQueriesContext(connection))
+                for connection in connections.all()
+            ]
+            start = time.perf_counter()
+            response = self.local.client.get(url)
+            if hasattr(response, "streaming_content"):
+                b"".join(response.streaming_content)
+            elapsed = time.perf_counter() - start
+        return response.status_code, elapsed, sum(map(len, captured))
+
+    def run_route(self, url):
+        for _ in range(self.warmup):
+            self.fetch(url)
+        start = time.perf_counter()
+        if self.concurrency > 1:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+                results = list(pool.map(self.fetch, [url] * self.requests))
+        else:
+            results = [self.fetch(url) for _ in range(self.requests)]
+        wall = time.perf_counter() - start
+
+        timings = [elapsed for _, elapsed, _ in results]
+        query_counts = [count for _, _, count in results]
+        return {
+            "url": url,
+            "requests": self.requests,
+            "errors": sum(status >= 400 for status, _, _ in results),
+            "throughput": round(self.requests / wall, 1),
+            "p50_ms": round(statistics.median(timings) * 1000, 2),
+            "p95_ms": round(percentile(timings, 95) * 1000, 2),
+            "p99_ms": round(percentile(timings, 99) * 1000, 2),
+            "queries": max(query_counts),
+        }
+
+    def run(self, targets):
+        return {name: self.run_route(url) for name, url in targets}
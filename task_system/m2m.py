@@ -0,0 +1,71 @@
+"""
+Diff-based many-to-many sync.
+
+Reads the current ids from the through table once, then applies the
+difference with one bulk INSERT and one DELETE in a transaction, and
+sends a single m2m_synced signal for the whole change.
+"""
+from django.db import router, transaction
+from django.db.models import QuerySet
+from django.dispatch import Signal
+
+# sent once per sync with the sets of added and removed target ids
+m2m_synced = Signal()
+
+
+def sync_m2m(instance, field_name, targets):
+    manager = getattr(instance, field_name)
+    through = manager.through
+    source = through._meta.get_field(manager.source_field_name).attname
+    target = through._meta.get_field(manager.target_field_name).attname
+    db = router.db_for_write(through, instance=instance)
+
+    if isinstance(targets, QuerySet):
+        new_ids = set(targets.values_list("pk", flat=True))
+    else:
+        new_ids = {getattr(obj, "pk", obj) for obj in targets}
+
+    rows = through._default_manager.using(db).filter(**{source: instance.pk})
+    with transaction.atomic(using=db):
+        current = set(rows.values_list(target, flat=True))
+        added = new_ids - current
+        removed = current - new_ids
+        if removed:
+            rows.filter(**{f"{target}__in": removed}).delete()
+        if added:
+            through._default_manager.using(db).bulk_create(
+                through(**{source: instance.pk, target: pk}) for pk in added
+            )
+        if added or removed:
+            m2m_synced.send(
+                sender=through,
+                instance=instance,
+                field_name=field_name,
+                added=added,
+                removed=removed,
+                using=db,
+            )
+
+    # drop a stale prefetch so the instance shows the new relation
+    getattr(instance, "_prefetched_objects_cache", {}).pop(
+        manager.prefetch_cache_name, None
+    )
+    return added, removed
+
+
+class M2MSyncFormMixin:
+    """ModelForm mixin that saves ``sync_m2m_fields`` with sync_m2m()."""
+    sync_m2m_fields = ()
+
+    def _save_m2m(self):
+        synced = {
+            name: self.cleaned_data.pop(name)
+            for name in self.sync_m2m_fields
+            if name in self.cleaned_data
+        }
+        try:
+            super()._save_m2m()
+        finally:
+            self.cleaned_data.update(synced)
+        for name, value in synced.items():
+            sync_m2m(self.instance, name, value)
@@ -0,0 +1,95 @@
+import asyncio
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncClient, Client, override_settings
+from django.urls import reverse
+
+from task_system.loadtest import percentile
+
+PAGES = ["index", "task-list", "team-list", "worker-list"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the sync (WSGI) and async (ASGI) views in-process: "
+        "requests/s and p99 latency at a given concurrency"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--username", required=True, help="Existing user to log in as")
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument("--concurrency", type=int, default=8)
+        parser.add_argument("--pages", nargs="+", default=PAGES, choices=PAGES)
+
+    def handle(self, *args, **options):
+        try:
+            user = get_user_model().objects.get(username=options["username"])
+        except get_user_model().DoesNotExist:
+            raise CommandError(f"No user '{options['username']}'")
+
+        total, concurrency = options["requests"], options["concurrency"]
+        # the test clients send Host: testserver
+        allowed_hosts = [*settings.ALLOWED_HOSTS, "testserver"]
+        for name in options["pages"]:
+            with override_settings(
+                ROOT_URLCONF="manage_task.urls", ALLOWED_HOSTS=allowed_hosts
+            ):
+                url = reverse(name)
+                wsgi = self.run_wsgi(user, url, total, concurrency)
+            with override_settings(
+                ROOT_URLCONF="manage_task.urls_async", ALLOWED_HOSTS=allowed_hosts
+            ):
+                asgi = self.run_asgi(user, url, total, concurrency)
+            for label, (elapsed, timings) in (("wsgi", wsgi), ("asgi", asgi)):
+                self.stdout.write(
+                    f"{name:12} {label}: {total / elapsed:7.1f} req/s  "
+                    f"p50 {statistics.median(timings) * 1000:6.1f}ms  "
+                    f"p99 {percentile(timings, 99) * 1000:6.1f}ms"
+                )
+
+    def run_wsgi(self, user, url, total, concurrency):
+        login = Client()
+        login.force_login(user)
+        local = threading.local()
+
+        def fetch(_):
+            # Client isn't thread-safe, so each worker thread gets its own
+            if not hasattr(local, "client"):
+                local.client = Client()
+                local.client.cookies = login.cookies
+            start = time.perf_counter()
+            response = local.client.get(url)
+            if response.status_code != 200:
+                raise CommandError(f"{url} returned {response.status_code}")
+            return time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            timings = list(pool.map(fetch, range(total)))
+        return time.perf_counter() - start, timings
+
+    def run_asgi(self, user, url, total, concurrency):
+        client = AsyncClient()
+        client.force_login(user)
+
+        async def fetch(semaphore):
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(url)
+                if response.status_code != 200:
+                    raise CommandError(f"{url} returned {response.status_code}")
+                return time.perf_counter() - start
+
+        async def run():
+            semaphore = asyncio.Semaphore(concurrency)
+            return await asyncio.gather(*(fetch(semaphore) for _ in range(total)))
+
+        start = time.perf_counter()
+        timings = asyncio.run(run())
+        return time.perf_counter() - start, timings
@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_system.images import ImageVariantError, VariantBuilder, variant_dirs
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate AVIF/WebP variants of the images in IMAGE_VARIANT_DIRS "
+        "at IMAGE_VARIANT_WIDTHS; unchanged images are skipped"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--widths", type=int, nargs="+", help="Override IMAGE_VARIANT_WIDTHS")
+        parser.add_argument("--force", action="store_true", help="Rebuild every image")
+
+    def handle(self, *args, **options):
+        if not variant_dirs():
+            raise CommandError("IMAGE_VARIANT_DIRS is empty")
+        start = time.perf_counter()
+        for source, output in variant_dirs():
+            try:
+                builder = VariantBuilder(
+                    source, output, widths=options["widths"], force=options["force"]
+                )
+            except ImageVariantError as e:
+                raise CommandError(str(e))
+            builder.run()
+            self.stdout.write(
+                f"{source}: {builder.built} built, {builder.skipped} unchanged "
+                f"({', '.join(fmt for fmt, _, _ in builder.formats)})"
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f"Image variants up to date in {time.perf_counter() - start:.2f}s"
+        ))
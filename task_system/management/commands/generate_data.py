@@ -0,0 +1,44 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_system.datagen import DataGenerator
+
+
+class Command(BaseCommand):
+    help = "Fill the database with synthetic positions, task types, workers, teams and tasks"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--positions", type=int, default=10)
+        parser.add_argument("--task-types", type=int, default=20)
+        parser.add_argument("--workers", type=int, default=1000)
+        parser.add_argument("--teams", type=int, default=100)
+        parser.add_argument("--tasks", type=int, default=50000)
+        parser.add_argument("--team-size", type=int, default=8, help="Workers per team")
+        parser.add_argument("--max-assignees", type=int, default=3)
+        parser.add_argument("--password", default="password123", help="Password of every generated worker")
+        parser.add_argument("--seed", type=int, help="Seed for reproducible data")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if options["workers"] and not options["positions"]:
+            raise CommandError("Workers need at least one position")
+        if options["tasks"] and not options["task_types"]:
+            raise CommandError("Tasks need at least one task type")
+
+        generator = DataGenerator(seed=options["seed"], batch_size=options["batch_size"])
+        start = time.perf_counter()
+        counts = generator.run(
+            positions=options["positions"],
+            task_types=options["task_types"],
+            workers=options["workers"],
+            teams=options["teams"],
+            tasks=options["tasks"],
+            team_size=options["team_size"],
+            max_assignees=options["max_assignees"],
+            password=options["password"],
+        )
+        elapsed = time.perf_counter() - start
+
+        summary = ", ".join(f"{count} {model}(s)" for model, count in counts.items())
+        self.stdout.write(self.style.SUCCESS(f"Created {summary} in {elapsed:.2f}s"))
@@ -0,0 +1,55 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from task_system.bulk_io import (
+    FORMATS,
+    BulkImportError,
+    Importer,
+    detect_format,
+    read_records,
+)
+
+
+class Command(BaseCommand):
+    help = "Stream tasks, teams or workers from a JSONL or CSV file into the database"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to read, '-' for stdin")
+        parser.add_argument(
+            "--model", choices=["task", "team", "worker"], default="task"
+        )
+        parser.add_argument("--format", choices=FORMATS)
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--auto-assign", action="store_true",
+            help="Give open team tasks without assignees to the least-loaded team member",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = detect_format(path, options["format"])
+        model = options["model"]
+        importer = Importer(
+            batch_size=options["batch_size"], auto_assign=options["auto_assign"]
+        )
+
+        start = time.perf_counter()
+        stream = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8")
+        try:
+            count = importer.run(model, read_records(stream, fmt, model))
+        # ValueError covers malformed JSON lines, IntegrityError rows that
+        # already exist (duplicate usernames, team names)
+        except (BulkImportError, KeyError, ValueError, IntegrityError) as e:
+            raise CommandError(f"Import failed: {e}")
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+        elapsed = time.perf_counter() - start
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {count} {model}(s) in {elapsed:.2f}s "
+            f"({count / max(elapsed, 1e-9):.0f} rows/s)"
+        ))
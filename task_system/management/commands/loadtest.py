@@ -0,0 +1,95 @@
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import override_settings
+from django.utils import timezone
+
+from task_system.loadtest import LoadTest, route_targets
+from task_system.models import Task, Team, Worker
+
+
+class Command(BaseCommand):
+    help = (
+        "Request every named task_system route at a given concurrency and "
+        "report latency percentiles, throughput and SQL queries per route"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--username", required=True, help="Existing user to log in as")
+        parser.add_argument("--requests", type=int, default=100, help="Requests per route")
+        parser.add_argument("--concurrency", type=int, default=4)
+        parser.add_argument("--routes", nargs="+", help="Only these route names")
+        parser.add_argument(
+            "--output-dir", default=settings.BASE_DIR / "loadtest_results",
+            help="Where the JSON results are saved",
+        )
+        parser.add_argument("--compare", help="Earlier results file to compare against")
+
+    def handle(self, *args, **options):
+        try:
+            user = get_user_model().objects.get(username=options["username"])
+        except get_user_model().DoesNotExist:
+            raise CommandError(f"No user '{options['username']}'")
+
+        targets = route_targets()
+        if options["routes"]:
+            targets = [(name, url) for name, url in targets if name in options["routes"]]
+        if not targets:
+            raise CommandError("No routes to test")
+
+        load_test = LoadTest(
+            user, requests=options["requests"], concurrency=options["concurrency"]
+        )
+        # the test client sends Host: testserver
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            routes = load_test.run(targets)
+
+        results = {
+            "started": timezone.now().isoformat(),
+            "database": connection.vendor,
+            "debug": settings.DEBUG,
+            "requests": options["requests"],
+            "concurrency": options["concurrency"],
+            "rows": {
+                "task": Task.objects.count(),
+                "team": Team.objects.count(),
+                "worker": Worker.objects.count(),
+            },
+            "routes": routes,
+        }
+        previous = None
+        if options["compare"]:
+            with open(options["compare"], encoding="utf-8") as f:
+                previous = json.load(f)["routes"]
+        self.report(routes, previous)
+
+        output_dir = Path(options["output_dir"])
+        output_dir.mkdir(parents=True, exist_ok=True)
+        path = output_dir / f"loadtest-{timezone.now():%Y%m%d-%H%M%S}.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Results saved to {path}"))
+
+    def report(self, routes, previous=None):
+        self.stdout.write(
+            f"{'route':20} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} "
+            f"{'queries':>8} {'errors':>7}"
+        )
+        for name, stats in routes.items():
+            line = (
+                f"{name:20} {stats['throughput']:8.1f} {stats['p50_ms']:8.1f} "
+                f"{stats['p95_ms']:8.1f} {stats['p99_ms']:8.1f} "
+                f"{stats['queries']:8d} {stats['errors']:7d}"
+            )
+            if previous and name in previous:
+                before = previous[name]
+                line += (
+                    f"  p95 {stats['p95_ms'] - before['p95_ms']:+.1f}ms"
+                    f"  queries {stats['queries'] - before['queries']:+d}"
+                )
+            style = self.style.ERROR if stats["errors"] else (lambda text: text)
+            self.stdout.write(style(line))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from task_system.search import fts_available, rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for tasks"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, **options):
+        database = options["database"]
+        if not fts_available(database):
+            raise CommandError(
+                f"Search index is not available on database '{database}'"
+            )
+        rebuild_index(database)
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt"))
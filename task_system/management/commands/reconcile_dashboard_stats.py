@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from task_system.stats import reconcile_dashboard_stats
+
+
+class Command(BaseCommand):
+    help = "Recount dashboard counters and correct any drift"
+
+    def handle(self, *args, **options):
+        drift = reconcile_dashboard_stats()
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("Dashboard stats are up to date"))
+            return
+        for name, delta in drift.items():
+            self.stdout.write(f"{name}: corrected by {delta:+d}")
+        self.stdout.write(self.style.SUCCESS("Dashboard stats reconciled"))
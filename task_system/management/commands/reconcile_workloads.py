@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from task_system.workload import reconcile_workloads
+
+
+class Command(BaseCommand):
+    help = "Recount open tasks per worker and correct any drift in the workload counters"
+
+    def handle(self, *args, **options):
+        drift = reconcile_workloads()
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("Workloads are up to date"))
+            return
+        for worker_id, (count, weight) in sorted(drift.items()):
+            self.stdout.write(f"worker {worker_id}: open tasks {count:+d}, weighted {weight:+d}")
+        self.stdout.write(self.style.SUCCESS(f"Workloads of {len(drift)} workers reconciled"))
@@ -0,0 +1,51 @@
+import signal
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from task_system.deadlines import ACTIONS, DeadlineScheduler
+
+
+class Command(BaseCommand):
+    help = (
+        "Flag tasks as overdue when their deadline passes, keeping upcoming "
+        "deadlines in memory instead of polling the task table"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--action", dest="actions", action="append",
+            help=f"Also run this action on overdue tasks ({', '.join(ACTIONS)} "
+                 "or a dotted path); overrides DEADLINE_ACTIONS, repeatable",
+        )
+        parser.add_argument("--horizon", type=int, help="Seconds of deadlines kept in memory")
+        parser.add_argument("--refresh", type=int, help="Seconds between reloads of the window")
+        parser.add_argument(
+            "--once", action="store_true",
+            help="Handle the tasks that are overdue now and exit (for cron)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            scheduler = DeadlineScheduler(
+                actions=options["actions"],
+                horizon=options["horizon"],
+                refresh=options["refresh"],
+            )
+        except ImproperlyConfigured as e:
+            raise CommandError(str(e))
+
+        if options["once"]:
+            scheduler.run_once(timezone.now().timestamp())
+        else:
+            signal.signal(signal.SIGTERM, lambda *args: scheduler.stop())
+            self.stdout.write(
+                f"Watching deadlines {scheduler.horizon}s ahead, "
+                f"reloading every {scheduler.refresh}s"
+            )
+            try:
+                scheduler.run()
+            except KeyboardInterrupt:
+                pass
+        self.stdout.write(self.style.SUCCESS(f"{scheduler.fired} tasks flagged as overdue"))
@@ -0,0 +1,21 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from task_system.db import REPLICA, sync_replica
+
+
+class Command(BaseCommand):
+    help = "Copy the primary SQLite database over the local read replica"
+
+    def handle(self, *args, **options):
+        if REPLICA not in settings.DATABASES:
+            raise CommandError(
+                f"No '{REPLICA}' database configured, use manage_task.settings_production"
+            )
+        start = time.perf_counter()
+        sync_replica()
+        self.stdout.write(self.style.SUCCESS(
+            f"Replica synced in {time.perf_counter() - start:.2f}s"
+        ))
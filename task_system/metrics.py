@@ -0,0 +1,91 @@
+"""
+In-process request histograms exposed in the Prometheus text format.
+
+Each worker process keeps its own numbers; Prometheus sums them when it
+scrapes every process. Nothing here needs a client library.
+"""
+import threading
+from bisect import bisect_left
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+# name -> (help text, buckets)
+METRICS = {
+    "request_duration_seconds": ("Total time spent handling the request", LATENCY_BUCKETS),
+    "view_duration_seconds": ("Time spent in the view and middleware, templates excluded", LATENCY_BUCKETS),
+    "template_duration_seconds": ("Time spent rendering TemplateResponses", LATENCY_BUCKETS),
+    "sql_duration_seconds": ("Time spent executing SQL", LATENCY_BUCKETS),
+    "sql_queries": ("SQL queries per request", QUERY_BUCKETS),
+}
+PREFIX = "task_system_"
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Registry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        # (metric, route) -> Histogram
+        self.histograms = {}
+
+    def observe(self, route, values):
+        with self.lock:
+            for metric, value in values.items():
+                histogram = self.histograms.get((metric, route))
+                if histogram is None:
+                    histogram = self.histograms[(metric, route)] = Histogram(
+                        METRICS[metric][1]
+                    )
+                histogram.observe(value)
+
+    def clear(self):
+        with self.lock:
+            self.histograms.clear()
+
+    def render(self):
+        lines = []
+        with self.lock:
+            for metric, (help_text, buckets) in METRICS.items():
+                name = PREFIX + metric
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for (hist_metric, route), histogram in sorted(self.histograms.items()):
+                    if hist_metric != metric:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip((*buckets, "+Inf"), histogram.counts):
+                        cumulative += count
+                        lines.append(
+                            f'{name}_bucket{{route="{route}",le="{bound}"}} {cumulative}'
+                        )
+                    lines.append(f'{name}_sum{{route="{route}"}} {histogram.sum}')
+                    lines.append(f'{name}_count{{route="{route}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+def metrics_view(request):
+    """Prometheus scrape target, open to METRICS_ALLOWED_IPS and staff users."""
+    allowed_ips = getattr(settings, "METRICS_ALLOWED_IPS", [])
+    if request.META.get("REMOTE_ADDR") not in allowed_ips and not request.user.is_staff:
+        return HttpResponseForbidden()
+    return HttpResponse(
+        registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -0,0 +1,137 @@
+import logging
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from task_system.metrics import registry
+
+logger = logging.getLogger("task_system.metrics")
+
+# the recorder of the current request; a ContextVar rather than a
+# per-request execute_wrapper so queries that async views run through
+# sync_to_async, in another thread, are still counted
+_recorder = ContextVar("query_recorder", default=None)
+
+
+def record_query(execute, sql, params, many, context):
+    recorder = _recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """connection_created receiver."""
+    if record_query not in connection.execute_wrappers:
+        # first, so an execute_wrapper() block open right now still pops
+        # its own wrapper on exit
+        connection.execute_wrappers.insert(0, record_query)
+
+
+class QueryRecorder:
+    """execute_wrapper that times every query, with or without DEBUG."""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((sql, time.perf_counter() - start))
+
+    @property
+    def duration(self):
+        return sum(duration for _, duration in self.queries)
+
+
+class RequestMetricsMiddleware:
+    """
+    Times SQL, template rendering and the view for every request, sends
+    the numbers back in a Server-Timing header and records them per URL
+    name in task_system.metrics. Requests over METRICS_SLOW_REQUEST_MS or
+    METRICS_SLOW_QUERY_COUNT log their SQL.
+
+    Only TemplateResponses are timed separately; a view that calls
+    render() has its template time counted as view time.
+
+    Runs sync or async, whichever the handler is, so under ASGI it
+    doesn't push the rest of the chain into a thread.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.slow_ms = getattr(settings, "METRICS_SLOW_REQUEST_MS", 500)
+        self.slow_queries = getattr(settings, "METRICS_SLOW_QUERY_COUNT", 50)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        recorder = QueryRecorder()
+        request._template_duration = 0
+        token = _recorder.set(recorder)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _recorder.reset(token)
+        return self.observe(request, response, recorder, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        recorder = QueryRecorder()
+        request._template_duration = 0
+        token = _recorder.set(recorder)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _recorder.reset(token)
+        return self.observe(request, response, recorder, time.perf_counter() - start)
+
+    def observe(self, request, response, recorder, total):
+        match = request.resolver_match
+        route = match.view_name if match else "unresolved"
+        template = request._template_duration
+        sql = recorder.duration
+        registry.observe(route, {
+            "request_duration_seconds": total,
+            "view_duration_seconds": total - template,
+            "template_duration_seconds": template,
+            "sql_duration_seconds": sql,
+            "sql_queries": len(recorder.queries),
+        })
+        response["Server-Timing"] = ", ".join([
+            f'sql;dur={sql * 1000:.1f};desc="{len(recorder.queries)} queries"',
+            f"tpl;dur={template * 1000:.1f}",
+            f"view;dur={(total - template) * 1000:.1f}",
+            f"total;dur={total * 1000:.1f}",
+        ])
+
+        if total * 1000 > self.slow_ms or len(recorder.queries) > self.slow_queries:
+            logger.warning(
+                "Slow request %s %s (%s): %.0fms, %d queries in %.0fms\n%s",
+                request.method, request.path, route, total * 1000,
+                len(recorder.queries), sql * 1000,
+                "\n".join(
+                    f"  {duration * 1000:7.1f}ms  {sql}"
+                    for sql, duration in recorder.queries
+                ),
+            )
+        return response
+
+    def process_template_response(self, request, response):
+        # runs right before the response is rendered; the callback right after
+        start = time.perf_counter()
+
+        def rendered(response):
+            request._template_duration += time.perf_counter() - start
+
+        response.add_post_render_callback(rendered)
+        return response
@@ -0,0 +1,67 @@
+from django.db import migrations
+
+
+CREATE_SQL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS task_system_task_fts USING fts5(
+        name,
+        description,
+        content='task_system_task',
+        content_rowid='id',
+        prefix='2 3',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_system_task_fts_ai
+    AFTER INSERT ON task_system_task BEGIN
+        INSERT INTO task_system_task_fts(rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_system_task_fts_ad
+    AFTER DELETE ON task_system_task BEGIN
+        INSERT INTO task_system_task_fts(task_system_task_fts, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_system_task_fts_au
+    AFTER UPDATE OF name, description ON task_system_task BEGIN
+        INSERT INTO task_system_task_fts(task_system_task_fts, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+        INSERT INTO task_system_task_fts(rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    "INSERT INTO task_system_task_fts(task_system_task_fts) VALUES ('rebuild')",
+]
+
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS task_system_task_fts_ai",
+    "DROP TRIGGER IF EXISTS task_system_task_fts_ad",
+    "DROP TRIGGER IF EXISTS task_system_task_fts_au",
+    "DROP TABLE IF EXISTS task_system_task_fts",
+]
+
+
+def run_sqlite(statements):
+    def operation(apps, schema_editor):
+        # FTS5 only exists on SQLite, other backends fall back to icontains
+        if schema_editor.connection.vendor != "sqlite":
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_system", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(run_sqlite(CREATE_SQL), run_sqlite(DROP_SQL)),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task_system', '0002_task_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('num_workers', models.IntegerField(default=0)),
+                ('num_tasks', models.IntegerField(default=0)),
+                ('num_completed_tasks', models.IntegerField(default=0)),
+                ('num_type_tasks', models.IntegerField(default=0)),
+                ('num_position', models.IntegerField(default=0)),
+            ],
+        ),
+    ]
@@ -0,0 +1,60 @@
+from django.db import migrations, models
+
+RANKS = {"urgent": 3, "high": 2, "low": 1}
+
+
+def labels_to_ranks(apps, schema_editor):
+    Task = apps.get_model("task_system", "Task")
+    for label, rank in RANKS.items():
+        Task.objects.filter(priority=label).update(priority_rank=rank)
+
+
+def ranks_to_labels(apps, schema_editor):
+    Task = apps.get_model("task_system", "Task")
+    for label, rank in RANKS.items():
+        Task.objects.filter(priority_rank=rank).update(priority=label)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_system", "0003_dashboardstats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="priority_rank",
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.RunPython(labels_to_ranks, ranks_to_labels),
+        migrations.RemoveField(
+            model_name="task",
+            name="priority",
+        ),
+        migrations.RenameField(
+            model_name="task",
+            old_name="priority_rank",
+            new_name="priority",
+        ),
+        migrations.AlterField(
+            model_name="task",
+            name="priority",
+            field=models.PositiveSmallIntegerField(
+                choices=[(3, "Urgent"), (2, "High"), (1, "Low")], default=1
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["is_complete", "-priority", "deadline", "id"],
+                name="task_list_order_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["is_complete", "deadline"], name="task_deadline_idx"
+            ),
+        ),
+    ]
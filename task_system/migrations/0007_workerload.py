@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:31
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, Sum
+
+
+def count_workloads(apps, schema_editor):
+    Task = apps.get_model("task_system", "Task")
+    WorkerLoad = apps.get_model("task_system", "WorkerLoad")
+    rows = Task.assignees.through.objects.filter(task__is_complete=False).values(
+        "worker_id"
+    ).annotate(open_tasks=Count("id"), weighted_load=Sum("task__priority")).order_by()
+    WorkerLoad.objects.bulk_create(
+        [WorkerLoad(**row) for row in rows.iterator()], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task_system', '0006_task_deadlines'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkerLoad',
+            fields=[
+                ('worker', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='load', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('open_tasks', models.IntegerField(default=0)),
+                ('weighted_load', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(count_workloads, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-18 13:08
+
+from django.db import migrations, models
+import task_system.search
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task_system', '0008_updated_at'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='worker',
+            name='worker_username_lower_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='worker',
+            name='worker_first_name_lower_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='worker',
+            name='worker_last_name_lower_idx',
+        ),
+        migrations.AddIndex(
+            model_name='worker',
+            index=models.Index(task_system.search.Fold('username'), name='worker_username_fold_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='worker',
+            index=models.Index(task_system.search.Fold('first_name'), name='worker_first_name_fold_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='worker',
+            index=models.Index(task_system.search.Fold('last_name'), name='worker_last_name_fold_idx'),
+        ),
+    ]
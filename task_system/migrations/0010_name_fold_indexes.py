@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-18 13:17
+
+from django.db import migrations, models
+import task_system.search
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task_system', '0009_worker_lookup_fold_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='position',
+            index=models.Index(task_system.search.Fold('name'), name='position_name_fold_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tasktype',
+            index=models.Index(task_system.search.Fold('name'), name='tasktype_name_fold_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='team',
+            index=models.Index(task_system.search.Fold('name'), name='team_name_fold_idx'),
+        ),
+    ]
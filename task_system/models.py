@@ -2,6 +2,8 @@ from django.contrib.auth.models import AbstractUser, User
 from django.db import models
 from django.urls import reverse
 
+from task_system.search import Fold
+
 
 class TaskType(models.Model):
     name = models.CharField(max_length=255, unique=True)
@@ -11,11 +13,16 @@ class TaskType(models.Model):
 
     class Meta:
         ordering = ['name']
+        # case-insensitive admin search and autocomplete (prefix_search)
+        indexes = [models.Index(Fold("name"), name="tasktype_name_fold_idx")]
 
 
 class Position(models.Model):
     name = models.CharField(max_length=255, unique=True)
 
+    class Meta:
+        indexes = [models.Index(Fold("name"), name="position_name_fold_idx")]
+
     def __str__(self):
             return self.name
 
@@ -30,6 +37,16 @@ class Worker(AbstractUser):
     email = models.EmailField(max_length=255, unique=True)
     first_name = models.CharField(max_length=255)
     last_name = models.CharField(max_length=255)
+    # conditional GET validators (task_system.conditional) use the max
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta(AbstractUser.Meta):
+        # prefix lookups for the worker picker are range scans on these
+        indexes = [
+            models.Index(Fold("username"), name="worker_username_fold_idx"),
+            models.Index(Fold("first_name"), name="worker_first_name_fold_idx"),
+            models.Index(Fold("last_name"), name="worker_last_name_fold_idx"),
+        ]
 
     def __str__(self):
         return (
@@ -43,6 +60,10 @@ class Team(models.Model):
     name = models.CharField(max_length=255, unique=True)
     description = models.TextField()
     workers = models.ManyToManyField(Worker, related_name="teams")
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        indexes = [models.Index(Fold("name"), name="team_name_fold_idx")]
 
     def __str__(self):
         return self.name
@@ -52,16 +73,18 @@ class Team(models.Model):
 
 
 class Task(models.Model):
-    class Priority(models.TextChoices):
-        URGENT = "urgent", "Urgent"
-        HIGH = "high", "High"
-        LOW = "low", "Low"
+    class Priority(models.IntegerChoices):
+        # stored as a rank so "-priority" sorts by urgency
+        URGENT = 3, "Urgent"
+        HIGH = 2, "High"
+        LOW = 1, "Low"
     name = models.CharField(max_length=255)
     description = models.TextField()
     deadline = models.DateTimeField()
     is_complete = models.BooleanField(default=False)
-    priority = models.CharField(
-        max_length=10,
+    # set by the deadline scheduler (task_system.deadlines) once handled
+    is_overdue = models.BooleanField(default=False, editable=False)
+    priority = models.PositiveSmallIntegerField(
         choices=Priority.choices,
         default=Priority.LOW,
     )
@@ -74,6 +97,29 @@ class Task(models.Model):
         blank=True,
         related_name='tasks'
     )
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        indexes = [
+            # matches the default TaskListView ordering
+            models.Index(
+                fields=["is_complete", "-priority", "deadline", "id"],
+                name="task_list_order_idx",
+            ),
+            models.Index(
+                fields=["is_complete", "deadline"],
+                name="task_deadline_idx",
+            ),
+            # only the tasks the deadline scheduler still has to act on
+            models.Index(
+                fields=["deadline"],
+                condition=models.Q(is_complete=False, is_overdue=False),
+                name="task_due_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return self.name
 
     def priority_badge_class(self):
         return {
@@ -81,3 +127,52 @@ class Task(models.Model):
             self.Priority.HIGH: "priority-high",
             self.Priority.LOW: "priority-low",
         }.get(self.priority, "priority-low")
+
+
+class Notification(models.Model):
+    class Kind(models.TextChoices):
+        OVERDUE = "overdue", "Overdue"
+
+    worker = models.ForeignKey(
+        Worker, on_delete=models.CASCADE, related_name="notifications"
+    )
+    task = models.ForeignKey(
+        Task, on_delete=models.CASCADE, related_name="notifications"
+    )
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    created_at = models.DateTimeField(auto_now_add=True)
+    is_read = models.BooleanField(default=False)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["worker", "is_read"], name="notification_unread_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()}: {self.task.name}"
+
+
+class WorkerLoad(models.Model):
+    """Open tasks per worker, kept up to date by task_system.workload."""
+    worker = models.OneToOneField(
+        Worker, on_delete=models.CASCADE, primary_key=True, related_name="load"
+    )
+    open_tasks = models.IntegerField(default=0)
+    # open tasks weighted by Task.Priority
+    weighted_load = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.worker.username}: {self.open_tasks} open tasks"
+
+
+class DashboardStats(models.Model):
+    """Precomputed counters for the index page, kept up to date by signals."""
+    num_workers = models.IntegerField(default=0)
+    num_tasks = models.IntegerField(default=0)
+    num_completed_tasks = models.IntegerField(default=0)
+    num_type_tasks = models.IntegerField(default=0)
+    num_position = models.IntegerField(default=0)
+
+    def __str__(self):
+        return "Dashboard stats"
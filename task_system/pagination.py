@@ -0,0 +1,286 @@
+import base64
+import datetime
+import hashlib
+import json
+
+from asgiref.sync import sync_to_async
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q, QuerySet
+from django.http import Http404
+from django.utils.functional import cached_property
+
+from task_system.db import estimated_row_count
+from task_system.fragment_cache import get_fragment_cache, get_versions
+
+COUNT_KEY = "list-count:{}:{}:{}"
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    # DjangoJSONEncoder cuts datetimes to milliseconds, and a cursor that
+    # sorts before its own row would bring the row back on the next page
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class CursorPage:
+    def __init__(self, object_list, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    Keyset pagination: every page is a range scan starting right after
+    the last row of the previous page, so page N costs the same as page 1
+    and no COUNT(*) is needed. ``ordering`` must end with a unique field.
+    """
+
+    def __init__(self, queryset, ordering, per_page):
+        self.queryset = queryset
+        self.ordering = [
+            (field.lstrip("-"), field.startswith("-")) for field in ordering
+        ]
+        self.per_page = per_page
+
+    def encode_cursor(self, obj, backwards):
+        values = [getattr(obj, name) for name, _ in self.ordering]
+        raw = json.dumps([backwards, values], cls=CursorEncoder)
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            backwards, values = json.loads(base64.urlsafe_b64decode(cursor))
+            if len(values) != len(self.ordering):
+                raise ValueError
+            model = self.queryset.model
+            values = [
+                model._meta.get_field(name).to_python(value)
+                for (name, _), value in zip(self.ordering, values)
+            ]
+        except Exception as e:
+            raise InvalidCursor(cursor) from e
+        return bool(backwards), values
+
+    def keyset_filter(self, values, backwards):
+        # (a, b, c) > (x, y, z) spelled out so each column can have its
+        # own direction: a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)
+        condition = Q()
+        equal = Q()
+        for (name, descending), value in zip(self.ordering, values):
+            lookup = "lt" if descending != backwards else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def page_queryset(self, cursor=None):
+        backwards = False
+        queryset = self.queryset
+        if cursor:
+            backwards, values = self.decode_cursor(cursor)
+            queryset = queryset.filter(self.keyset_filter(values, backwards))
+
+        order_by = [
+            f"-{name}" if descending != backwards else name
+            for name, descending in self.ordering
+        ]
+        return queryset.order_by(*order_by)[:self.per_page + 1], backwards
+
+    def build_page(self, rows, cursor, backwards):
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if backwards:
+            rows.reverse()
+
+        if not rows:
+            return CursorPage(rows, None, None)
+
+        has_next = has_more if not backwards else True
+        has_previous = has_more if backwards else bool(cursor)
+        return CursorPage(
+            rows,
+            self.encode_cursor(rows[-1], False) if has_next else None,
+            self.encode_cursor(rows[0], True) if has_previous else None,
+        )
+
+    def page(self, cursor=None):
+        queryset, backwards = self.page_queryset(cursor)
+        return self.build_page(list(queryset), cursor, backwards)
+
+    async def apage(self, cursor=None):
+        queryset, backwards = self.page_queryset(cursor)
+        return self.build_page([obj async for obj in queryset], cursor, backwards)
+
+
+class CursorPaginationMixin:
+    """
+    Switches a ListView to keyset pagination when ``pagination_mode`` is
+    "cursor" (defaults to settings.LIST_PAGINATION_MODE) or when the
+    request carries a ``cursor`` parameter.
+    """
+    pagination_mode = None
+    cursor_ordering = None
+
+    def use_cursor_pagination(self):
+        mode = self.pagination_mode or getattr(
+            settings, "LIST_PAGINATION_MODE", "offset"
+        )
+        return mode == "cursor" or "cursor" in self.request.GET
+
+    def get_cursor_ordering(self):
+        return self.cursor_ordering or self.get_ordering()
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.use_cursor_pagination():
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = CursorPaginator(
+            queryset, self.get_cursor_ordering(), page_size
+        )
+        try:
+            page = paginator.page(self.request.GET.get("cursor"))
+        except InvalidCursor:
+            raise Http404("Invalid cursor")
+        self.cursor_page = page
+        return None, page, page.object_list, False
+
+    def cursor_querystring(self, cursor):
+        params = self.request.GET.copy()
+        params.pop("page", None)
+        params["cursor"] = cursor
+        return params.urlencode()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        page = getattr(self, "cursor_page", None)
+        if page is not None:
+            context["cursor_page"] = page
+            if page.has_next():
+                context["next_querystring"] = self.cursor_querystring(
+                    page.next_cursor
+                )
+            if page.has_previous():
+                context["previous_querystring"] = self.cursor_querystring(
+                    page.previous_cursor
+                )
+        return context
+
+
+def table_estimate(queryset):
+    """Estimated row count of an unfiltered queryset, else None."""
+    if isinstance(queryset, QuerySet) and not queryset.query.where:
+        return estimated_row_count(queryset.model, queryset.db)
+    return None
+
+
+def count_cache_key(queryset):
+    # the model's fragment version is bumped by every write path, which
+    # makes counts cached before the write unreachable
+    sql, params = queryset.query.sql_with_params()
+    digest = hashlib.md5(f"{sql}{params!r}".encode()).hexdigest()
+    version = get_versions(queryset.model._meta.model_name)
+    return COUNT_KEY.format(queryset.db, version, digest)
+
+
+def count_timeout():
+    return getattr(settings, "LIST_COUNT_CACHE_TIMEOUT", 300)
+
+
+def cached_count(queryset):
+    """Exact count of the queryset, cached until the model's next write."""
+    cache = get_fragment_cache()
+    key = count_cache_key(queryset)
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, count_timeout())
+    return count
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Uses the table size estimate for the count of an unfiltered
+    queryset; filtered ones are still counted exactly. Past the real end
+    the last pages are simply empty.
+    """
+
+    @cached_property
+    def count(self):
+        estimate = table_estimate(self.object_list)
+        if estimate is not None:
+            return estimate
+        return super().count
+
+
+class ApproximateCountPaginator(Paginator):
+    """
+    Counts for the public list pages without a COUNT(*) per request.
+
+    Unfiltered tables of at least APPROXIMATE_COUNT_THRESHOLD rows use the
+    table size estimate and set ``is_approximate``. Smaller tables and
+    filtered lists are counted exactly, once per write: exact counts are
+    cached under the model's fragment version.
+    """
+    is_approximate = False
+
+    def approximate_count(self, estimate):
+        threshold = getattr(settings, "APPROXIMATE_COUNT_THRESHOLD", 10000)
+        if estimate is not None and estimate >= threshold:
+            self.is_approximate = True
+            return estimate
+        return None
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet):
+            return super().count
+        cache = get_fragment_cache()
+        key = count_cache_key(queryset)
+        count = cache.get(key)
+        if count is None:
+            count = self.approximate_count(table_estimate(queryset))
+            if count is None:
+                count = queryset.count()
+                cache.set(key, count, count_timeout())
+        return count
+
+    async def acount(self):
+        """Async counterpart of ``count``; seeds it for page()."""
+        queryset = self.object_list
+        cache = get_fragment_cache()
+        key = await sync_to_async(count_cache_key)(queryset)
+        count = await cache.aget(key)
+        if count is None:
+            count = self.approximate_count(
+                await sync_to_async(table_estimate)(queryset)
+            )
+            if count is None:
+                count = await queryset.acount()
+                await cache.aset(key, count, count_timeout())
+        self.__dict__["count"] = count
+        return count
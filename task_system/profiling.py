@@ -0,0 +1,155 @@
+"""
+Opt-in cProfile runs of single requests.
+
+With PROFILING_ENABLED on, a request is profiled when a staff user adds
+``?profile`` to the URL or when it is picked by PROFILING_SAMPLE_RATE.
+Each run is saved to PROFILING_DIR as a pstats file (open it with
+``python -m pstats`` or snakeviz) next to a small JSON file describing
+the request; only the newest PROFILING_KEEP runs are kept.
+"""
+import cProfile
+import io
+import json
+import pstats
+import random
+import re
+import threading
+import time
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.utils import timezone
+
+UNSAFE_CHARS = re.compile(r"[^\w.-]")
+
+# one profiler at a time: on 3.12+ cProfile is interpreter-wide and a
+# second enable() raises, on 3.11 it silently takes over the first
+_profiler_lock = threading.Lock()
+
+
+def profile_dir():
+    return Path(getattr(settings, "PROFILING_DIR", settings.BASE_DIR / "profiles"))
+
+
+def list_profiles(limit=100):
+    """Metadata of the newest saved profiles, newest first."""
+    profiles = []
+    for path in sorted(profile_dir().glob("*.json"), reverse=True)[:limit]:
+        with open(path, encoding="utf-8") as f:
+            profiles.append(json.load(f))
+    return profiles
+
+
+def profile_path(name):
+    """Path of a saved .prof file, or None for unknown or unsafe names."""
+    if UNSAFE_CHARS.search(name):
+        return None
+    path = profile_dir() / f"{name}.prof"
+    return path if path.exists() else None
+
+
+def format_stats(path, limit=40, sort="cumulative"):
+    out = io.StringIO()
+    pstats.Stats(str(path), stream=out).sort_stats(sort).print_stats(limit)
+    return out.getvalue()
+
+
+def prune_profiles(keep):
+    for meta in sorted(profile_dir().glob("*.json"), reverse=True)[keep:]:
+        meta.with_suffix(".prof").unlink(missing_ok=True)
+        meta.unlink(missing_ok=True)
+
+
+class ProfilingMiddleware:
+    """
+    Must come after AuthenticationMiddleware so the staff check works.
+
+    Sync and async capable. Under ASGI only the code run on the event
+    loop is profiled; queries the async views hand to sync_to_async run
+    in a worker thread and show up as waiting. The profiler stays on
+    across awaits, so an async profile also covers whatever else the
+    loop ran meanwhile; such runs are marked ``loop_wide``.
+
+    Only one request is profiled at a time; requests picked while a
+    profile is running are served unprofiled.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def should_profile(self, request):
+        if not getattr(settings, "PROFILING_ENABLED", False):
+            return False
+        if "profile" in request.GET and request.user.is_staff:
+            return True
+        return random.random() < getattr(settings, "PROFILING_SAMPLE_RATE", 0)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.should_profile(request):
+            return self.get_response(request)
+
+        if not _profiler_lock.acquire(blocking=False):
+            return self.get_response(request)
+        try:
+            profiler = cProfile.Profile()
+            start = time.perf_counter()
+            # covers the view and, for TemplateResponses, the template render
+            response = profiler.runcall(self.get_response, request)
+        finally:
+            _profiler_lock.release()
+        self.save(request, response, profiler, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self, request):
+        if "profile" in request.GET:
+            # request.user may still have to be loaded from the database
+            profile = await sync_to_async(self.should_profile)(request)
+        else:
+            profile = self.should_profile(request)
+        if not profile:
+            return await self.get_response(request)
+
+        # never blocks the loop: a busy profiler means no profile
+        if not _profiler_lock.acquire(blocking=False):
+            return await self.get_response(request)
+        try:
+            profiler = cProfile.Profile()
+            start = time.perf_counter()
+            profiler.enable()
+            try:
+                response = await self.get_response(request)
+            finally:
+                profiler.disable()
+        finally:
+            _profiler_lock.release()
+        await sync_to_async(self.save)(
+            request, response, profiler, time.perf_counter() - start, loop_wide=True
+        )
+        return response
+
+    def save(self, request, response, profiler, duration, loop_wide=False):
+        match = request.resolver_match
+        route = match.view_name if match else "unresolved"
+        name = f"{time.time_ns()}-{UNSAFE_CHARS.sub('_', route)}"
+        directory = profile_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(directory / f"{name}.prof")
+        with open(directory / f"{name}.json", "w", encoding="utf-8") as f:
+            json.dump({
+                "name": name,
+                "route": route,
+                "method": request.method,
+                "path": request.get_full_path(),
+                "status": response.status_code,
+                "duration_ms": round(duration * 1000, 1),
+                "loop_wide": loop_wide,
+                "created": timezone.now().isoformat(timespec="seconds"),
+            }, f)
+        prune_profiles(getattr(settings, "PROFILING_KEEP", 200))
@@ -0,0 +1,158 @@
+import re
+
+from django.db import connections
+from django.db.models import Func, Q
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = "task_system_task_fts"
+
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+TRIGGERS = {
+    f"{FTS_TABLE}_ai": f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai
+        AFTER INSERT ON task_system_task BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, name, description)
+            VALUES (new.id, new.name, new.description);
+        END
+    """,
+    f"{FTS_TABLE}_ad": f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad
+        AFTER DELETE ON task_system_task BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description)
+            VALUES ('delete', old.id, old.name, old.description);
+        END
+    """,
+    f"{FTS_TABLE}_au": f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au
+        AFTER UPDATE OF name, description ON task_system_task BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description)
+            VALUES ('delete', old.id, old.name, old.description);
+            INSERT INTO {FTS_TABLE}(rowid, name, description)
+            VALUES (new.id, new.name, new.description);
+        END
+    """,
+}
+
+FOLD_FUNCTION = "task_system_fold"
+
+
+def fold(value):
+    return None if value is None else value.lower()
+
+
+class Fold(Func):
+    """
+    LOWER() that also folds non-ASCII letters. SQLite's LOWER() only
+    folds A-Z, so there it calls fold() through a function registered on
+    every connection (register_fold_function); indexes built on it can't
+    be written to from connections without it, e.g. the sqlite3 shell.
+    """
+    function = "LOWER"
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, function=FOLD_FUNCTION, **extra_context)
+
+
+def register_fold_function(sender, connection, **kwargs):
+    """connection_created receiver."""
+    if connection.vendor == "sqlite":
+        # deterministic, or SQLite refuses it in an index expression
+        connection.connection.create_function(FOLD_FUNCTION, 1, fold, deterministic=True)
+
+
+# aliases where the index table was found, so we only introspect once
+_fts_aliases = set()
+
+
+def fts_available(using="default"):
+    if using in _fts_aliases:
+        return True
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return False
+    if FTS_TABLE in connection.introspection.table_names():
+        _fts_aliases.add(using)
+        return True
+    return False
+
+
+def build_match_query(search):
+    # every word is quoted so user input can't inject FTS syntax,
+    # and used as a prefix so results update on each keystroke
+    words = WORD_RE.findall(search)
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def search_tasks(queryset, search):
+    """Filter a Task queryset by name/description, best matches first."""
+    match = build_match_query(search)
+    if not match:
+        return queryset.none()
+
+    if not fts_available(queryset.db):
+        return queryset.filter(
+            Q(name__icontains=search) | Q(description__icontains=search)
+        )
+
+    table = queryset.model._meta.db_table
+    return queryset.filter(
+        id__in=RawSQL(
+            f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s",
+            (match,),
+        )
+    ).annotate(
+        search_rank=RawSQL(
+            f"SELECT rank FROM {FTS_TABLE} "
+            f"WHERE {FTS_TABLE} MATCH %s AND rowid = {table}.id",
+            (match,),
+        )
+    ).order_by("search_rank", "id")
+
+
+def prefix_search(queryset, fields, search, lower=False):
+    """
+    Rows where any of ``fields`` starts with ``search``. col >= q AND
+    col < q + U+FFFF is a range scan on the field's index, unlike LIKE;
+    with ``lower`` it compares Fold(col), for functional indexes.
+    """
+    search = search.strip()
+    if not search:
+        return queryset
+    if lower:
+        search = fold(search)
+        queryset = queryset.alias(**{f"{field}_lower": Fold(field) for field in fields})
+        fields = [f"{field}_lower" for field in fields]
+    end = search + "\uffff"
+    condition = Q()
+    for field in fields:
+        condition |= Q(**{f"{field}__gte": search, f"{field}__lt": end})
+    return queryset.filter(condition)
+
+
+def ensure_index_triggers(using="default", **kwargs):
+    """
+    SQLite rebuilds a table for most ALTERs and its triggers go with it,
+    so they are recreated (and the index resynced) after every migrate.
+    """
+    if not fts_available(using):
+        return
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' "
+            "AND tbl_name = 'task_system_task'"
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+        missing = [sql for name, sql in TRIGGERS.items() if name not in existing]
+        for sql in missing:
+            cursor.execute(sql)
+    if missing:
+        rebuild_index(using)
+
+
+def rebuild_index(using="default"):
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+        )
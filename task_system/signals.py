@@ -0,0 +1,231 @@
+from django.contrib.auth.signals import user_logged_out
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_init,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from task_system.auth import forget_user
+from task_system.fragment_cache import bump_version
+from task_system.m2m import m2m_synced
+from task_system.models import Position, Task, TaskType, Team, Worker
+from task_system.stats import adjust_dashboard_stats
+from task_system.workload import (
+    Assignment,
+    adjust_workloads,
+    assignment_deltas,
+)
+
+COUNTERS = {
+    Worker: "num_workers",
+    Task: "num_tasks",
+    TaskType: "num_type_tasks",
+    Position: "num_position",
+}
+
+
+@receiver(post_init, sender=Task)
+def remember_task_state(sender, instance, **kwargs):
+    # lets post_save see whether is_complete flipped without a query;
+    # read from __dict__ so a deferred field isn't loaded just for this
+    instance._loaded_is_complete = instance.__dict__.get("is_complete")
+    instance._loaded_priority = instance.__dict__.get("priority")
+
+
+@receiver(pre_save, sender=Task)
+def clear_overdue_flag(sender, instance, **kwargs):
+    # a deadline moved into the future hands the task back to the scheduler
+    if instance.is_overdue and instance.deadline > timezone.now():
+        instance.is_overdue = False
+
+
+def track_task_workloads(sender, instance, created, **kwargs):
+    was_complete = instance._loaded_is_complete
+    old_priority = instance._loaded_priority
+    instance._loaded_priority = instance.priority
+    # a new task has no assignees yet; a deferred field means an
+    # unknown change, left to reconcile_workloads
+    if created or was_complete is None or old_priority is None:
+        return
+    if was_complete != instance.is_complete:
+        # completing takes the old priority off, reopening adds the new one
+        delta = (-1, -old_priority) if instance.is_complete else (1, instance.priority)
+    elif not instance.is_complete and old_priority != instance.priority:
+        delta = (0, instance.priority - old_priority)
+    else:
+        return
+    worker_ids = Assignment.objects.filter(task_id=instance.pk).values_list(
+        "worker_id", flat=True
+    )
+    adjust_workloads(dict.fromkeys(worker_ids, delta))
+
+
+@receiver(pre_delete, sender=Task)
+def release_task_workloads(sender, instance, **kwargs):
+    if not instance.is_complete:
+        worker_ids = Assignment.objects.filter(task_id=instance.pk).values_list(
+            "worker_id", flat=True
+        )
+        adjust_workloads(assignment_deltas(
+            ((worker_id, instance.priority) for worker_id in worker_ids), -1
+        ))
+
+
+@receiver(m2m_changed, sender=Task.assignees.through)
+def track_assignee_workloads(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear":
+        # the cleared rows are gone by post_clear
+        instance._cleared_assignments = list(
+            Assignment.objects.filter(
+                **{"worker_id" if reverse else "task_id": instance.pk},
+                task__is_complete=False,
+            ).values_list("worker_id", "task__priority")
+        )
+        return
+    if action == "post_clear":
+        adjust_workloads(assignment_deltas(instance._cleared_assignments, -1))
+        return
+    if action not in ("post_add", "post_remove") or not pk_set:
+        return
+    sign = 1 if action == "post_add" else -1
+    if reverse:
+        # a worker gained or lost tasks
+        priorities = Task.objects.filter(
+            pk__in=pk_set, is_complete=False
+        ).values_list("priority", flat=True)
+        pairs = ((instance.pk, priority) for priority in priorities)
+    elif instance.is_complete:
+        return
+    else:
+        pairs = ((worker_id, instance.priority) for worker_id in pk_set)
+    adjust_workloads(assignment_deltas(pairs, sign))
+
+
+@receiver(m2m_synced, sender=Task.assignees.through)
+def track_synced_workloads(sender, instance, added, removed, **kwargs):
+    if isinstance(instance, Task) and not instance.is_complete:
+        adjust_workloads({
+            **assignment_deltas((worker_id, instance.priority) for worker_id in added),
+            **assignment_deltas(
+                ((worker_id, instance.priority) for worker_id in removed), -1
+            ),
+        })
+
+
+def count_created(sender, instance, created, **kwargs):
+    deltas = {}
+    if created:
+        deltas[COUNTERS[sender]] = 1
+    if sender is Task:
+        was_complete = False if created else instance._loaded_is_complete
+        if was_complete is not None:
+            deltas["num_completed_tasks"] = instance.is_complete - was_complete
+        instance._loaded_is_complete = instance.is_complete
+    adjust_dashboard_stats(**deltas)
+
+
+def count_deleted(sender, instance, **kwargs):
+    deltas = {COUNTERS[sender]: -1}
+    if sender is Task and instance._loaded_is_complete:
+        deltas["num_completed_tasks"] = -1
+    adjust_dashboard_stats(**deltas)
+
+
+FRAGMENT_MODELS = {
+    Task: "task",
+    Team: "team",
+    Worker: "worker",
+    TaskType: "tasktype",
+    Position: "position",
+}
+
+
+def bump_fragment_version(sender, update_fields=None, **kwargs):
+    # every login saves last_login, which no cached fragment shows
+    if sender is Worker and update_fields == frozenset({"last_login"}):
+        return
+    bump_version(FRAGMENT_MODELS[sender])
+
+
+@receiver(m2m_changed, sender=Task.assignees.through)
+def bump_task_fragments(sender, action, **kwargs):
+    if action.startswith("post_"):
+        bump_version("task")
+
+
+@receiver(m2m_changed, sender=Team.workers.through)
+def bump_team_fragments(sender, action, **kwargs):
+    if action.startswith("post_"):
+        bump_version("team")
+
+
+@receiver(m2m_synced, sender=Task.assignees.through)
+def bump_synced_task_fragments(sender, **kwargs):
+    bump_version("task")
+
+
+@receiver(m2m_synced, sender=Team.workers.through)
+def bump_synced_team_fragments(sender, **kwargs):
+    bump_version("team")
+
+
+# the m2m rows are shown on the owner's pages, so changing them counts
+# as a change of the owner for its updated_at
+M2M_OWNERS = {
+    Task.assignees.through: (Task, "assignees"),
+    Team.workers.through: (Team, "workers"),
+}
+
+
+def touch(queryset):
+    queryset.update(updated_at=timezone.now())
+
+
+def touch_m2m_owners(sender, instance, action, reverse, pk_set, **kwargs):
+    owner, field_name = M2M_OWNERS[sender]
+    if not reverse:
+        if action.startswith("post_"):
+            touch(owner.objects.filter(pk=instance.pk))
+    elif action == "pre_clear":
+        # a worker losing all tasks/teams: touched while the rows exist
+        touch(owner.objects.filter(**{field_name: instance.pk}))
+    elif action in ("post_add", "post_remove") and pk_set:
+        touch(owner.objects.filter(pk__in=pk_set))
+
+
+def touch_synced_owners(sender, instance, added, removed, **kwargs):
+    owner, _ = M2M_OWNERS[sender]
+    if isinstance(instance, owner):
+        touch(owner.objects.filter(pk=instance.pk))
+    else:
+        touch(owner.objects.filter(pk__in=added | removed))
+
+
+@receiver(user_logged_out)
+def forget_logged_out_user(sender, request, **kwargs):
+    # Worker saves already retire snapshots through the "worker" version
+    if request is not None:
+        forget_user(request)
+
+
+# before count_created, which moves _loaded_is_complete on
+post_save.connect(track_task_workloads, sender=Task)
+
+# connected per model rather than to every sender, so deletes of other
+# models (e.g. m2m through rows) can still use Django's fast delete path
+for model in COUNTERS:
+    post_save.connect(count_created, sender=model)
+    post_delete.connect(count_deleted, sender=model)
+
+for model in FRAGMENT_MODELS:
+    post_save.connect(bump_fragment_version, sender=model)
+    post_delete.connect(bump_fragment_version, sender=model)
+
+for through in M2M_OWNERS:
+    m2m_changed.connect(touch_m2m_owners, sender=through)
+    m2m_synced.connect(touch_synced_owners, sender=through)
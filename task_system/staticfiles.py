@@ -0,0 +1,211 @@
+"""
+Static file pipeline for production (see settings_production).
+
+collectstatic writes content-hashed copies of every file, minifies the
+CSS and JS that isn't already minified and stores .gz (and, when the
+``brotli`` package is installed, .br) siblings of everything
+compressible. StaticFilesMiddleware then serves the best encoding the
+client accepts, with a one year immutable Cache-Control for hashed
+names, so repeat visits never revalidate assets.
+"""
+import gzip
+import mimetypes
+import os
+import re
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib.staticfiles.apps import StaticFilesConfig as BaseStaticFilesConfig
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+from django.http import FileResponse, Http404
+from django.utils._os import safe_join
+from django.utils.http import http_date
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+COMPRESSIBLE = {
+    ".css", ".js", ".svg", ".json", ".map", ".txt", ".html", ".xml",
+    ".ttf", ".otf", ".eot", ".ico",
+}
+# (suffix, Content-Encoding), best first
+ENCODINGS = [(".br", "br"), (".gz", "gzip")]
+# a compressed copy must save at least this fraction to be kept
+MIN_SAVING = 0.05
+
+CSS_STRING = re.compile(r""""(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'""")
+CSS_COMMENT = re.compile(r"/\*(?!!).*?\*/", re.S)
+CSS_SPACE = re.compile(r"\s+")
+CSS_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+
+
+class StaticFilesConfig(BaseStaticFilesConfig):
+    # build inputs of the theme that must not end up in STATIC_ROOT
+    ignore_patterns = [
+        *BaseStaticFilesConfig.ignore_patterns,
+        "scss", "gulpfile.js", "package.json",
+    ]
+
+
+def minify_css(css):
+    """Whitespace/comment stripping that never changes selector meaning."""
+    css = CSS_COMMENT.sub("", css)
+    parts = []
+    position = 0
+    # quoted strings are copied untouched
+    for match in CSS_STRING.finditer(css):
+        parts.append(_minify_css_code(css[position:match.start()]))
+        parts.append(match.group())
+        position = match.end()
+    parts.append(_minify_css_code(css[position:]))
+    return "".join(parts).strip()
+
+
+def _minify_css_code(css):
+    css = CSS_SPACE.sub(" ", css)
+    css = CSS_PUNCTUATION.sub(r"\1", css)
+    return css.replace(";}", "}")
+
+
+def minify_js(js):
+    # without rjsmin there's no safe way to strip JS, so it's left as is
+    return rjsmin.jsmin(js) if rjsmin else js
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    minifiers = {".css": minify_css, ".js": minify_js}
+
+    def url_converter(self, name, hashed_files, template=None):
+        converter = super().url_converter(name, hashed_files, template)
+
+        def convert(matchobj):
+            # the theme references a few files it doesn't ship (source
+            # maps, fonts of an unused copy); leave those urls as they are
+            try:
+                return converter(matchobj)
+            except ValueError:
+                return matchobj["matched"]
+
+        return convert
+
+    def post_process(self, paths, dry_run=False, **options):
+        hashed_names = []
+        for name, hashed_name, processed in super().post_process(
+            paths, dry_run, **options
+        ):
+            if hashed_name and not isinstance(processed, Exception):
+                hashed_names.append(hashed_name)
+            yield name, hashed_name, processed
+        if dry_run:
+            return
+        for hashed_name in set(hashed_names):
+            self.minify(hashed_name)
+            self.compress(hashed_name)
+
+    def minify(self, name):
+        base, ext = os.path.splitext(name)
+        minifier = self.minifiers.get(ext)
+        if minifier is None or base.rsplit(".", 1)[0].endswith(".min"):
+            return
+        with self.open(name) as f:
+            source = f.read().decode("utf-8")
+        minified = minifier(source)
+        if minified != source:
+            self.delete(name)
+            self._save(name, ContentFile(minified.encode("utf-8")))
+
+    def compress(self, name):
+        if os.path.splitext(name)[1] not in COMPRESSIBLE:
+            return
+        with self.open(name) as f:
+            data = f.read()
+        compressors = {".gz": lambda d: gzip.compress(d, 9, mtime=0)}
+        if brotli:
+            compressors[".br"] = lambda d: brotli.compress(d, quality=11)
+        for suffix, compress in compressors.items():
+            compressed = compress(data)
+            if len(compressed) <= len(data) * (1 - MIN_SAVING):
+                if self.exists(name + suffix):
+                    self.delete(name + suffix)
+                self._save(name + suffix, ContentFile(compressed))
+
+
+class StaticFilesMiddleware:
+    """
+    Serves STATIC_ROOT under STATIC_URL without a separate web server.
+    Put it first in MIDDLEWARE so asset requests skip everything else.
+    Sync and async capable, so under ASGI the chain stays async.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefix = "/" + settings.STATIC_URL.lstrip("/")
+        self.root = str(settings.STATIC_ROOT)
+        self.hashed = None
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def hashed_names(self):
+        # names from the manifest are content-addressed and never change
+        if self.hashed is None:
+            from django.contrib.staticfiles.storage import staticfiles_storage
+
+            manifest = getattr(staticfiles_storage, "hashed_files", {})
+            self.hashed = set(manifest.values())
+        return self.hashed
+
+    def is_static(self, request):
+        return request.path.startswith(self.prefix) and request.method in ("GET", "HEAD")
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.is_static(request):
+            return self.get_response(request)
+        return self.serve(request, request.path[len(self.prefix):])
+
+    async def __acall__(self, request):
+        if not self.is_static(request):
+            return await self.get_response(request)
+        # a stat and an open; the file itself is streamed by the handler
+        return self.serve(request, request.path[len(self.prefix):])
+
+    def serve(self, request, name):
+        try:
+            path = safe_join(self.root, name)
+        except ValueError:
+            raise Http404
+        if not os.path.isfile(path):
+            raise Http404
+
+        accepted = request.headers.get("Accept-Encoding", "")
+        served_path, encoding = path, None
+        for suffix, candidate in ENCODINGS:
+            if candidate in accepted and os.path.isfile(path + suffix):
+                served_path, encoding = path + suffix, candidate
+                break
+
+        content_type, _ = mimetypes.guess_type(path)
+        response = FileResponse(
+            open(served_path, "rb"),
+            content_type=content_type or "application/octet-stream",
+        )
+        if encoding:
+            response["Content-Encoding"] = encoding
+        response["Vary"] = "Accept-Encoding"
+        response["Last-Modified"] = http_date(os.stat(path).st_mtime)
+        if name in self.hashed_names():
+            response["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response["Cache-Control"] = "public, max-age=60"
+        return response
@@ -0,0 +1,80 @@
+import asyncio
+
+from django.db.models import F
+
+from task_system.models import (
+    DashboardStats,
+    Position,
+    Task,
+    TaskType,
+    Worker,
+)
+
+STATS_PK = 1
+
+
+def compute_counts():
+    return {
+        "num_workers": Worker.objects.count(),
+        "num_tasks": Task.objects.count(),
+        "num_completed_tasks": Task.objects.filter(is_complete=True).count(),
+        "num_type_tasks": TaskType.objects.count(),
+        "num_position": Position.objects.count(),
+    }
+
+
+def get_dashboard_stats():
+    """Return the counters with a single lookup, creating them on first use."""
+    stats = DashboardStats.objects.filter(pk=STATS_PK).first()
+    if stats is None:
+        stats, _ = DashboardStats.objects.get_or_create(
+            pk=STATS_PK, defaults=compute_counts()
+        )
+    return stats
+
+
+def adjust_dashboard_stats(**deltas):
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+    if deltas:
+        DashboardStats.objects.filter(pk=STATS_PK).update(
+            **{name: F(name) + delta for name, delta in deltas.items()}
+        )
+
+
+def reconcile_dashboard_stats():
+    """Recount everything and return the drift that was corrected."""
+    counts = compute_counts()
+    stats = get_dashboard_stats()
+    drift = {
+        name: value - getattr(stats, name)
+        for name, value in counts.items()
+        if value != getattr(stats, name)
+    }
+    if drift:
+        DashboardStats.objects.filter(pk=STATS_PK).update(**counts)
+    return drift
+
+
+async def acompute_counts():
+    # the five counts are independent, so they are awaited together
+    names = [
+        "num_workers", "num_tasks", "num_completed_tasks",
+        "num_type_tasks", "num_position",
+    ]
+    values = await asyncio.gather(
+        Worker.objects.acount(),
+        Task.objects.acount(),
+        Task.objects.filter(is_complete=True).acount(),
+        TaskType.objects.acount(),
+        Position.objects.acount(),
+    )
+    return dict(zip(names, values))
+
+
+async def aget_dashboard_stats():
+    stats = await DashboardStats.objects.filter(pk=STATS_PK).afirst()
+    if stats is None:
+        stats, _ = await DashboardStats.objects.aget_or_create(
+            pk=STATS_PK, defaults=await acompute_counts()
+        )
+    return stats
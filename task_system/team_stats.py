@@ -0,0 +1,105 @@
+"""
+Per-team task statistics for the team list and detail pages.
+
+The numbers of every team come from two grouped queries, one over the
+tasks and one over their assignees, whatever the number of teams. The
+result is cached under the "task", "team" and "tasktype" fragment
+versions, which the save/m2m signals and the bulk paths already bump.
+Overdue counts depend on the clock too, so entries also expire after
+TEAM_STATS_TIMEOUT seconds.
+"""
+from django.conf import settings
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from task_system.fragment_cache import get_fragment_cache, get_versions
+from task_system.models import Task
+
+STATS_KEY = "team-stats:{}"
+
+
+def task_rows(now):
+    return Task.objects.filter(team__isnull=False).values(
+        "team_id", "priority", "task_type__name"
+    ).annotate(
+        open=Count("id", filter=Q(is_complete=False)),
+        completed=Count("id", filter=Q(is_complete=True)),
+        overdue=Count("id", filter=Q(is_complete=False, deadline__lt=now)),
+    ).order_by()
+
+
+def member_rows():
+    return Task.assignees.through.objects.filter(
+        task__team__isnull=False
+    ).values("task__team_id", "worker_id").annotate(
+        open=Count("id", filter=Q(task__is_complete=False)),
+        completed=Count("id", filter=Q(task__is_complete=True)),
+    ).order_by()
+
+
+def empty_stats():
+    return {
+        "open": 0, "completed": 0, "overdue": 0,
+        "by_priority": [], "by_type": [], "members": {},
+    }
+
+
+def build_team_stats(tasks, members):
+    teams = {}
+    for row in tasks:
+        stats = teams.setdefault(row["team_id"], {
+            **empty_stats(), "by_priority": {}, "by_type": {},
+        })
+        total = row["open"] + row["completed"]
+        for name in ("open", "completed", "overdue"):
+            stats[name] += row[name]
+        stats["by_priority"][row["priority"]] = (
+            stats["by_priority"].get(row["priority"], 0) + total
+        )
+        stats["by_type"][row["task_type__name"]] = (
+            stats["by_type"].get(row["task_type__name"], 0) + total
+        )
+    for stats in teams.values():
+        stats["by_priority"] = [
+            (Task.Priority(priority).label, count)
+            for priority, count in sorted(stats["by_priority"].items(), reverse=True)
+        ]
+        stats["by_type"] = sorted(stats["by_type"].items())
+    for row in members:
+        stats = teams.setdefault(row["task__team_id"], empty_stats())
+        stats["members"][row["worker_id"]] = {
+            "open": row["open"], "completed": row["completed"],
+        }
+    return teams
+
+
+def cache_key():
+    return STATS_KEY.format(get_versions("task", "team", "tasktype"))
+
+
+def timeout():
+    return getattr(settings, "TEAM_STATS_TIMEOUT", 300)
+
+
+def get_team_stats():
+    """team id -> stats dict; teams without tasks are missing."""
+    cache = get_fragment_cache()
+    key = cache_key()
+    teams = cache.get(key)
+    if teams is None:
+        teams = build_team_stats(task_rows(timezone.now()), member_rows())
+        cache.set(key, teams, timeout())
+    return teams
+
+
+async def aget_team_stats():
+    cache = get_fragment_cache()
+    key = cache_key()
+    teams = await cache.aget(key)
+    if teams is None:
+        teams = build_team_stats(
+            [row async for row in task_rows(timezone.now())],
+            [row async for row in member_rows()],
+        )
+        await cache.aset(key, teams, timeout())
+    return teams
@@ -0,0 +1,11 @@
+from django import template
+
+from task_system.fragment_cache import get_versions
+
+register = template.Library()
+
+
+@register.simple_tag
+def fragment_versions(*models):
+    """Cache key part for {% cache %} that changes when any of the models change."""
+    return get_versions(*models)
@@ -0,0 +1,41 @@
+from django import template
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+from task_system.images import FORMATS, find_variants
+
+register = template.Library()
+
+
+def variant_url(output_prefix, variant):
+    try:
+        return static(output_prefix + "/" + variant["path"])
+    except ValueError:
+        # built after collectstatic, so not in the static manifest yet
+        return None
+
+
+@register.simple_tag
+def image_set(path, width=1600):
+    """
+    CSS image-set() value for backgrounds, picking the variant closest to
+    ``width`` in each format; use it after a plain url() fallback.
+    """
+    entry, output_prefix = find_variants(path)
+    candidates = []
+    if entry is not None:
+        for fmt, mime, _ in FORMATS:
+            variants = entry["variants"].get(fmt)
+            if variants:
+                variant = min(variants, key=lambda v: abs(v["width"] - width))
+                url = variant_url(output_prefix, variant)
+                if url is not None:
+                    candidates.append((url, mime))
+    candidates.append((static(path), ""))
+    return format_html(
+        "image-set({})",
+        format_html_join(
+            ", ", "url('{}'){}",
+            ((url, format_html(" type('{}')", mime) if mime else "") for url, mime in candidates),
+        ),
+    )
@@ -0,0 +1,122 @@
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from task_system.models import Position, Task, TaskType, Team, Worker, WorkerLoad
+from task_system.search import prefix_search
+
+
+class AdminTest(TestCase):
+    def setUp(self):
+        self.position = Position.objects.create(name="Developer")
+        self.admin = Worker.objects.create_superuser(
+            username="admin", password="pass1234", email="admin@example.com",
+            position=self.position,
+        )
+        self.client.force_login(self.admin)
+        self.task_type = TaskType.objects.create(name="Backend")
+        self.team = Team.objects.create(name="Core", description="-")
+
+    def add_tasks(self, count, **kwargs):
+        return Task.objects.bulk_create(
+            Task(
+                name=f"Task {i}", description="-", deadline=timezone.now(),
+                task_type=self.task_type, team=self.team, **kwargs
+            )
+            for i in range(count)
+        )
+
+    def changelist_queries(self, model, **params):
+        url = reverse(f"admin:task_system_{model}_changelist")
+        self.client.get(url, params)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_changelists_do_not_query_per_row(self):
+        self.add_tasks(2)
+        few = {
+            model: self.changelist_queries(model)
+            for model in ("task", "worker", "notification", "workerload")
+        }
+        self.add_tasks(20)
+        Worker.objects.bulk_create(
+            Worker(username=f"w{i}", email=f"w{i}@example.com", position=self.position)
+            for i in range(20)
+        )
+        WorkerLoad.objects.bulk_create(
+            WorkerLoad(worker=worker) for worker in Worker.objects.all()
+        )
+        for model, count in few.items():
+            self.assertEqual(self.changelist_queries(model), count, model)
+
+    def test_changelist_count_is_estimated(self):
+        self.add_tasks(3)
+        Task.objects.filter(name="Task 0").delete()
+        response = self.client.get(reverse("admin:task_system_task_changelist"))
+        # MAX(rowid) on SQLite, which does not notice the deleted row
+        self.assertEqual(response.context["cl"].result_count, 3)
+
+        response = self.client.get(
+            reverse("admin:task_system_task_changelist"), {"is_complete__exact": 0}
+        )
+        self.assertEqual(response.context["cl"].result_count, 2)
+
+    def test_prefix_search(self):
+        Worker.objects.create_user(
+            username="jdoe", password="-", first_name="John", last_name="Doe",
+            email="jdoe@example.com", position=self.position,
+        )
+        found = prefix_search(
+            Worker.objects.all(), ["username", "last_name"], "DO", lower=True
+        )
+        self.assertEqual([worker.username for worker in found], ["jdoe"])
+
+        response = self.client.get(
+            reverse("admin:autocomplete"),
+            {"app_label": "task_system", "model_name": "task", "field_name": "assignees",
+             "term": "jo"},
+        )
+        self.assertEqual(
+            [result["text"] for result in response.json()["results"]],
+            ["John - Doe > Position: Developer"],
+        )
+
+    def test_lookup_tables_search_ignores_case(self):
+        Position.objects.create(name="Дизайнер")
+        for term, expected in (("dev", "Developer"), ("диз", "Дизайнер")):
+            response = self.client.get(
+                reverse("admin:autocomplete"),
+                {"app_label": "task_system", "model_name": "worker",
+                 "field_name": "position", "term": term},
+            )
+            self.assertEqual(
+                [result["text"] for result in response.json()["results"]], [expected]
+            )
+        response = self.client.get(reverse("admin:task_system_team_changelist"), {"q": "co"})
+        self.assertEqual(list(response.context["cl"].result_list), [self.team])
+
+    @override_settings(ADMIN_ACTION_CHUNK_SIZE=2)
+    def test_actions_run_in_chunks(self):
+        self.add_tasks(5)
+        other = Team.objects.create(name="Other", description="-")
+        url = reverse("admin:task_system_task_changelist")
+        ids = list(Task.objects.values_list("pk", flat=True))
+
+        response = self.client.post(url, {
+            "action": "move_to_team", "team": other.pk, "_selected_action": ids,
+        }, follow=True)
+        self.assertContains(response, "5 task(s) moved to Other.")
+        self.assertEqual(Task.objects.filter(team=other).count(), 5)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(url, {
+                "action": "complete_selected", "select_across": 1,
+                "_selected_action": ids[:1],
+            })
+        updates = [q for q in queries if q["sql"].startswith('UPDATE "task_system_task"')]
+        self.assertEqual(len(updates), 3)
+        self.assertEqual(Task.objects.filter(is_complete=True).count(), 5)
@@ -0,0 +1,84 @@
+import csv
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from task_system.api import TaskExportView
+from task_system.models import Task, TaskType, Position, Team
+
+
+User = get_user_model()
+
+
+class StreamingExportTest(TestCase):
+    def setUp(self):
+        position = Position.objects.create(name="Developer")
+        self.user = User.objects.create_user(
+            username="john",
+            password="pass1234",
+            email="john@example.com",
+            position=position,
+        )
+        team = Team.objects.create(name="Team A", description="Desc")
+        team.workers.add(self.user)
+        task_type = TaskType.objects.create(name="Backend")
+        for i in range(250):
+            task = Task.objects.create(
+                name=f"Report {i}" if i % 2 else f"Other {i}",
+                description="Desc",
+                deadline=timezone.now(),
+                task_type=task_type,
+                team=team,
+            )
+            task.assignees.add(self.user)
+        self.client.login(username="john", password="pass1234")
+        self.async_client.force_login(self.user)
+
+    def read(self, response):
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_tasks_json(self):
+        response = self.client.get(reverse("api-tasks", args=["json"]))
+        rows = json.loads(self.read(response))
+        self.assertEqual(len(rows), 250)
+        self.assertEqual(rows[0]["assignees"], ["john"])
+        self.assertEqual(rows[0]["team"], "Team A")
+
+    def test_tasks_csv_with_search(self):
+        response = self.client.get(
+            reverse("api-tasks", args=["csv"]), {"search": "report"}
+        )
+        rows = list(csv.DictReader(self.read(response).splitlines()))
+        self.assertEqual(len(rows), 125)
+        self.assertTrue(all(row["name"].startswith("Report") for row in rows))
+
+    def test_queries_per_chunk(self):
+        TaskExportView.chunk_size = 100
+        self.addCleanup(setattr, TaskExportView, "chunk_size", 2000)
+        response = self.client.get(reverse("api-tasks", args=["json"]))
+        # one SELECT read in 3 chunks, plus one assignees prefetch per chunk
+        with self.assertNumQueries(4):
+            self.read(response)
+
+    async def test_streams_asynchronously_under_asgi(self):
+        response = await self.async_client.get(reverse("api-tasks", args=["json"]))
+        self.assertTrue(response.is_async)
+        chunks = [chunk async for chunk in response.streaming_content]
+        # rows_per_write rows per chunk, plus the brackets
+        self.assertEqual(len(chunks), 5)
+        self.assertEqual(len(json.loads(b"".join(chunks))), 250)
+
+    def test_workers_and_teams(self):
+        workers = json.loads(self.read(self.client.get(reverse("api-workers", args=["json"]))))
+        self.assertEqual(workers[0]["teams"], ["Team A"])
+        self.assertNotIn("password", workers[0])
+        teams = json.loads(self.read(self.client.get(reverse("api-teams", args=["json"]))))
+        self.assertEqual(teams[0]["workers"], ["john"])
+
+    def test_unknown_format(self):
+        response = self.client.get(reverse("api-tasks", args=["xml"]))
+        self.assertEqual(response.status_code, 404)
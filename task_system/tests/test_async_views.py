@@ -0,0 +1,91 @@
+from django.contrib.auth import get_user_model
+from django.test import AsyncClient, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from task_system.fragment_cache import get_fragment_cache
+from task_system.models import Position, Task, TaskType, Team
+
+User = get_user_model()
+
+
+@override_settings(ROOT_URLCONF="manage_task.urls_async")
+class AsyncViewsTest(TestCase):
+    def setUp(self):
+        get_fragment_cache().clear()
+        position = Position.objects.create(name="Developer")
+        self.user = User.objects.create_user(
+            username="john",
+            password="pass1234",
+            email="john@example.com",
+            position=position,
+        )
+        self.team = Team.objects.create(name="Core")
+        self.team.workers.add(self.user)
+        task_type = TaskType.objects.create(name="Backend")
+        self.tasks = Task.objects.bulk_create(
+            Task(
+                name=f"Task {i}",
+                description="Desc",
+                deadline=timezone.now(),
+                task_type=task_type,
+                team=self.team,
+            )
+            for i in range(10)
+        )
+        self.async_client.force_login(self.user)
+
+    async def test_redirects_anonymous_users(self):
+        response = await AsyncClient().get(reverse("task-list"))
+        self.assertEqual(response.status_code, 302)
+        self.assertIn("/accounts/login/", response.url)
+
+    async def test_index(self):
+        response = await self.async_client.get(reverse("index"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["num_tasks"], 10)
+
+    async def test_task_list_offset_pages(self):
+        response = await self.async_client.get(reverse("task-list"), {"page": 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["task_list"]), 2)
+        self.assertEqual(response.context["paginator"].count, 10)
+
+        response = await self.async_client.get(reverse("task-list"), {"page": 9})
+        self.assertEqual(response.status_code, 404)
+
+    async def test_task_list_cursor_and_search(self):
+        response = await self.async_client.get(reverse("task-list"), {"cursor": ""})
+        self.assertEqual(len(response.context["task_list"]), 8)
+        self.assertTrue(response.context["cursor_page"].has_next())
+
+        response = await self.async_client.get(
+            reverse("task-list"), {"search": "task"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["paginator"].count, 10)
+
+    async def test_detail_views(self):
+        response = await self.async_client.get(
+            reverse("task-detail", args=[self.tasks[0].pk])
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["task"], self.tasks[0])
+
+        response = await self.async_client.get(reverse("team-detail", args=[999]))
+        self.assertEqual(response.status_code, 404)
+
+    async def test_team_and_worker_lists(self):
+        response = await self.async_client.get(reverse("team-list"))
+        self.assertContains(response, "Core")
+        self.assertEqual(response.context["team_list"][0].stats["open"], 10)
+        response = await self.async_client.get(reverse("worker-list"))
+        self.assertEqual(list(response.context["worker_list"]), [self.user])
+
+    async def test_not_modified(self):
+        url = reverse("task-detail", args=[self.tasks[0].pk])
+        response = await self.async_client.get(url)
+        response = await self.async_client.get(
+            url, headers={"If-None-Match": response["ETag"]}
+        )
+        self.assertEqual(response.status_code, 304)
@@ -0,0 +1,75 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_system.auth import snapshot_key
+from task_system.tests.test_views import BaseViewTest
+
+
+class CachedAuthenticationTest(BaseViewTest):
+    def page_queries(self, url=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url or reverse("task-list"))
+        self.assertEqual(response.status_code, 200)
+        return [query["sql"] for query in queries]
+
+    def user_queries(self, url=None):
+        return [
+            sql for sql in self.page_queries(url)
+            if "django_session" in sql
+            or 'FROM "task_system_worker" WHERE "task_system_worker"."id" =' in sql
+            or 'FROM "task_system_position" WHERE' in sql
+        ]
+
+    def test_page_view_makes_no_session_or_user_queries(self):
+        self.assertEqual(len(self.user_queries()), 2)
+        self.assertEqual(self.user_queries(), [])
+        self.assertEqual(self.user_queries(reverse("index")), [])
+
+    def test_profile_update_refreshes_the_snapshot(self):
+        self.page_queries()
+        response = self.client.post(reverse("worker-update"), {
+            "username": "john",
+            "first_name": "Johnny",
+            "last_name": "Doe",
+            "email": "john@example.com",
+            "position": self.position.pk,
+        })
+        self.assertEqual(response.status_code, 302)
+        response = self.client.get(reverse("index"))
+        self.assertEqual(response.context["user"].first_name, "Johnny")
+
+    def test_position_rename_refreshes_the_snapshot(self):
+        self.page_queries()
+        self.position.name = "Lead"
+        self.position.save()
+        response = self.client.get(reverse("index"))
+        self.assertEqual(response.context["user"].position.name, "Lead")
+
+    def test_password_change_ends_old_sessions(self):
+        self.page_queries()
+        self.user.set_password("new-pass-5678")
+        self.user.save()
+        # the old session hash no longer matches, like without the cache
+        response = self.client.get(reverse("index"))
+        self.assertEqual(response.status_code, 302)
+
+        self.client.login(username="john", password="new-pass-5678")
+        self.assertEqual(self.client.get(reverse("index")).status_code, 200)
+
+    def test_logout_forgets_the_user(self):
+        self.page_queries()
+        key = snapshot_key(self.client.session)
+        self.assertIsNotNone(cache.get(key))
+        self.client.post(reverse("logout"))
+        self.assertIsNone(cache.get(key))
+        response = self.client.get(reverse("index"))
+        self.assertEqual(response.status_code, 302)
+
+    @override_settings(AUTH_USER_SNAPSHOTS=False)
+    def test_snapshots_can_be_turned_off(self):
+        self.page_queries()
+        self.assertIsNone(cache.get(snapshot_key(self.client.session)))
+        self.assertTrue(self.user_queries())
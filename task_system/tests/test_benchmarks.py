@@ -0,0 +1,80 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from task_system.models import Task, TaskType, Position, Team
+from task_system.views import TaskListView
+
+
+User = get_user_model()
+
+
+def seed_tasks(count, task_type, team, workers):
+    tasks = Task.objects.bulk_create(
+        Task(
+            name=f"Bench task {i}",
+            description="Benchmark",
+            deadline=timezone.now(),
+            task_type=task_type,
+            team=team if i % 2 else None,
+            priority=Task.Priority.HIGH,
+        )
+        for i in range(count)
+    )
+    Through = Task.assignees.through
+    Through.objects.bulk_create(
+        Through(task_id=task.id, worker_id=worker.id)
+        for task in tasks
+        for worker in workers
+    )
+
+
+class TaskListBenchmarkTest(TestCase):
+    def setUp(self):
+        self.position = Position.objects.create(name="Developer")
+        self.user = User.objects.create_user(
+            username="john",
+            password="pass1234",
+            first_name="John",
+            last_name="Doe",
+            email="john@example.com",
+            position=self.position,
+        )
+        self.workers = [self.user] + [
+            User.objects.create_user(
+                username=f"worker{i}",
+                password="pass1234",
+                email=f"worker{i}@example.com",
+                position=self.position,
+            )
+            for i in range(5)
+        ]
+        self.task_type = TaskType.objects.create(name="Backend")
+        self.team = Team.objects.create(name="Team A", description="Desc")
+        self.team.workers.set(self.workers)
+        self.client.login(username="john", password="pass1234")
+
+    def measure(self, paginate_by=TaskListView.paginate_by):
+        with mock.patch.object(TaskListView, "paginate_by", paginate_by):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(reverse("task-list"))
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_query_count_is_flat(self):
+        seed_tasks(10, self.task_type, self.team, self.workers[:1])
+        # the first request also caches the logged-in user
+        self.measure()
+        small_queries = self.measure()
+
+        seed_tasks(3000, self.task_type, self.team, self.workers)
+        large_queries = self.measure()
+        bigger_page_queries = self.measure(paginate_by=50)
+
+        self.assertEqual(small_queries, large_queries)
+        self.assertEqual(small_queries, bigger_page_queries)
@@ -0,0 +1,122 @@
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.utils import timezone
+
+from task_system.bulk_io import Importer, export_records, read_records, write_records
+from task_system.models import Position, Task, TaskType, Team, Worker
+from task_system.stats import compute_counts, get_dashboard_stats
+
+
+class BulkIOTest(TestCase):
+    def setUp(self):
+        position = Position.objects.create(name="Developer")
+        self.workers = [
+            Worker.objects.create_user(
+                username=f"worker{i}",
+                password="pass1234",
+                email=f"worker{i}@example.com",
+                position=position,
+            )
+            for i in range(3)
+        ]
+        team = Team.objects.create(name="Team A", description="Desc")
+        team.workers.set(self.workers[:2])
+        task_type = TaskType.objects.create(name="Backend")
+        for i in range(5):
+            task = Task.objects.create(
+                name=f"Task {i}",
+                description="Desc",
+                deadline=timezone.now(),
+                task_type=task_type,
+                team=team if i % 2 else None,
+                is_complete=i == 0,
+                priority=Task.Priority.URGENT,
+            )
+            task.assignees.set(self.workers[:i % 3])
+
+    def export(self, model, fmt):
+        stream = StringIO()
+        write_records(stream, fmt, model, export_records(model, chunk_size=2))
+        return stream.getvalue()
+
+    def test_roundtrip(self):
+        for fmt in ("jsonl", "csv"):
+            with self.subTest(fmt=fmt):
+                exported = {
+                    model: self.export(model, fmt)
+                    for model in ("worker", "team", "task")
+                }
+                Task.objects.all().delete()
+                Team.objects.all().delete()
+                Worker.objects.all().delete()
+                TaskType.objects.all().delete()
+
+                for model in ("worker", "team", "task"):
+                    records = read_records(StringIO(exported[model]), fmt, model)
+                    Importer(batch_size=2).run(model, records)
+
+                self.assertEqual(
+                    {model: self.export(model, fmt) for model in exported},
+                    exported,
+                )
+                self.assertTrue(Worker.objects.get(username="worker0").check_password("pass1234"))
+
+    def test_blank_cells_use_the_defaults(self):
+        csv = (
+            "username,email,position,is_staff,is_active\n"
+            "new,new@example.com,Developer,,\n"
+        )
+        Importer().run("worker", read_records(StringIO(csv), "csv", "worker"))
+        worker = Worker.objects.get(username="new")
+        self.assertTrue(worker.is_active)
+        self.assertFalse(worker.is_staff)
+
+    def test_import_uses_batched_queries(self):
+        lines = "".join(
+            f'{{"name": "T{i}", "deadline": "2030-01-01T00:00:00Z", '
+            f'"task_type": "New type", "priority": "high", '
+            f'"assignees": ["worker0", "worker1"]}}\n'
+            for i in range(100)
+        )
+        get_dashboard_stats()
+        # per batch: tasks, assignees and two for the worker loads
+        with self.assertNumQueries(17):
+            Importer(batch_size=50).run("task", read_records(StringIO(lines), "jsonl", "task"))
+        self.assertEqual(Task.objects.filter(task_type__name="New type").count(), 100)
+        stats = get_dashboard_stats()
+        for name, value in compute_counts().items():
+            self.assertEqual(getattr(stats, name), value)
+
+    def test_command_reports_unknown_workers(self):
+        fd, path = tempfile.mkstemp(suffix=".jsonl")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "w") as f:
+            f.write('{"name": "T", "deadline": "2030-01-01T00:00:00", '
+                    '"task_type": "Backend", "assignees": ["ghost"]}\n')
+        with self.assertRaisesMessage(CommandError, "Unknown workers: ghost"):
+            call_command("import_tasks", path, stdout=StringIO())
+
+    def test_command_reports_bad_input(self):
+        cases = [
+            ("task", '{"name": "T", "deadline": "2030-01-01T00:00:00", '
+                     '"task_type": "Backend", "priority": "7"}', "Unknown priority '7'"),
+            ("task", '{"name": "T",', "Import failed"),
+            ("team", '{"name": "Team A", "description": "-"}', "Import failed"),
+        ]
+        for model, line, message in cases:
+            fd, path = tempfile.mkstemp(suffix=".jsonl")
+            self.addCleanup(os.remove, path)
+            with os.fdopen(fd, "w") as f:
+                f.write(line + "\n")
+            with self.subTest(line=line), self.assertRaisesMessage(CommandError, message):
+                call_command("import_tasks", path, "--model", model, stdout=StringIO())
+
+    def test_export_command(self):
+        out = StringIO()
+        call_command("export_tasks", "--format", "csv", stdout=out, stderr=StringIO())
+        self.assertEqual(len(out.getvalue().strip().splitlines()), 6)
@@ -0,0 +1,112 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from task_system.bulk_actions import complete_tasks
+from task_system.models import Task, TaskType, Team
+from task_system.tests.test_views import BaseViewTest, User
+
+
+class ConditionalGetTest(BaseViewTest):
+    def setUp(self):
+        super().setUp()
+        self.task_type = TaskType.objects.create(name="Backend")
+        self.team = Team.objects.create(name="Core", description="-")
+        self.team.workers.add(self.user)
+        self.tasks = [
+            Task.objects.create(
+                name=f"Task {i}", description="-", deadline=timezone.now(),
+                task_type=self.task_type, team=self.team,
+            )
+            for i in range(3)
+        ]
+
+    def revalidate(self, url, response, **params):
+        with CaptureQueriesContext(connection) as queries:
+            again = self.client.get(url, params, HTTP_IF_NONE_MATCH=response["ETag"])
+        return again, len(queries)
+
+    def test_detail_not_modified_until_the_task_changes(self):
+        url = reverse("task-detail", args=[self.tasks[0].pk])
+        response = self.client.get(url)
+        self.assertIn("Last-Modified", response)
+        self.assertIn("private", response["Cache-Control"])
+
+        again, queries = self.revalidate(url, response)
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again["ETag"], response["ETag"])
+        self.assertEqual(queries, 1)
+
+        complete_tasks([self.tasks[0].pk])
+        self.assertEqual(self.revalidate(url, response)[0].status_code, 200)
+
+    def test_last_modified_alone_is_not_enough(self):
+        url = reverse("task-detail", args=[self.tasks[0].pk])
+        response = self.client.get(url)
+        again = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        self.assertEqual(again.status_code, 200)
+
+    def test_new_login_gets_a_fresh_page(self):
+        # the cached page's CSRF token (logout form) belongs to the old login
+        url = reverse("worker-list")
+        response = self.client.get(url)
+        self.client.post(reverse("logout"))
+        self.client.login(username="john", password="pass1234")
+        self.assertEqual(self.revalidate(url, response)[0].status_code, 200)
+
+    def rename_task_type(self):
+        self.task_type.name = "Ops"
+        self.task_type.save()
+
+    def test_list_notices_updates_deletes_and_related_changes(self):
+        url = reverse("task-list")
+        changes = [
+            lambda: self.tasks[0].assignees.add(self.user),
+            lambda: self.tasks[1].delete(),
+            self.rename_task_type,
+        ]
+        for change in changes:
+            response = self.client.get(url)
+            self.assertEqual(self.revalidate(url, response)[0].status_code, 304)
+            change()
+            self.assertEqual(self.revalidate(url, response)[0].status_code, 200)
+
+    def test_validator_depends_on_query_and_user(self):
+        url = reverse("task-list")
+        response = self.client.get(url)
+        self.assertEqual(self.revalidate(url, response, search="Task")[0].status_code, 200)
+
+        User.objects.create_user(
+            username="jane", password="pass1234", email="jane@example.com",
+            position=self.position,
+        )
+        self.client.login(username="jane", password="pass1234")
+        self.assertEqual(self.revalidate(url, response)[0].status_code, 200)
+
+    def test_team_and_worker_pages(self):
+        for url in (
+            reverse("team-list"),
+            reverse("team-detail", args=[self.team.pk]),
+            reverse("worker-list"),
+        ):
+            response = self.client.get(url)
+            self.assertEqual(self.revalidate(url, response)[0].status_code, 304, url)
+
+        url = reverse("team-detail", args=[self.team.pk])
+        response = self.client.get(url)
+        self.team.workers.remove(self.user)
+        self.assertEqual(self.revalidate(url, response)[0].status_code, 200)
+
+    def test_bulk_and_m2m_changes_move_updated_at(self):
+        before = Task.objects.get(pk=self.tasks[2].pk).updated_at
+        complete_tasks([self.tasks[2].pk])
+        after = Task.objects.get(pk=self.tasks[2].pk).updated_at
+        self.assertGreater(after, before)
+
+        self.user.assignees.add(self.tasks[2])
+        self.assertGreater(Task.objects.get(pk=self.tasks[2].pk).updated_at, after)
+
+        before = Team.objects.get(pk=self.team.pk).updated_at
+        self.user.teams.clear()
+        self.assertGreater(Team.objects.get(pk=self.team.pk).updated_at, before)
@@ -0,0 +1,161 @@
+import sqlite3
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from task_system import db
+from task_system.fragment_cache import get_versions
+from task_system.models import Position, Task, TaskType
+
+User = get_user_model()
+
+
+class RecordingRouter(db.ReplicaRouter):
+    """Records where reads would go without needing a second database."""
+    reads = []
+
+    def db_for_read(self, model, **hints):
+        self.reads.append((model, db._use_replica.get()))
+        return None
+
+
+@override_settings(
+    MIDDLEWARE=[*settings.MIDDLEWARE, "task_system.db.ReplicaMiddleware"],
+    DATABASE_ROUTERS=["task_system.tests.test_db.RecordingRouter"],
+)
+class ReplicaRoutingTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="john",
+            password="pass1234",
+            email="john@example.com",
+            position=Position.objects.create(name="Developer"),
+        )
+        self.task = Task.objects.create(
+            name="Task",
+            description="Desc",
+            deadline=timezone.now(),
+            task_type=TaskType.objects.create(name="Backend"),
+        )
+        self.client.force_login(self.user)
+        self.async_client.force_login(self.user)
+        RecordingRouter.reads = []
+        patcher = mock.patch.object(db, "replica_generation", return_value="1")
+        self.generation = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def replica_models(self):
+        return {model for model, replica in RecordingRouter.reads if replica}
+
+    def test_list_and_render_read_from_replica(self):
+        self.client.get(reverse("task-list"))
+        self.assertIn(Task, self.replica_models())
+        # the session and user are loaded before the view runs
+        self.assertNotIn(Session, self.replica_models())
+
+    def test_writes_and_their_reads_use_primary(self):
+        self.client.get(reverse("task-done", args=[self.task.pk]))
+        self.client.post(reverse("task-update", args=[self.task.pk]), {})
+        self.assertEqual(self.replica_models(), set())
+
+    def test_reads_after_a_write_are_pinned_to_primary(self):
+        response = self.client.post(reverse("task-create"), {
+            "name": "New", "description": "Desc", "deadline": "2030-01-01T10:00",
+            "priority": Task.Priority.LOW, "task_type": self.task.task_type_id,
+        }, follow=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(db.PIN_COOKIE, self.client.cookies)
+        self.assertEqual(self.replica_models(), set())
+
+        # once the pin expires, reads go back to the replica
+        del self.client.cookies[db.PIN_COOKIE]
+        self.client.get(reverse("task-list"))
+        self.assertIn(Task, self.replica_models())
+
+    @override_settings(ROOT_URLCONF="manage_task.urls_async")
+    async def test_async_list_reads_from_replica(self):
+        await self.async_client.get(reverse("task-list"))
+        self.assertIn(Task, self.replica_models())
+        self.assertNotIn(Session, self.replica_models())
+
+    def test_unsynced_replica_falls_back_to_primary(self):
+        self.generation.return_value = None
+        with self.assertLogs("task_system.db", "WARNING"):
+            response = self.client.get(reverse("task-list"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.replica_models(), set())
+
+    def test_replica_reads_have_their_own_cache_keys(self):
+        # the replica lags until its next sync: rows cached from it must
+        # not be served under the primary's versions, nor after the sync
+        primary = get_versions("task")
+        with db.reads_from_replica():
+            synced = get_versions("task")
+        self.generation.return_value = "2"
+        with db.reads_from_replica():
+            resynced = get_versions("task")
+        self.assertEqual(len({primary, synced, resynced}), 3)
+
+    def test_router(self):
+        router = db.ReplicaRouter()
+        with mock.patch.dict(settings.DATABASES, {"replica": {}}):
+            self.assertEqual(router.db_for_read(Task), "default")
+            with db.reads_from_replica():
+                self.assertEqual(router.db_for_read(Task), "replica")
+                self.assertEqual(router.db_for_write(Task), "default")
+        self.assertFalse(router.allow_migrate("replica", "task_system"))
+
+
+class ReplicaGenerationTest(SimpleTestCase):
+    def test_missing_or_empty_replica_has_none(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "replica.sqlite3"
+            replica = {"ENGINE": "django.db.backends.sqlite3", "NAME": path}
+            with mock.patch.dict(settings.DATABASES, {"replica": replica}):
+                self.assertIsNone(db.replica_generation())
+                sqlite3.connect(path).close()
+                self.assertIsNone(db.replica_generation())
+
+                connection = sqlite3.connect(path)
+                connection.execute("CREATE TABLE t (x)")
+                connection.close()
+                generation = db.replica_generation()
+                self.assertIsNotNone(generation)
+
+                connection = sqlite3.connect(path)
+                connection.execute("INSERT INTO t VALUES (zeroblob(10000))")
+                connection.commit()
+                connection.close()
+                self.assertNotEqual(db.replica_generation(), generation)
+
+
+class SqliteTuningTest(TestCase):
+    def test_pragmas_applied(self):
+        with override_settings(SQLITE_PRAGMAS={"cache_size": -1234}):
+            db.apply_sqlite_pragmas(None, connection)
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA cache_size")
+            self.assertEqual(cursor.fetchone()[0], -1234)
+
+
+class SyncReplicaTest(TransactionTestCase):
+    # the backup API can't copy from inside TestCase's open transaction
+    def test_sync_replica_copies_primary(self):
+        Position.objects.create(name="Developer")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "replica.sqlite3"
+            db.sync_replica(path)
+            replica = sqlite3.connect(path)
+            try:
+                names = replica.execute("SELECT name FROM task_system_position").fetchall()
+            finally:
+                replica.close()
+        self.assertEqual(names, [("Developer",)])
@@ -0,0 +1,112 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from task_system.deadlines import DeadlineScheduler
+from task_system.models import Notification, Position, Task, TaskType, Worker
+
+
+class DeadlineSchedulerTest(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.task_type = TaskType.objects.create(name="Backend")
+        self.worker = Worker.objects.create_user(
+            username="john", password="pass1234", email="john@example.com",
+            position=Position.objects.create(name="Developer"),
+        )
+
+    def task(self, minutes, **kwargs):
+        return Task.objects.create(
+            name=f"Due in {minutes}", description="-", task_type=self.task_type,
+            deadline=self.now + timedelta(minutes=minutes), **kwargs
+        )
+
+    def at(self, minutes):
+        return (self.now + timedelta(minutes=minutes)).timestamp()
+
+    def scheduler(self, **kwargs):
+        scheduler = DeadlineScheduler(horizon=60 * 60, refresh=10 ** 6, **kwargs)
+        scheduler.connect()
+        self.addCleanup(scheduler.disconnect)
+        scheduler.run_once(self.at(0))
+        return scheduler
+
+    def test_loads_only_pending_tasks_inside_the_horizon(self):
+        past = self.task(-5)
+        soon = self.task(5)
+        self.task(5, is_complete=True)
+        self.task(120)
+        scheduler = self.scheduler()
+        past.refresh_from_db()
+        self.assertTrue(past.is_overdue)
+        self.assertEqual(list(scheduler.scheduled), [soon.pk])
+
+    def test_flags_tasks_as_their_deadlines_pass(self):
+        first, second = self.task(5), self.task(10)
+        scheduler = self.scheduler()
+
+        scheduler.run_once(self.at(6))
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertTrue(first.is_overdue)
+        self.assertFalse(second.is_overdue)
+        self.assertEqual(scheduler.fired, 1)
+
+        # nothing is due in between, so no queries at all
+        with CaptureQueriesContext(connection) as queries:
+            scheduler.run_once(self.at(7))
+        self.assertEqual(len(queries), 0)
+
+    def test_follows_saves_and_deletes_through_the_queue(self):
+        moved, finished, deleted = self.task(5), self.task(5), self.task(5)
+        scheduler = self.scheduler()
+        created = self.task(3)
+
+        moved.deadline = self.now + timedelta(minutes=30)
+        moved.save()
+        finished.is_complete = True
+        finished.save()
+        deleted.delete()
+
+        scheduler.run_once(self.at(6))
+        self.assertEqual(
+            set(Task.objects.filter(is_overdue=True).values_list("pk", flat=True)),
+            {created.pk},
+        )
+        self.assertEqual(list(scheduler.scheduled), [moved.pk])
+
+    def test_rechecks_the_database_before_acting(self):
+        task = self.task(5)
+        scheduler = self.scheduler()
+        # changed by another process: no signal reaches this scheduler
+        Task.objects.filter(pk=task.pk).update(is_complete=True)
+        scheduler.run_once(self.at(6))
+        self.assertEqual(scheduler.fired, 0)
+
+    def test_escalate_and_notify_actions(self):
+        task = self.task(5, priority=Task.Priority.HIGH)
+        task.assignees.add(self.worker)
+        scheduler = self.scheduler(actions=["escalate", "notify"])
+        scheduler.run_once(self.at(6))
+        task.refresh_from_db()
+        self.assertEqual(task.priority, Task.Priority.URGENT)
+        notification = Notification.objects.get()
+        self.assertEqual((notification.worker, notification.task), (self.worker, task))
+
+    def test_moving_the_deadline_clears_the_flag(self):
+        task = self.task(-5, is_overdue=True)
+        task.deadline = self.now + timedelta(days=1)
+        task.save()
+        task.refresh_from_db()
+        self.assertFalse(task.is_overdue)
+
+    def test_command_once(self):
+        self.task(-5)
+        out = StringIO()
+        call_command("run_deadline_scheduler", "--once", stdout=out)
+        self.assertIn("1 tasks flagged as overdue", out.getvalue())
@@ -0,0 +1,85 @@
+from django.contrib.auth import get_user_model
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from task_system.bulk_actions import complete_tasks
+from task_system.fragment_cache import bump_version, check_fragment_cache, get_versions
+from task_system.models import Task, TaskType, Position, Team
+
+
+User = get_user_model()
+
+
+class FragmentCacheTest(TestCase):
+    def setUp(self):
+        position = Position.objects.create(name="Developer")
+        self.user = User.objects.create_user(
+            username="john",
+            password="pass1234",
+            email="john@example.com",
+            position=position,
+        )
+        self.task_type = TaskType.objects.create(name="Backend")
+        self.task = Task.objects.create(
+            name="Cached task",
+            description="Desc",
+            deadline=timezone.now(),
+            task_type=self.task_type,
+        )
+        self.client.login(username="john", password="pass1234")
+
+    def get_list(self):
+        return self.client.get(reverse("task-list"))
+
+    def test_versions_change_on_bump(self):
+        before = get_versions("task", "team")
+        bump_version("team")
+        self.assertNotEqual(get_versions("task", "team"), before)
+
+    def test_login_keeps_worker_version(self):
+        before = get_versions("worker")
+        self.client.login(username="john", password="pass1234")
+        self.assertEqual(get_versions("worker"), before)
+        self.user.first_name = "John"
+        self.user.save()
+        self.assertNotEqual(get_versions("worker"), before)
+
+    def test_process_local_cache_fails_deploy_check(self):
+        self.assertEqual(
+            [error.id for error in check_fragment_cache(None)], ["task_system.E001"]
+        )
+        shared = {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                  "LOCATION": "/tmp/fragment-check"}
+        with override_settings(CACHES={**settings.CACHES, "template_fragments": shared}):
+            self.assertEqual(check_fragment_cache(None), [])
+
+    def test_unchanged_rows_come_from_cache(self):
+        self.get_list()
+        # a write that skips signals is not seen, proving the row was cached
+        Task.objects.filter(pk=self.task.pk).update(name="Renamed quietly")
+        self.assertContains(self.get_list(), "Cached task")
+
+    def test_save_expires_rows(self):
+        self.get_list()
+        self.task.name = "Renamed task"
+        self.task.save()
+        self.assertContains(self.get_list(), "Renamed task")
+
+    def test_related_changes_expire_rows(self):
+        self.get_list()
+        self.task_type.name = "Frontend"
+        self.task_type.save()
+        self.assertContains(self.get_list(), "Frontend")
+
+        team = Team.objects.create(name="Team A", description="Desc")
+        Task.objects.filter(pk=self.task.pk).update(team=team)
+        bump_version("task")
+        team.workers.add(self.user)
+        self.assertContains(self.get_list(), "Team A")
+
+    def test_bulk_update_expires_rows(self):
+        self.get_list()
+        complete_tasks([self.task.pk])
+        self.assertContains(self.get_list(), "Done")
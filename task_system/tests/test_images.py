@@ -0,0 +1,94 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+
+from task_system.images import Image, VariantBuilder, read_manifest
+
+
+@unittest.skipIf(Image is None, "Pillow is not installed")
+class ImageVariantsTest(SimpleTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.static = Path(tmp.name)
+        self.source = self.static / "img"
+        self.output = self.source / "variants"
+        self.source.mkdir()
+        Image.new("RGB", (800, 400), "red").save(self.source / "hero.jpg")
+        Image.new("P", (100, 100)).save(self.source / "icon.png")
+        settings = override_settings(
+            STATICFILES_DIRS=[self.static],
+            IMAGE_VARIANT_DIRS=[(self.source, self.output)],
+            IMAGE_VARIANT_WIDTHS=[320, 640, 1024],
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def build(self, **kwargs):
+        builder = VariantBuilder(self.source, self.output, **kwargs)
+        builder.run()
+        return builder
+
+    def test_builds_each_width_below_the_original(self):
+        self.build()
+        entry = read_manifest(self.output)["hero.jpg"]
+        self.assertEqual((entry["width"], entry["height"]), (800, 400))
+        for variants in entry["variants"].values():
+            self.assertEqual([v["width"] for v in variants], [320, 640, 800])
+            for variant in variants:
+                self.assertTrue((self.output / variant["path"]).exists())
+        with Image.open(self.output / entry["variants"]["webp"][0]["path"]) as image:
+            self.assertEqual(image.size, (320, 160))
+
+    def test_rebuild_only_touches_changed_images(self):
+        self.build()
+        old = read_manifest(self.output)["hero.jpg"]
+
+        builder = self.build()
+        self.assertEqual((builder.built, builder.skipped), (0, 2))
+
+        Image.new("RGB", (800, 400), "blue").save(self.source / "hero.jpg")
+        (self.source / "icon.png").unlink()
+        builder = self.build()
+        self.assertEqual((builder.built, builder.skipped), (1, 0))
+        manifest = read_manifest(self.output)
+        self.assertEqual(list(manifest), ["hero.jpg"])
+        self.assertNotEqual(manifest["hero.jpg"]["hash"], old["hash"])
+        self.assertFalse((self.output / old["variants"]["webp"][0]["path"]).exists())
+        # only the new hero variants and the manifest are left
+        files = [p for p in self.output.rglob("*") if p.is_file()]
+        variant_count = sum(map(len, manifest["hero.jpg"]["variants"].values()))
+        self.assertEqual(len(files), variant_count + 1)
+
+    def render(self, source):
+        return Template("{% load images %}" + source).render(Context())
+
+    def test_falls_back_to_the_original_without_variants(self):
+        self.assertEqual(
+            self.render("{% image_set 'img/hero.jpg' %}"),
+            "image-set(url('/static/img/hero.jpg'))",
+        )
+
+    def test_variants_missing_from_the_static_manifest_are_skipped(self):
+        self.build()
+
+        def static(path):
+            if "/variants/" in path:
+                raise ValueError(f"Missing staticfiles manifest entry for '{path}'")
+            return "/static/" + path
+
+        with mock.patch("task_system.templatetags.images.static", static):
+            self.assertEqual(
+                self.render("{% image_set 'img/hero.jpg' %}"),
+                "image-set(url('/static/img/hero.jpg'))",
+            )
+
+    def test_image_set_picks_the_closest_width(self):
+        self.build()
+        css = self.render("{% image_set 'img/hero.jpg' 600 %}")
+        self.assertRegex(css, r"url\('/static/img/variants/hero-\w+-640\.webp'\) type\('image/webp'\)")
+        self.assertTrue(css.endswith("url('/static/img/hero.jpg'))"))
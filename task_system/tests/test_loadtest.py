@@ -0,0 +1,63 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from task_system.datagen import DataGenerator
+from task_system.loadtest import route_targets
+from task_system.models import Position, Task, Team, Worker
+from task_system.stats import compute_counts, get_dashboard_stats
+
+
+class DataGeneratorTest(TestCase):
+    def test_generates_requested_rows(self):
+        get_dashboard_stats()
+        counts = DataGenerator(seed=1, batch_size=50).run(
+            positions=3, task_types=4, workers=30, teams=5, tasks=120,
+            team_size=4, max_assignees=2,
+        )
+        self.assertEqual(counts["task"], 120)
+        self.assertEqual(Worker.objects.count(), 30)
+        self.assertEqual(Team.workers.through.objects.count(), 5 * 4)
+        self.assertLessEqual(
+            Task.assignees.through.objects.count(), 120 * 2
+        )
+        self.assertTrue(Worker.objects.first().check_password("password123"))
+
+        stats = get_dashboard_stats()
+        for name, value in compute_counts().items():
+            self.assertEqual(getattr(stats, name), value, name)
+
+    def test_second_run_does_not_collide(self):
+        DataGenerator(seed=1).run(positions=1, task_types=1, workers=2, teams=1, tasks=1)
+        DataGenerator(seed=2).run(positions=1, task_types=1, workers=2, teams=1, tasks=1)
+        self.assertEqual(Position.objects.count(), 2)
+
+
+class LoadTestCommandTest(TestCase):
+    def setUp(self):
+        DataGenerator(seed=1).run(positions=1, task_types=2, workers=5, teams=2, tasks=20)
+        self.user = Worker.objects.first()
+
+    def test_targets_cover_named_routes(self):
+        names = dict(route_targets())
+        self.assertIn("task-detail", names)
+        self.assertEqual(names["api-tasks"], "/task_system/api/tasks.json")
+        self.assertNotIn("task-done", names)
+
+    def test_saves_results(self):
+        out = StringIO()
+        with tempfile.TemporaryDirectory() as output_dir:
+            call_command(
+                "loadtest", username=self.user.username, requests=2,
+                concurrency=1, routes=["index", "task-list"],
+                output_dir=output_dir, stdout=out,
+            )
+            [path] = Path(output_dir).glob("loadtest-*.json")
+            results = json.loads(path.read_text())
+        self.assertEqual(set(results["routes"]), {"index", "task-list"})
+        self.assertEqual(results["routes"]["task-list"]["errors"], 0)
+        self.assertIn("p99", out.getvalue())
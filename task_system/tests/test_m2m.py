@@ -0,0 +1,89 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_system.m2m import m2m_synced, sync_m2m
+from task_system.models import Position, Team, Worker
+
+
+class SyncM2MTest(TestCase):
+    def setUp(self):
+        self.position = Position.objects.create(name="Developer")
+        self.workers = Worker.objects.bulk_create(
+            Worker(
+                username=f"worker{i}",
+                email=f"worker{i}@example.com",
+                position=self.position,
+            )
+            for i in range(2000)
+        )
+        self.team = Team.objects.create(name="Big team", description="Desc")
+        self.team.workers.set(self.workers[:1500])
+        self.signals = []
+        m2m_synced.connect(self.record, sender=Team.workers.through)
+        self.addCleanup(m2m_synced.disconnect, self.record, sender=Team.workers.through)
+
+    def record(self, **kwargs):
+        self.signals.append(kwargs)
+
+    def test_applies_only_the_difference(self):
+        with CaptureQueriesContext(connection) as queries:
+            added, removed = sync_m2m(self.team, "workers", self.workers[500:])
+        # savepoint, select current ids, delete, insert (split by the
+        # backend's parameter limit), the team's updated_at, release
+        self.assertLessEqual(len(queries), 7)
+        self.assertEqual(len(added), 500)
+        self.assertEqual(len(removed), 500)
+        self.assertEqual(self.team.workers.count(), 1500)
+        self.assertEqual(len(self.signals), 1)
+        self.assertEqual(self.signals[0]["added"], added)
+
+    def test_noop_sync_sends_nothing(self):
+        sync_m2m(self.team, "workers", [w.pk for w in self.workers[:1500]])
+        self.assertEqual(self.signals, [])
+
+    def test_reverse_side(self):
+        worker = self.workers[1999]
+        other = Team.objects.create(name="Other", description="Desc")
+        sync_m2m(worker, "teams", [self.team, other])
+        self.assertCountEqual(worker.teams.all(), [self.team, other])
+        sync_m2m(worker, "teams", [other])
+        self.assertEqual(list(worker.teams.all()), [other])
+
+
+class WorkerUpdateFormSyncTest(TestCase):
+    def setUp(self):
+        position = Position.objects.create(name="Developer")
+        self.user = Worker.objects.create_user(
+            username="john",
+            password="pass1234",
+            email="john@example.com",
+            first_name="John",
+            last_name="Doe",
+            position=position,
+        )
+        self.team_a = Team.objects.create(name="A", description="Desc")
+        self.team_b = Team.objects.create(name="B", description="Desc")
+        self.team_a.workers.add(self.user)
+        self.client.login(username="john", password="pass1234")
+
+    def test_profile_save_syncs_teams_once(self):
+        signals = []
+
+        def record(**kwargs):
+            signals.append(kwargs)
+
+        m2m_synced.connect(record, sender=Team.workers.through)
+        self.addCleanup(m2m_synced.disconnect, record, sender=Team.workers.through)
+        response = self.client.post(reverse("worker-update"), {
+            "first_name": "John",
+            "last_name": "Doe",
+            "username": "john",
+            "email": "john@example.com",
+            "position": self.user.position_id,
+            "teams": [self.team_b.id],
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(list(self.user.teams.all()), [self.team_b])
+        self.assertEqual(len(signals), 1)
@@ -0,0 +1,74 @@
+from asgiref.sync import iscoroutinefunction
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from task_system.metrics import Histogram, registry
+from task_system.middleware import RequestMetricsMiddleware
+from task_system.models import Position
+
+User = get_user_model()
+
+
+class RequestMetricsTest(TestCase):
+    def setUp(self):
+        registry.clear()
+        self.user = User.objects.create_user(
+            username="john",
+            password="pass1234",
+            email="john@example.com",
+            position=Position.objects.create(name="Developer"),
+        )
+        self.client.force_login(self.user)
+        self.async_client.force_login(self.user)
+
+    def test_server_timing_header(self):
+        response = self.client.get(reverse("task-list"))
+        timing = response["Server-Timing"]
+        for name in ("sql;", "tpl;", "view;", "total;"):
+            self.assertIn(name, timing)
+        self.assertRegex(timing, r'desc="[1-9]\d* queries"')
+
+    @override_settings(METRICS_ALLOWED_IPS=["127.0.0.1"])
+    def test_metrics_endpoint_renders_histograms(self):
+        self.client.get(reverse("task-list"))
+        self.client.get(reverse("task-list"))
+        response = self.client.get(reverse("metrics"), REMOTE_ADDR="127.0.0.1")
+        body = response.content.decode()
+        self.assertIn("# TYPE task_system_sql_queries histogram", body)
+        self.assertIn('task_system_request_duration_seconds_count{route="task-list"} 2', body)
+        self.assertIn('task_system_sql_queries_bucket{route="task-list",le="+Inf"} 2', body)
+
+    def test_metrics_endpoint_is_restricted(self):
+        self.client.logout()
+        response = self.client.get(reverse("metrics"), REMOTE_ADDR="10.0.0.1")
+        self.assertEqual(response.status_code, 403)
+        # a local reverse proxy makes every client look like 127.0.0.1
+        response = self.client.get(reverse("metrics"), REMOTE_ADDR="127.0.0.1")
+        self.assertEqual(response.status_code, 403)
+
+    def test_middleware_runs_in_the_handler_mode(self):
+        async def get_response(request):
+            pass
+
+        self.assertTrue(iscoroutinefunction(RequestMetricsMiddleware(get_response)))
+        self.assertFalse(iscoroutinefunction(RequestMetricsMiddleware(lambda request: None)))
+
+    @override_settings(ROOT_URLCONF="manage_task.urls_async")
+    async def test_counts_queries_of_async_views(self):
+        response = await self.async_client.get(reverse("task-list"))
+        # the async views run their queries in sync_to_async threads
+        self.assertRegex(response["Server-Timing"], r'desc="[1-9]\d* queries"')
+
+    @override_settings(METRICS_SLOW_QUERY_COUNT=0)
+    def test_logs_sql_of_slow_requests(self):
+        with self.assertLogs("task_system.metrics", "WARNING") as logs:
+            self.client.get(reverse("task-list"))
+        self.assertIn("SELECT", logs.output[0])
+
+    def test_histogram_buckets(self):
+        histogram = Histogram((1, 5))
+        for value in (0.5, 1, 3, 10):
+            histogram.observe(value)
+        self.assertEqual(histogram.counts, [2, 1, 1])
+        self.assertEqual(histogram.sum, 14.5)
@@ -111,3 +111,24 @@ class TaskModelTest(TestCase):
         self.assertEqual(task_high.priority_badge_class(), "priority-high")
         self.assertEqual(task_low.priority_badge_class(), "priority-low")
         self.assertEqual(task_urgent.priority_badge_class(), "priority-urgent")
+
+    def test_priority_orders_by_urgency(self):
+        for priority in [Task.Priority.LOW, Task.Priority.URGENT, Task.Priority.HIGH]:
+            Task.objects.create(
+                name=f"Task {priority.label}",
+                description="Desc",
+                deadline=timezone.now(),
+                task_type=self.task_type,
+                priority=priority,
+            )
+        labels = [
+            task.get_priority_display()
+            for task in Task.objects.order_by("-priority")
+        ]
+        self.assertEqual(labels, ["Urgent", "High", "Low"])
+
+    def test_list_ordering_is_served_by_index(self):
+        queryset = Task.objects.order_by("is_complete", "-priority", "deadline", "id")
+        plan = queryset.explain()
+        self.assertIn("task_list_order_idx", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
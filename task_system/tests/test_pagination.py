@@ -0,0 +1,162 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from task_system.models import Task, TaskType, Position
+from task_system.fragment_cache import get_fragment_cache
+from task_system.pagination import ApproximateCountPaginator, CursorPaginator
+
+
+User = get_user_model()
+
+
+class CursorPaginatorTest(TestCase):
+    def setUp(self):
+        task_type = TaskType.objects.create(name="Backend")
+        priorities = list(Task.Priority)
+        Task.objects.bulk_create(
+            Task(
+                name=f"Task {i}",
+                description="Desc",
+                deadline=timezone.now(),
+                task_type=task_type,
+                is_complete=i % 3 == 0,
+                priority=priorities[i % len(priorities)],
+            )
+            for i in range(23)
+        )
+        self.ordering = ["is_complete", "-priority", "id"]
+        self.expected = list(Task.objects.order_by(*self.ordering))
+
+    def test_walks_forward_and_backward(self):
+        paginator = CursorPaginator(Task.objects.all(), self.ordering, 5)
+        pages = [paginator.page()]
+        while pages[-1].has_next():
+            pages.append(paginator.page(pages[-1].next_cursor))
+
+        self.assertEqual(len(pages), 5)
+        self.assertFalse(pages[0].has_previous())
+        self.assertEqual([t for page in pages for t in page], self.expected)
+
+        page = pages[-1]
+        backwards = [list(page)]
+        while page.has_previous():
+            page = paginator.page(page.previous_cursor)
+            backwards.append(list(page))
+        self.assertEqual(backwards[::-1], [list(p) for p in pages])
+
+    def test_deep_page_runs_single_query(self):
+        paginator = CursorPaginator(Task.objects.all(), self.ordering, 5)
+        cursor = paginator.encode_cursor(self.expected[14], False)
+        with self.assertNumQueries(1):
+            page = paginator.page(cursor)
+        self.assertEqual(list(page), self.expected[15:20])
+
+    def test_datetimes_keep_microseconds(self):
+        Task.objects.all().delete()
+        now = timezone.now().replace(microsecond=0)
+        task_type = TaskType.objects.create(name="Ops")
+        Task.objects.bulk_create(
+            Task(
+                name=f"Task {i}", description="Desc", task_type=task_type,
+                deadline=now + timedelta(microseconds=i * 10),
+            )
+            for i in range(10)
+        )
+        ordering = ["deadline", "id"]
+        paginator = CursorPaginator(Task.objects.all(), ordering, 3)
+        pages = [paginator.page()]
+        while pages[-1].has_next() and len(pages) < 5:
+            pages.append(paginator.page(pages[-1].next_cursor))
+        self.assertEqual(
+            [t for page in pages for t in page],
+            list(Task.objects.order_by(*ordering)),
+        )
+
+
+class CursorPaginationViewTest(TestCase):
+    def setUp(self):
+        position = Position.objects.create(name="Developer")
+        self.user = User.objects.create_user(
+            username="john",
+            password="pass1234",
+            email="john@example.com",
+            position=position,
+        )
+        for i in range(12):
+            User.objects.create_user(
+                username=f"worker{i}",
+                password="pass1234",
+                email=f"worker{i}@example.com",
+                position=position,
+            )
+        self.client.login(username="john", password="pass1234")
+
+    def test_worker_list_cursor_mode(self):
+        response = self.client.get(reverse("worker-list"), {"cursor": ""})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["worker_list"]), 10)
+        self.assertTemplateUsed(response, "includes/cursor_pagination.html")
+
+        response = self.client.get(
+            f"{reverse('worker-list')}?{response.context['next_querystring']}"
+        )
+        self.assertEqual(len(response.context["worker_list"]), 3)
+        self.assertFalse(response.context["cursor_page"].has_next())
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(reverse("task-list"), {"cursor": "garbage"})
+        self.assertEqual(response.status_code, 404)
+
+
+class ApproximateCountPaginatorTest(TestCase):
+    def setUp(self):
+        get_fragment_cache().clear()
+        self.task_type = TaskType.objects.create(name="Backend")
+        Task.objects.bulk_create(
+            Task(
+                name=f"Task {i}", description="Desc", deadline=timezone.now(),
+                task_type=self.task_type, is_complete=i % 2 == 0,
+            )
+            for i in range(12)
+        )
+
+    @override_settings(APPROXIMATE_COUNT_THRESHOLD=10)
+    def test_large_unfiltered_table_is_estimated(self):
+        Task.objects.filter(name="Task 3").delete()
+        paginator = ApproximateCountPaginator(Task.objects.order_by("id"), 5)
+        with self.assertNumQueries(1):
+            self.assertEqual(paginator.count, 12)
+        self.assertTrue(paginator.is_approximate)
+
+    def test_small_or_filtered_counts_are_exact_and_cached(self):
+        completed = Task.objects.filter(is_complete=True).order_by("id")
+        for queryset in (Task.objects.order_by("id"), completed):
+            ApproximateCountPaginator(queryset, 5).count
+            paginator = ApproximateCountPaginator(queryset, 5)
+            with self.assertNumQueries(0):
+                paginator.count
+            self.assertFalse(paginator.is_approximate)
+
+        Task.objects.first().delete()
+        paginator = ApproximateCountPaginator(completed, 5)
+        self.assertEqual(paginator.count, 5)
+
+    @override_settings(APPROXIMATE_COUNT_THRESHOLD=10)
+    def test_list_shows_about_n_results(self):
+        position = Position.objects.create(name="Developer")
+        User.objects.create_user(
+            username="john", password="pass1234", email="john@example.com",
+            position=position,
+        )
+        self.client.login(username="john", password="pass1234")
+        response = self.client.get(reverse("task-list"))
+        self.assertContains(response, "About 12 results")
+        self.assertNotContains(response, "Last</a>")
+
+        response = self.client.get(reverse("task-list"), {"search": "Task"})
+        self.assertContains(response, "12 results")
+        self.assertNotContains(response, "About")
@@ -0,0 +1,102 @@
+import asyncio
+import tempfile
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from task_system.models import Position
+from task_system.profiling import ProfilingMiddleware, list_profiles
+
+User = get_user_model()
+
+
+class ProfilingTest(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.user = User.objects.create_user(
+            username="admin",
+            password="pass1234",
+            email="admin@example.com",
+            position=Position.objects.create(name="Manager"),
+            is_staff=True,
+        )
+        self.client.force_login(self.user)
+        self.async_client.force_login(self.user)
+
+    def test_disabled_by_default(self):
+        with override_settings(PROFILING_DIR=self.tmp.name):
+            self.client.get(reverse("task-list"), {"profile": ""})
+            self.assertEqual(list_profiles(), [])
+
+    def test_middleware_runs_in_the_handler_mode(self):
+        async def get_response(request):
+            pass
+
+        self.assertTrue(iscoroutinefunction(ProfilingMiddleware(get_response)))
+        self.assertFalse(iscoroutinefunction(ProfilingMiddleware(lambda request: None)))
+
+    @override_settings(ROOT_URLCONF="manage_task.urls_async")
+    async def test_async_profile_request(self):
+        with override_settings(PROFILING_ENABLED=True, PROFILING_DIR=self.tmp.name):
+            response = await self.async_client.get(reverse("task-list"), {"profile": ""})
+            self.assertEqual(response.status_code, 200)
+            [profile] = list_profiles()
+            self.assertEqual(profile["route"], "task-list")
+
+    async def test_concurrent_async_requests_share_one_profiler(self):
+        async def get_response(request):
+            await asyncio.sleep(0.01)
+            return HttpResponse("ok")
+
+        middleware = ProfilingMiddleware(get_response)
+        with override_settings(
+            PROFILING_ENABLED=True, PROFILING_SAMPLE_RATE=1, PROFILING_DIR=self.tmp.name,
+        ):
+            responses = await asyncio.gather(*(
+                middleware(RequestFactory().get("/")) for _ in range(3)
+            ))
+            self.assertEqual([r.status_code for r in responses], [200] * 3)
+            [profile] = await sync_to_async(list_profiles)()
+            self.assertTrue(profile["loop_wide"])
+
+    def test_staff_profile_request(self):
+        with override_settings(PROFILING_ENABLED=True, PROFILING_DIR=self.tmp.name):
+            self.client.get(reverse("task-list"), {"profile": ""})
+            [profile] = list_profiles()
+            self.assertEqual(profile["route"], "task-list")
+
+            response = self.client.get(reverse("profile-list"))
+            self.assertContains(response, "task-list")
+            response = self.client.get(reverse("profile-detail", args=[profile["name"]]))
+            self.assertContains(response, "function calls")
+            response = self.client.get(
+                reverse("profile-detail", args=[profile["name"]]), {"download": ""}
+            )
+            self.assertEqual(response.status_code, 200)
+
+    def test_non_staff_is_not_profiled(self):
+        self.user.is_staff = False
+        self.user.save()
+        with override_settings(PROFILING_ENABLED=True, PROFILING_DIR=self.tmp.name):
+            self.client.get(reverse("task-list"), {"profile": ""})
+            self.assertEqual(list_profiles(), [])
+            response = self.client.get(reverse("profile-list"))
+            self.assertEqual(response.status_code, 302)
+
+    def test_keeps_newest_profiles(self):
+        with override_settings(
+            PROFILING_ENABLED=True, PROFILING_SAMPLE_RATE=1,
+            PROFILING_KEEP=2, PROFILING_DIR=self.tmp.name,
+        ):
+            for _ in range(3):
+                self.client.get(reverse("team-list"))
+            self.assertEqual(len(list_profiles()), 2)
+
+    def test_unknown_profile_is_404(self):
+        with override_settings(PROFILING_DIR=self.tmp.name):
+            response = self.client.get(reverse("profile-detail", args=["..x"]))
+            self.assertEqual(response.status_code, 404)
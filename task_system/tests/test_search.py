@@ -0,0 +1,61 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from task_system.models import Task, TaskType
+from task_system.search import FTS_TABLE, build_match_query, search_tasks
+
+
+class TaskSearchTest(TestCase):
+    def setUp(self):
+        self.task_type = TaskType.objects.create(name="Backend")
+
+    def create_task(self, name, description="Nothing here"):
+        return Task.objects.create(
+            name=name,
+            description=description,
+            deadline=timezone.now(),
+            task_type=self.task_type,
+        )
+
+    def search(self, term):
+        return list(search_tasks(Task.objects.all(), term))
+
+    def test_build_match_query_escapes_input(self):
+        self.assertEqual(build_match_query('api "OR* ( x'), '"api"* "OR"* "x"*')
+        self.assertEqual(build_match_query("  !! "), "")
+
+    def test_searches_name_and_description(self):
+        by_name = self.create_task("Deploy billing service")
+        by_description = self.create_task("Cleanup", "billing tables are too big")
+        self.create_task("Unrelated")
+        self.assertCountEqual(self.search("billing"), [by_name, by_description])
+
+    def test_prefix_match(self):
+        task = self.create_task("Refactor authentication")
+        self.assertEqual(self.search("authen"), [task])
+
+    def test_results_are_ranked(self):
+        weak = self.create_task("Report", "mentions cache once among many other words here")
+        strong = self.create_task("Cache cache", "cache invalidation for cache")
+        self.assertEqual(self.search("cache"), [strong, weak])
+
+    def test_index_follows_updates_and_deletes(self):
+        task = self.create_task("Old title")
+        task.name = "New title"
+        task.save()
+        self.assertEqual(self.search("old"), [])
+        self.assertEqual(self.search("new"), [task])
+        task.delete()
+        self.assertEqual(self.search("new"), [])
+
+    def test_rebuild_command(self):
+        task = self.create_task("Rebuild me")
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('delete-all')")
+        self.assertEqual(self.search("rebuild"), [])
+        call_command("rebuild_search_index", stdout=StringIO())
+        self.assertEqual(self.search("rebuild"), [task])
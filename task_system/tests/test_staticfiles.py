@@ -0,0 +1,110 @@
+import gzip
+import tempfile
+from pathlib import Path
+
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.templatetags.static import static
+
+from task_system.context_processor import cfg_assets_root
+from task_system.staticfiles import StaticFilesMiddleware, minify_css
+
+CSS = """
+/* theme */
+.card > .title ,  a:hover {
+    color : red ;
+    background: url('../img/logo.png');
+    content: " { , } ";
+}
+"""
+
+
+class MinifyCssTest(SimpleTestCase):
+    def test_strips_whitespace_and_comments_outside_strings(self):
+        self.assertEqual(
+            minify_css(CSS),
+            ".card>.title,a:hover{color : red;background: url('../img/logo.png');"
+            "content: \" { , } \"}",
+        )
+
+
+class StaticPipelineTest(SimpleTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.source = Path(tmp.name) / "src"
+        self.root = Path(tmp.name) / "root"
+        (self.source / "css").mkdir(parents=True)
+        (self.source / "img").mkdir()
+        (self.source / "css" / "site.css").write_text(CSS * 50)
+        (self.source / "img" / "logo.png").write_bytes(b"\x89PNG" + bytes(range(256)))
+
+        settings = override_settings(
+            STATICFILES_DIRS=[self.source],
+            STATIC_ROOT=self.root,
+            STATICFILES_FINDERS=[
+                "django.contrib.staticfiles.finders.FileSystemFinder",
+            ],
+            STORAGES={
+                "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+                "staticfiles": {
+                    "BACKEND": "task_system.staticfiles.CompressedManifestStaticFilesStorage",
+                },
+            },
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+        call_command("collectstatic", interactive=False, verbosity=0)
+
+    def get(self, url, **headers):
+        middleware = StaticFilesMiddleware(lambda request: HttpResponse("app"))
+        return middleware(RequestFactory().get(url, headers=headers))
+
+    def test_collectstatic_hashes_minifies_and_compresses(self):
+        url = static("css/site.css")
+        hashed = self.root / url.removeprefix("/static/")
+        self.assertRegex(hashed.name, r"^site\.[0-9a-f]{12}\.css$")
+        content = hashed.read_text()
+        self.assertNotIn("/* theme */", content)
+        # references are rewritten to the hashed names
+        self.assertIn(static("img/logo.png").rsplit("/", 1)[1], content)
+        self.assertEqual(
+            gzip.decompress(Path(f"{hashed}.gz").read_bytes()).decode(), content
+        )
+
+    def test_serves_compressed_copy_with_immutable_caching(self):
+        url = static("css/site.css")
+        response = self.get(url, accept_encoding="gzip, deflate")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["Content-Type"], "text/css")
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertIn("immutable", response["Cache-Control"])
+
+        response = self.get(url)
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_unhashed_names_and_other_paths(self):
+        response = self.get("/static/css/site.css")
+        self.assertEqual(response["Cache-Control"], "public, max-age=60")
+        self.assertEqual(self.get("/task_system/").content, b"app")
+
+    def test_static_version_follows_the_manifest(self):
+        version = cfg_assets_root(None)["STATIC_VERSION"]
+        self.assertTrue(version)
+        (self.source / "css" / "site.css").write_text(CSS)
+        call_command("collectstatic", interactive=False, verbosity=0)
+        staticfiles_storage._setup()
+        self.assertNotEqual(cfg_assets_root(None)["STATIC_VERSION"], version)
+
+    async def test_async_chain(self):
+        async def get_response(request):
+            return HttpResponse("app")
+
+        middleware = StaticFilesMiddleware(get_response)
+        response = await middleware(RequestFactory().get(static("css/site.css")))
+        self.assertIn("immutable", response["Cache-Control"])
+        response.close()
+        response = await middleware(RequestFactory().get("/task_system/"))
+        self.assertEqual(response.content, b"app")
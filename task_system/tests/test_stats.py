@@ -0,0 +1,69 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from task_system.models import DashboardStats, Position, Task, TaskType, Worker
+from task_system.stats import compute_counts, get_dashboard_stats
+
+
+class DashboardStatsTest(TestCase):
+    def setUp(self):
+        self.position = Position.objects.create(name="Developer")
+        self.user = Worker.objects.create_user(
+            username="john",
+            password="pass1234",
+            email="john@example.com",
+            position=self.position,
+        )
+        self.task_type = TaskType.objects.create(name="Backend")
+
+    def create_task(self, **kwargs):
+        return Task.objects.create(
+            name="Task",
+            description="Desc",
+            deadline=timezone.now(),
+            task_type=self.task_type,
+            **kwargs,
+        )
+
+    def assert_in_sync(self):
+        stats = get_dashboard_stats()
+        for name, value in compute_counts().items():
+            self.assertEqual(getattr(stats, name), value, name)
+
+    def test_counters_follow_model_changes(self):
+        get_dashboard_stats()
+        task = self.create_task()
+        self.create_task(is_complete=True)
+        self.assert_in_sync()
+
+        task.is_complete = True
+        task.save()
+        self.assert_in_sync()
+
+        task.delete()
+        TaskType.objects.create(name="Frontend")
+        Position.objects.create(name="Manager")
+        self.assert_in_sync()
+
+        self.position.delete()
+        self.assert_in_sync()
+
+    def test_index_reads_stats_in_one_query(self):
+        self.client.login(username="john", password="pass1234")
+        get_dashboard_stats()
+        # session + user + stats
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse("index"))
+        self.assertEqual(response.context["num_workers"], 1)
+
+    def test_reconcile_command_fixes_drift(self):
+        get_dashboard_stats()
+        DashboardStats.objects.update(num_tasks=42)
+        out = StringIO()
+        call_command("reconcile_dashboard_stats", stdout=out)
+        self.assertIn("num_tasks: corrected by -42", out.getvalue())
+        self.assert_in_sync()
@@ -0,0 +1,88 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from task_system.models import Task, TaskType, Team
+from task_system.fragment_cache import get_fragment_cache
+from task_system.team_stats import cache_key, get_team_stats
+from task_system.tests.test_views import BaseViewTest, User
+
+
+class TeamStatsTest(BaseViewTest):
+    def setUp(self):
+        super().setUp()
+        self.backend = TaskType.objects.create(name="Backend")
+        self.frontend = TaskType.objects.create(name="Frontend")
+        self.other = User.objects.create_user(
+            username="jane", password="pass1234", email="jane@example.com",
+            position=self.position,
+        )
+        self.team = Team.objects.create(name="Team A", description="Desc")
+        self.team.workers.set([self.user, self.other])
+        now = timezone.now()
+        self.add_task(self.backend, now - timedelta(days=1), Task.Priority.URGENT, [self.user])
+        self.add_task(self.backend, now + timedelta(days=1), Task.Priority.LOW, [self.user, self.other])
+        self.add_task(self.frontend, now - timedelta(days=1), Task.Priority.LOW, [], is_complete=True)
+
+    def add_task(self, task_type, deadline, priority, assignees, team=None, **kwargs):
+        task = Task.objects.create(
+            name="Task", description="-", task_type=task_type, deadline=deadline,
+            priority=priority, team=team or self.team, **kwargs
+        )
+        task.assignees.set(assignees)
+        return task
+
+    def test_counts(self):
+        stats = get_team_stats()[self.team.id]
+        self.assertEqual((stats["open"], stats["completed"], stats["overdue"]), (2, 1, 1))
+        self.assertEqual(stats["by_priority"], [("Urgent", 1), ("Low", 2)])
+        self.assertEqual(stats["by_type"], [("Backend", 2), ("Frontend", 1)])
+        self.assertEqual(stats["members"], {
+            self.user.id: {"open": 2, "completed": 0},
+            self.other.id: {"open": 1, "completed": 0},
+        })
+
+    def test_cached_until_a_task_changes(self):
+        get_team_stats()
+        with CaptureQueriesContext(connection) as queries:
+            get_team_stats()
+        self.assertEqual(len(queries), 0)
+
+        Task.objects.filter(is_complete=False).first().delete()
+        self.assertEqual(get_team_stats()[self.team.id]["open"], 1)
+
+    def test_team_pages_do_not_query_per_team(self):
+        def list_queries():
+            # the second request has the user and the stats cached
+            self.client.get(reverse("team-list"))
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(reverse("team-list"))
+            self.assertContains(response, "2 open")
+            return len(queries)
+
+        few = list_queries()
+        for i in range(5):
+            team = Team.objects.create(name=f"Team {i}", description="-")
+            team.workers.set([self.user])
+            self.add_task(self.backend, timezone.now(), Task.Priority.HIGH, [self.user], team=team)
+        self.assertEqual(list_queries(), few)
+
+    def test_list_rows_show_lapsed_deadlines(self):
+        Task.objects.update(deadline=timezone.now() + timedelta(days=1))
+        get_fragment_cache().delete(cache_key())
+        self.assertNotContains(self.client.get(reverse("team-list")), "overdue")
+
+        # the clock passes the deadline; nothing is written
+        Task.objects.update(deadline=timezone.now() - timedelta(days=1))
+        get_fragment_cache().delete(cache_key())
+        self.assertContains(self.client.get(reverse("team-list")), "2 overdue")
+
+    def test_team_detail(self):
+        response = self.client.get(reverse("team-detail", args=[self.team.id]))
+        self.assertContains(response, "1 overdue")
+        self.assertContains(response, "Frontend")
+        members = {worker.id: worker.team_tasks for worker in response.context["team"].workers.all()}
+        self.assertEqual(members[self.other.id], {"open": 1, "completed": 0})
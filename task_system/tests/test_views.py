@@ -1,7 +1,10 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from django.contrib.auth import get_user_model
+from task_system.fragment_cache import get_fragment_cache
 from task_system.models import Task, TaskType, Position, Team
 
 
@@ -10,6 +13,8 @@ User = get_user_model()
 
 class BaseViewTest(TestCase):
     def setUp(self):
+        # cached counts and fragments outlive the rolled back test data
+        get_fragment_cache().clear()
         self.position = Position.objects.create(name="Developer")
         self.user = User.objects.create_user(
             username="john",
@@ -126,6 +131,70 @@ class TaskCRUDTest(BaseViewTest):
         self.assertTrue(self.task.is_complete)
 
 
+    def test_mark_task_done_missing_task(self):
+        response = self.client.get(reverse("task-done", args=[self.task.id + 100]))
+        self.assertEqual(response.status_code, 404)
+
+
+class TaskBulkActionTest(BaseViewTest):
+    def setUp(self):
+        super().setUp()
+        self.task_type = TaskType.objects.create(name="Backend")
+        self.team = Team.objects.create(name="Team B", description="Desc")
+        self.tasks = [
+            Task.objects.create(
+                name=f"Task {i}",
+                description="Bulk",
+                deadline=timezone.now(),
+                task_type=self.task_type,
+                is_complete=i == 0,
+            )
+            for i in range(4)
+        ]
+        self.ids = [task.id for task in self.tasks]
+
+    def post(self, **data):
+        return self.client.post(
+            reverse("task-bulk-action"),
+            {"task_ids": self.ids, **data},
+            HTTP_ACCEPT="application/json",
+        )
+
+    def test_complete_runs_single_update(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post(action="complete")
+        updates = [
+            q["sql"] for q in queries
+            if q["sql"].startswith('UPDATE "task_system_task"')
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(response.json(), {"action": "complete", "updated": 3})
+        self.assertEqual(Task.objects.filter(is_complete=True).count(), 4)
+
+    def test_reopen_and_reprioritise(self):
+        self.assertEqual(self.post(action="reopen").json()["updated"], 1)
+        response = self.post(action="reprioritise", priority=Task.Priority.URGENT)
+        self.assertEqual(response.json()["updated"], 4)
+        self.assertEqual(self.post(action="reprioritise", priority=Task.Priority.URGENT).json()["updated"], 0)
+
+    def test_reassign_to_team(self):
+        response = self.post(action="reassign", team=self.team.id)
+        self.assertEqual(response.json()["updated"], 3)
+        self.assertEqual(self.team.tasks.count(), 3)
+
+    def test_invalid_request(self):
+        response = self.post(action="reprioritise")
+        self.assertEqual(response.status_code, 400)
+
+    def test_list_page_action_redirects_with_message(self):
+        response = self.client.post(
+            reverse("task-bulk-action"),
+            {"task_ids": self.ids, "action": "complete"},
+            follow=True,
+        )
+        self.assertContains(response, "3 task(s) updated.")
+
+
 class TeamCRUDTest(BaseViewTest):
     def setUp(self):
         super().setUp()
@@ -155,6 +224,81 @@ class TeamCRUDTest(BaseViewTest):
         self.assertFalse(Team.objects.filter(id=self.team.id).exists())
 
 
+class WorkerPickerTest(BaseViewTest):
+    def setUp(self):
+        super().setUp()
+        User.objects.bulk_create(
+            User(
+                username=f"worker{i}",
+                email=f"worker{i}@example.com",
+                first_name="Anna" if i % 2 else "Bohdan",
+                last_name=f"Worker{i}",
+                position=self.position,
+            )
+            for i in range(60)
+        )
+
+    def test_lookup_prefix_and_pages(self):
+        response = self.client.get(reverse("worker-lookup"), {"q": "ann"})
+        data = response.json()
+        self.assertEqual(len(data["results"]), 20)
+        self.assertTrue(all(r["text"].startswith("Anna") for r in data["results"]))
+
+        data = self.client.get(data["next"]).json()
+        self.assertEqual(len(data["results"]), 10)
+        self.assertIsNone(data["next"])
+
+    def test_lookup_folds_non_ascii_case(self):
+        User.objects.create_user(
+            username="taras", email="taras@example.com", first_name="Тарас",
+            last_name="Шевченко", position=self.position,
+        )
+        data = self.client.get(reverse("worker-lookup"), {"q": "тар"}).json()
+        self.assertEqual([r["text"] for r in data["results"]],
+                         ["Тарас - Шевченко > Position: Developer"])
+
+    def test_lookup_query_count(self):
+        with self.assertNumQueries(3):
+            self.client.get(reverse("worker-lookup"), {"q": "worker1"})
+
+    def test_task_form_renders_only_selected_workers(self):
+        response = self.client.get(reverse("task-create"))
+        self.assertNotContains(response, "worker59@")
+        self.assertNotContains(response, "Worker59")
+        self.assertContains(response, reverse("worker-lookup"))
+
+    def test_update_form_renders_selected_workers(self):
+        task = Task.objects.create(
+            name="Picked",
+            description="Desc",
+            deadline=timezone.now(),
+            task_type=TaskType.objects.create(name="Backend"),
+        )
+        worker = User.objects.get(username="worker7")
+        task.assignees.add(worker)
+        response = self.client.get(reverse("task-update", args=[task.id]))
+        self.assertContains(response, f'value="{worker.id}" selected')
+        self.assertNotContains(response, "Worker8")
+
+    def test_team_form_validates_submitted_ids(self):
+        ids = list(User.objects.filter(username__in=["worker1", "worker2"]).values_list("id", flat=True))
+        response = self.client.post(
+            reverse("team-create"),
+            {"name": "Team Picker", "description": "Desc", "workers": ids},
+        )
+        self.assertEqual(response.status_code, 302)
+        team = Team.objects.get(name="Team Picker")
+        self.assertCountEqual(team.workers.values_list("id", flat=True), ids)
+
+    def test_invalid_ids_are_a_form_error(self):
+        response = self.client.post(
+            reverse("team-create"),
+            {"name": "Team Picker", "description": "Desc", "workers": ["abc"]},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["form"].errors["workers"])
+
+
 class RegisterViewTest(TestCase):
     def setUp(self):
         self.position = Position.objects.create(name="Manager")
@@ -0,0 +1,152 @@
+import time
+from collections import Counter
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from task_system.bulk_actions import complete_tasks, reopen_tasks, reprioritise_tasks
+from task_system.bulk_io import Importer
+from task_system.forms import TaskForm
+from task_system.models import Position, Task, TaskType, Team, Worker, WorkerLoad
+from task_system.workload import LeastLoadedBalancer, compute_workloads, reconcile_workloads
+
+LOW, HIGH, URGENT = Task.Priority.LOW, Task.Priority.HIGH, Task.Priority.URGENT
+
+
+class WorkloadTest(TestCase):
+    def setUp(self):
+        self.position = Position.objects.create(name="Developer")
+        self.task_type = TaskType.objects.create(name="Backend")
+        self.ann, self.bob, self.cat = (
+            Worker.objects.create_user(
+                username=name, password="pass1234", email=f"{name}@example.com",
+                position=self.position,
+            )
+            for name in ("ann", "bob", "cat")
+        )
+        self.team = Team.objects.create(name="Core", description="-")
+        self.team.workers.set([self.ann, self.bob, self.cat])
+
+    def task(self, priority=LOW, assignees=(), **kwargs):
+        task = Task.objects.create(
+            name="Task", description="-", deadline=timezone.now(),
+            task_type=self.task_type, priority=priority, **kwargs
+        )
+        task.assignees.add(*assignees)
+        return task
+
+    def loads(self):
+        return {
+            worker_id: (open_tasks, weighted_load)
+            for worker_id, open_tasks, weighted_load in WorkerLoad.objects.exclude(
+                open_tasks=0, weighted_load=0
+            ).values_list("worker_id", "open_tasks", "weighted_load")
+        }
+
+    def assertLoads(self, expected):
+        self.assertEqual(self.loads(), expected)
+        self.assertEqual(compute_workloads(), expected)
+
+    def test_assignee_changes(self):
+        task = self.task(HIGH, [self.ann, self.bob])
+        self.bob.assignees.add(self.task(URGENT))
+        self.assertLoads({self.ann.pk: (1, 2), self.bob.pk: (2, 5)})
+
+        task.assignees.remove(self.ann)
+        self.bob.assignees.clear()
+        self.assertLoads({})
+
+    def test_completion_and_priority_changes(self):
+        task = self.task(LOW, [self.ann])
+        task.priority = URGENT
+        task.save()
+        self.assertLoads({self.ann.pk: (1, 3)})
+
+        task.is_complete = True
+        task.save()
+        self.assertLoads({})
+
+        task.is_complete = False
+        task.priority = HIGH
+        task.save()
+        self.assertLoads({self.ann.pk: (1, 2)})
+
+        task.delete()
+        self.assertLoads({})
+
+    def test_bulk_actions(self):
+        first = self.task(LOW, [self.ann, self.bob])
+        second = self.task(HIGH, [self.ann])
+        ids = [first.pk, second.pk]
+
+        reprioritise_tasks(ids, URGENT)
+        self.assertLoads({self.ann.pk: (2, 6), self.bob.pk: (1, 3)})
+        complete_tasks([first.pk])
+        self.assertLoads({self.ann.pk: (1, 3)})
+        reopen_tasks(ids)
+        self.assertLoads({self.ann.pk: (2, 6), self.bob.pk: (1, 3)})
+
+    def test_form_sync(self):
+        task = self.task(HIGH, [self.ann])
+        form = TaskForm(instance=task, data={
+            "name": "Task", "description": "-", "deadline": "2030-01-01T10:00",
+            "priority": HIGH, "task_type": self.task_type.pk,
+            "assignees": [self.bob.pk, self.cat.pk],
+        })
+        self.assertTrue(form.is_valid(), form.errors)
+        form.save()
+        self.assertLoads({self.bob.pk: (1, 2), self.cat.pk: (1, 2)})
+
+    def test_reconcile_corrects_drift(self):
+        self.task(HIGH, [self.ann])
+        WorkerLoad.objects.filter(worker=self.ann).update(open_tasks=5)
+        WorkerLoad.objects.create(worker=self.cat, open_tasks=1, weighted_load=1)
+
+        out = StringIO()
+        call_command("reconcile_workloads", stdout=out)
+        self.assertIn("Workloads of 2 workers reconciled", out.getvalue())
+        self.assertLoads({self.ann.pk: (1, 2)})
+        self.assertEqual(reconcile_workloads(), {})
+
+    def test_auto_assign_picks_the_least_loaded_member(self):
+        self.task(URGENT, [self.ann])
+        self.task(LOW, [self.bob])
+        form = TaskForm(data={
+            "name": "New", "description": "-", "deadline": "2030-01-01T10:00",
+            "priority": HIGH, "task_type": self.task_type.pk,
+            "team": self.team.pk, "auto_assign": "on",
+        })
+        self.assertTrue(form.is_valid(), form.errors)
+        task = form.save()
+        self.assertEqual(list(task.assignees.all()), [self.cat])
+
+    def test_auto_assign_needs_a_team(self):
+        form = TaskForm(data={
+            "name": "New", "description": "-", "deadline": "2030-01-01T10:00",
+            "priority": HIGH, "task_type": self.task_type.pk, "auto_assign": "on",
+        })
+        self.assertIn("team", form.errors)
+
+    def test_import_auto_assign_spreads_tasks(self):
+        self.task(URGENT, [self.ann])
+        records = [
+            {"name": f"T{i}", "deadline": "2030-01-01T00:00:00Z",
+             "task_type": "Backend", "team": "Core", "priority": "low"}
+            for i in range(6)
+        ]
+        Importer(batch_size=4, auto_assign=True).run("task", records)
+        # ann already carries an urgent task, as much as three low ones
+        self.assertLoads({self.ann.pk: (1, 3), self.bob.pk: (3, 3), self.cat.pk: (3, 3)})
+
+    def test_balancer_assigns_a_large_batch_quickly(self):
+        workers = Worker.objects.bulk_create(
+            Worker(username=f"w{i}", email=f"w{i}@example.com", position=self.position)
+            for i in range(2000)
+        )
+        start = time.perf_counter()
+        balancer = LeastLoadedBalancer(worker.pk for worker in workers)
+        assigned = [balancer.assign(LOW) for _ in range(10000)]
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertEqual(set(Counter(assigned).values()), {5})
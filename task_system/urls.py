@@ -1,5 +1,6 @@
 from django.urls import path
 
+from task_system.api import TaskExportView, TeamExportView, WorkerExportView
 from task_system.models import Worker
 from task_system.views import (
     index,
@@ -9,6 +10,7 @@ from task_system.views import (
     TaskUpdateView,
     TaskDeleteView,
     mark_task_done,
+    task_bulk_action,
     TeamListView,
     TeamCreateView,
     TeamDetailView,
@@ -16,7 +18,10 @@ from task_system.views import (
     TeamDeleteView,
     WorkerList,
     WorkerUpdateView,
+    worker_lookup,
     RegisterView,
+    profile_list,
+    profile_detail,
 )
 
 
@@ -29,6 +34,7 @@ urlpatterns = [
     path("task_update/<int:pk>/update/", TaskUpdateView.as_view(), name="task-update"),
     path("task_delete/<int:pk>/delete/", TaskDeleteView.as_view(), name="task-delete"),
     path('task/<int:pk>/done/', mark_task_done, name='task-done'),
+    path("tasks/bulk/", task_bulk_action, name="task-bulk-action"),
     # ---- TEAMS ----
     path('teams/', TeamListView.as_view(), name="team-list"),
     path('team/create/', TeamCreateView.as_view(), name="team-create"),
@@ -38,6 +44,14 @@ urlpatterns = [
     # ----WORKERS----
     path("workers/", WorkerList.as_view(), name="worker-list"),
     path("workers/update/", WorkerUpdateView.as_view(), name="worker-update"),
+    path("workers/lookup/", worker_lookup, name="worker-lookup"),
+    # ----API----
+    path("api/tasks.<str:fmt>", TaskExportView.as_view(), name="api-tasks"),
+    path("api/teams.<str:fmt>", TeamExportView.as_view(), name="api-teams"),
+    path("api/workers.<str:fmt>", WorkerExportView.as_view(), name="api-workers"),
+    # ----PROFILING----
+    path("profiles/", profile_list, name="profile-list"),
+    path("profiles/<str:name>/", profile_detail, name="profile-detail"),
     # ----REGISTER----
     path("register/", RegisterView.as_view(), name="register"),
 ]
\ No newline at end of file
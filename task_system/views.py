@@ -1,50 +1,107 @@
+from django.conf import settings
+from django.contrib import messages
 from django.contrib.auth import login
 from django.contrib.auth.decorators import login_required
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpRequest, HttpResponse
-from django.shortcuts import render, get_object_or_404, redirect
+from django.db.models import Exists, OuterRef, Prefetch
+from django.http import FileResponse, Http404, HttpRequest, HttpResponse, JsonResponse
+from django.shortcuts import render, redirect
 from django.urls import reverse_lazy, reverse
+from django.utils.http import url_has_allowed_host_and_scheme
 from django.views import generic
+from django.views.decorators.http import require_POST
 from django.views.generic import CreateView
 
-from task_system.forms import TaskForm, TeamForm, WorkerUpdateForm, WorkerRegisterForm
-from task_system.models import Worker, Task, TaskType, Position, Team
+from task_system.bulk_actions import apply_bulk_action, complete_tasks
+from task_system.conditional import ConditionalGetMixin
+from task_system.db import read_from_replica
+from task_system.forms import (
+    TaskForm,
+    TaskBulkActionForm,
+    TeamForm,
+    WorkerUpdateForm,
+    WorkerRegisterForm,
+)
+from task_system.models import Worker, Task, Team
+from task_system.pagination import ApproximateCountPaginator, CursorPaginationMixin
+from task_system.profiling import format_stats, list_profiles, profile_path
+from task_system.search import prefix_search, search_tasks
+from task_system.stats import get_dashboard_stats
+from task_system.team_stats import empty_stats, get_team_stats, timeout as team_stats_timeout
 
 @login_required
 def index(request: HttpRequest) -> HttpResponse:
-    num_workers = Worker.objects.all().count()
-    num_tasks = Task.objects.all().count()
-    num_completed_tasks = Task.objects.filter(is_complete=True).count()
-    num_type_tasks = TaskType.objects.all().count()
-    num_position = Position.objects.all().count()
+    stats = get_dashboard_stats()
     context = {
-        "num_workers": num_workers,
-        "num_tasks": num_tasks,
-        "num_completed_tasks": num_completed_tasks,
-        "num_type_tasks": num_type_tasks,
-        "num_position": num_position,
+        "num_workers": stats.num_workers,
+        "num_tasks": stats.num_tasks,
+        "num_completed_tasks": stats.num_completed_tasks,
+        "num_type_tasks": stats.num_type_tasks,
+        "num_position": stats.num_position,
     }
     return render(request, "task_system/index.html", context=context)
 
 
-class TaskListView(LoginRequiredMixin, generic.ListView):
+class TaskListView(
+    LoginRequiredMixin, ConditionalGetMixin, CursorPaginationMixin, generic.ListView
+):
     model = Task
+    read_from_replica = True
     template_name = "task_system/task_list.html"
-    ordering = ["is_complete", "-priority"]
+    ordering = ["is_complete", "-priority", "deadline", "id"]
     paginate_by = 8
+    paginator_class = ApproximateCountPaginator
+    validator_models = ("tasktype", "team", "worker")
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["bulk_form"] = TaskBulkActionForm()
+        return context
+
+    def use_cursor_pagination(self):
+        # search results are ordered by rank, not by the cursor key
+        if self.request.GET.get("search"):
+            return False
+        return super().use_cursor_pagination()
 
     def get_queryset(self):
-        queryset = super().get_queryset()
+        # fixed number of queries per page: FKs are joined, m2m rows are
+        # prefetched once for the whole page and the "has workers" checks
+        # are annotated instead of running .exists() per row
+        queryset = super().get_queryset().select_related(
+            "task_type", "team"
+        ).prefetch_related(
+            "team__workers", "assignees"
+        ).annotate(
+            has_team_workers=Exists(
+                Team.workers.through.objects.filter(team_id=OuterRef("team_id"))
+            ),
+            has_assignees=Exists(
+                Task.assignees.through.objects.filter(task_id=OuterRef("pk"))
+            ),
+        )
+        return self.search(queryset)
+
+    def search(self, queryset):
         search = self.request.GET.get("search", "")
-
         if search:
-            queryset = queryset.filter(name__icontains=search)
-
+            queryset = search_tasks(queryset, search)
         return queryset
 
+    def get_validator_queryset(self):
+        return self.search(super().get_validator_queryset())
+
 
-class TaskDetailView(LoginRequiredMixin, generic.DetailView):
+class TaskDetailView(LoginRequiredMixin, ConditionalGetMixin, generic.DetailView):
     model = Task
+    read_from_replica = True
+    validator_models = ("tasktype", "team", "worker")
+
+    def get_queryset(self):
+        return super().get_queryset().select_related(
+            "task_type", "team"
+        ).prefetch_related("assignees")
 
 
 class TaskCreateView(LoginRequiredMixin, generic.CreateView):
@@ -72,15 +129,60 @@ class TaskDeleteView(LoginRequiredMixin, generic.DeleteView):
 
 @login_required
 def mark_task_done(request, pk):
-    task = get_object_or_404(Task, pk=pk)
-    task.is_complete = True
-    task.save()
-    return redirect(reverse('task-detail', args=[task.id]))
+    # conditional UPDATE of one column instead of loading and saving the row
+    if not complete_tasks([pk]) and not Task.objects.filter(pk=pk).exists():
+        raise Http404("No task found")
+    return redirect(reverse('task-detail', args=[pk]))
 
 
-class TeamListView(LoginRequiredMixin, generic.ListView):
+@login_required
+@require_POST
+def task_bulk_action(request):
+    form = TaskBulkActionForm(request.POST)
+    if not form.is_valid():
+        if request.accepts("text/html"):
+            messages.error(request, "Select tasks and a valid action.")
+            return redirect("task-list")
+        return JsonResponse({"errors": form.errors}, status=400)
+
+    data = form.cleaned_data
+    updated = apply_bulk_action(
+        data["action"], data["task_ids"],
+        priority=data["priority"], team=data["team"],
+    )
+    if request.accepts("text/html"):
+        messages.success(request, f"{updated} task(s) updated.")
+        next_url = request.POST.get("next")
+        if next_url and url_has_allowed_host_and_scheme(
+            next_url, allowed_hosts={request.get_host()}
+        ):
+            return redirect(next_url)
+        return redirect("task-list")
+    return JsonResponse({"action": data["action"], "updated": updated})
+
+
+class TeamListView(LoginRequiredMixin, ConditionalGetMixin, generic.ListView):
     model = Team
+    read_from_replica = True
     template_name = "task_system/team_list.html"
+    validator_models = ("worker", "task", "tasktype")
+
+    def get_queryset(self):
+        return super().get_queryset().prefetch_related("workers")
+
+    def get_team_stats(self):
+        return get_team_stats()
+
+    def get_validator_timeout(self):
+        # overdue counts change with the clock
+        return team_stats_timeout()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        team_stats = self.get_team_stats()
+        for team in context["object_list"]:
+            team.stats = team_stats.get(team.id, empty_stats())
+        return context
 
 
 class TeamCreateView(LoginRequiredMixin, generic.CreateView):
@@ -89,10 +191,33 @@ class TeamCreateView(LoginRequiredMixin, generic.CreateView):
     template_name = 'task_system/team_form.html'
 
 
-class TeamDetailView(LoginRequiredMixin, generic.DetailView):
+class TeamDetailView(LoginRequiredMixin, ConditionalGetMixin, generic.DetailView):
     model = Team
+    read_from_replica = True
     success_url = reverse_lazy('team-list')
     template_name = "task_system/team_detail.html"
+    validator_models = ("worker", "position", "task", "tasktype")
+
+    def get_queryset(self):
+        return super().get_queryset().prefetch_related(
+            Prefetch("workers", queryset=Worker.objects.select_related("position"))
+        )
+
+    def get_team_stats(self):
+        return get_team_stats()
+
+    def get_validator_timeout(self):
+        # overdue counts change with the clock
+        return team_stats_timeout()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        stats = self.get_team_stats().get(self.object.id, empty_stats())
+        no_tasks = {"open": 0, "completed": 0}
+        for worker in self.object.workers.all():
+            worker.team_tasks = stats["members"].get(worker.id, no_tasks)
+        context["stats"] = stats
+        return context
 
 
 class TeamUpdateView(LoginRequiredMixin, generic.UpdateView):
@@ -109,11 +234,51 @@ class TeamDeleteView(LoginRequiredMixin, generic.DeleteView):
     success_url = reverse_lazy("team-list")
 
 
-class WorkerList(LoginRequiredMixin, generic.ListView):
+class WorkerList(
+    LoginRequiredMixin, ConditionalGetMixin, CursorPaginationMixin, generic.ListView
+):
     model = Worker
+    read_from_replica = True
     template_name = "task_system/worker_list.html"
     context_object_name = "worker_list"
+    ordering = ["id"]
     paginate_by = 10
+    paginator_class = ApproximateCountPaginator
+    validator_models = ("position", "team", "task")
+
+    def get_queryset(self):
+        return super().get_queryset().select_related(
+            "position", "load"
+        ).prefetch_related("teams")
+
+
+@login_required
+@read_from_replica
+def worker_lookup(request):
+    """Paginated prefix search over workers for WorkerPickerWidget."""
+    page_size = 20
+    # a range scan on the functional lower() indexes of Worker
+    queryset = prefix_search(
+        Worker.objects.select_related("position").order_by("id"),
+        ["username", "first_name", "last_name"],
+        request.GET.get("q", ""),
+        lower=True,
+    )
+    after = request.GET.get("after", "")
+    if after.isdigit():
+        queryset = queryset.filter(id__gt=int(after))
+
+    workers = list(queryset[:page_size + 1])
+    next_url = None
+    if len(workers) > page_size:
+        workers = workers[:page_size]
+        params = request.GET.copy()
+        params["after"] = workers[-1].id
+        next_url = f"{request.path}?{params.urlencode()}"
+    return JsonResponse({
+        "results": [{"id": worker.id, "text": str(worker)} for worker in workers],
+        "next": next_url,
+    })
 
 
 class WorkerUpdateView(LoginRequiredMixin, generic.UpdateView):
@@ -138,4 +303,29 @@ class RegisterView(CreateView):
         user = form.save()
         # Якщо хочеш автологін після реєстрації → розкоментовуй ↓
         login(self.request, user)
-        return super().form_valid(form)
\ No newline at end of file
+        return super().form_valid(form)
+
+
+@staff_member_required
+def profile_list(request):
+    return render(request, "task_system/profile_list.html", {
+        "profiles": list_profiles(),
+        "profiling_enabled": getattr(settings, "PROFILING_ENABLED", False),
+    })
+
+
+@staff_member_required
+def profile_detail(request, name):
+    path = profile_path(name)
+    if path is None:
+        raise Http404("No such profile")
+    if "download" in request.GET:
+        return FileResponse(open(path, "rb"), as_attachment=True, filename=path.name)
+    sort = request.GET.get("sort", "cumulative")
+    if sort not in ("cumulative", "tottime", "ncalls"):
+        sort = "cumulative"
+    return render(request, "task_system/profile_detail.html", {
+        "name": name,
+        "sort": sort,
+        "stats": format_stats(path, sort=sort),
+    })
@@ -0,0 +1,49 @@
+from django import forms
+from django.core.exceptions import ValidationError
+
+
+class WorkerPickerWidget(forms.SelectMultiple):
+    """
+    Multi-select that only renders the currently selected workers and
+    fetches others from the worker lookup endpoint as the user types,
+    so the page size doesn't depend on the number of workers.
+    """
+    template_name = "task_system/widgets/worker_picker.html"
+
+    class Media:
+        js = ["assets/js/worker-picker.js"]
+
+    def __init__(self, lookup_url="worker-lookup", attrs=None):
+        self.lookup_url = lookup_url
+        super().__init__(attrs)
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        context["widget"]["lookup_url"] = self.lookup_url
+        return context
+
+    def valid_pks(self, value):
+        # redisplayed form data may hold anything; the field reports it
+        pk_field = self.choices.queryset.model._meta.pk
+        pks = []
+        for v in value:
+            try:
+                pks.append(pk_field.to_python(v))
+            except ValidationError:
+                continue
+        return [pk for pk in pks if pk is not None]
+
+    def optgroups(self, name, value, attrs=None):
+        selected = self.valid_pks(v for v in value if v)
+        if not selected:
+            return []
+        queryset = self.choices.queryset.filter(pk__in=selected)
+        label_from_instance = self.choices.field.label_from_instance
+        options = [
+            self.create_option(
+                name, obj.pk, label_from_instance(obj), True, index,
+                attrs=attrs,
+            )
+            for index, obj in enumerate(queryset)
+        ]
+        return [(None, options, 0)]
@@ -0,0 +1,138 @@
+"""
+Per-worker counters of open tasks, for "who is free?" without counting.
+
+WorkerLoad holds the number of open tasks assigned to each worker and
+the same tasks weighted by priority (low 1, high 2, urgent 3). Signals
+keep it current on assignee changes and completion/priority changes
+made through the ORM. The bulk paths (bulk actions, imports, generated
+data, the deadline scheduler) adjust it themselves.
+``manage.py reconcile_workloads`` recounts it and corrects any drift.
+
+LeastLoadedBalancer picks assignees from a team by the lowest weighted
+load with a heap. The loads are read once, so assigning a large batch
+costs one query plus a heap operation per task.
+"""
+import heapq
+from collections import defaultdict
+
+from django.db.models import Count, F, Sum
+
+from task_system.models import Task, Team, WorkerLoad
+
+Assignment = Task.assignees.through
+
+
+def assignment_deltas(pairs, sign=1):
+    """(worker id, priority) pairs of open tasks -> {worker id: (count, weight)}."""
+    deltas = defaultdict(lambda: (0, 0))
+    for worker_id, priority in pairs:
+        count, weight = deltas[worker_id]
+        deltas[worker_id] = (count + sign, weight + sign * priority)
+    return deltas
+
+
+def assignments(task_ids, is_complete=False):
+    """(worker id, priority) of every assignment of the given tasks."""
+    return Assignment.objects.filter(
+        task_id__in=task_ids, task__is_complete=is_complete
+    ).values_list("worker_id", "task__priority")
+
+
+def adjust_workloads(deltas):
+    deltas = {
+        worker_id: delta for worker_id, delta in deltas.items() if delta != (0, 0)
+    }
+    if not deltas:
+        return
+    # rows of workers that never had a task are created on first use
+    WorkerLoad.objects.bulk_create(
+        [WorkerLoad(worker_id=worker_id) for worker_id in deltas],
+        ignore_conflicts=True,
+    )
+    # workers with the same change share one UPDATE
+    workers_by_delta = defaultdict(list)
+    for worker_id, delta in deltas.items():
+        workers_by_delta[delta].append(worker_id)
+    for (count, weight), worker_ids in workers_by_delta.items():
+        WorkerLoad.objects.filter(worker_id__in=worker_ids).update(
+            open_tasks=F("open_tasks") + count,
+            weighted_load=F("weighted_load") + weight,
+        )
+
+
+def compute_workloads():
+    rows = Assignment.objects.filter(task__is_complete=False).values(
+        "worker_id"
+    ).annotate(
+        open_tasks=Count("id"), weighted_load=Sum("task__priority")
+    ).order_by()
+    return {
+        row["worker_id"]: (row["open_tasks"], row["weighted_load"]) for row in rows
+    }
+
+
+def reconcile_workloads():
+    """Recount every worker and return {worker id: (count drift, weight drift)}."""
+    counts = compute_workloads()
+    current = {
+        worker_id: (open_tasks, weighted_load)
+        for worker_id, open_tasks, weighted_load in WorkerLoad.objects.values_list(
+            "worker_id", "open_tasks", "weighted_load"
+        )
+    }
+    drift = {}
+    for worker_id in counts.keys() | current.keys():
+        expected = counts.get(worker_id, (0, 0))
+        stored = current.get(worker_id, (0, 0))
+        if expected != stored:
+            drift[worker_id] = (expected[0] - stored[0], expected[1] - stored[1])
+    if drift:
+        WorkerLoad.objects.bulk_create(
+            [
+                WorkerLoad(
+                    worker_id=worker_id,
+                    open_tasks=counts.get(worker_id, (0, 0))[0],
+                    weighted_load=counts.get(worker_id, (0, 0))[1],
+                )
+                for worker_id in drift
+            ],
+            update_conflicts=True,
+            unique_fields=["worker"],
+            update_fields=["open_tasks", "weighted_load"],
+        )
+    return drift
+
+
+class LeastLoadedBalancer:
+    def __init__(self, worker_ids):
+        loads = dict.fromkeys(worker_ids, (0, 0))
+        loads.update(
+            (worker_id, (open_tasks, weighted_load))
+            for worker_id, open_tasks, weighted_load in WorkerLoad.objects.filter(
+                worker_id__in=loads
+            ).values_list("worker_id", "open_tasks", "weighted_load")
+        )
+        # ties go to the worker with fewer tasks, then the older account
+        self.heap = [
+            (weighted_load, open_tasks, worker_id)
+            for worker_id, (open_tasks, weighted_load) in loads.items()
+        ]
+        heapq.heapify(self.heap)
+
+    @classmethod
+    def for_team(cls, team_id):
+        return cls(
+            Team.workers.through.objects.filter(
+                team_id=team_id, worker__is_active=True
+            ).values_list("worker_id", flat=True)
+        )
+
+    def assign(self, priority):
+        """Id of the least-loaded worker, now counted with the new task."""
+        if not self.heap:
+            return None
+        weighted_load, open_tasks, worker_id = self.heap[0]
+        heapq.heapreplace(
+            self.heap, (weighted_load + priority, open_tasks + 1, worker_id)
+        )
+        return worker_id